@@ -106,10 +106,18 @@ export interface CurrentSync {
     section_items_processed?: number;
 }
 
+export interface CircuitStatus {
+    state: "closed" | "open" | "half_open";
+    consecutive_failures: number;
+    opened_at?: string | null;
+    retry_at?: string | null;
+}
+
 export interface ProfileRuntimeStatus {
     running: boolean;
     last_synced?: string | null;
     current_sync?: CurrentSync | null;
+    anilist_circuit?: CircuitStatus | null;
 }
 
 export interface ProfileStatus {
@@ -11,6 +11,7 @@ Usage:
 """
 
 import argparse
+import gzip
 import json
 from datetime import datetime
 from pathlib import Path
@@ -47,6 +48,39 @@ class MediaList(BaseModel):
     updatedAt: datetime | None = None
 
 
+def load_backup(backup_file: Path) -> dict[str, Any]:
+    """Loads a backup file, reassembling deduplicated backups.
+
+    Deduplicated backups (`.jsonl.gz`) reference entries stored in packs under the
+    `objects` folder next to the backup file.
+
+    Args:
+        backup_file (Path): Path to the backup file.
+
+    Returns:
+        dict[str, Any]: Backup data with the lists and their entries.
+    """
+    if not backup_file.name.endswith(".jsonl.gz"):
+        return json.loads(backup_file.read_text())
+
+    profile = backup_file.name.removeprefix("plexanibridge-").rsplit(".", 3)[0]
+    with gzip.open(backup_file, "rt", encoding="utf-8") as fh:
+        header = json.loads(fh.readline())
+        lists = [json.loads(line) for line in fh if line.strip()]
+
+    objects: dict[str, dict] = {}
+    for pack in {pack for li in lists for pack, _ in li["entries"]}:
+        pack_file = backup_file.parent / "objects" / f"{profile}.{pack}.jsonl.gz"
+        with gzip.open(pack_file, "rt", encoding="utf-8") as fh:
+            for line in fh:
+                obj = json.loads(line)
+                objects[obj["h"]] = obj["e"]
+
+    for li in lists:
+        li["entries"] = [objects[h] for _, h in li["entries"]]
+    return {"user": header.get("user"), "lists": lists}
+
+
 class AniListRestoreClient:
     """Client for restoring AniList data from a backup JSON file."""
 
@@ -81,7 +115,7 @@ class AniListRestoreClient:
         """Restores AniList data from a backup JSON file.
 
         Args:
-            backup_file (Path): Path to the backup JSON file containing lists and
+            backup_file (Path): Path to the backup file containing lists and
                                 entries.
 
         Raises:
@@ -89,7 +123,7 @@ class AniListRestoreClient:
             json.JSONDecodeError: If the backup file is not a valid JSON.
         """
         print(f"Loading backup from {backup_file}")
-        data = json.loads(backup_file.read_text())
+        data = load_backup(backup_file)
 
         entries = [
             MediaList(**entry)
@@ -190,7 +224,7 @@ class AniListRestoreClient:
 def main():
     """Main function to restore AniList data from a backup file."""
     parser = argparse.ArgumentParser(description="Restore AniList data from backup")
-    parser.add_argument("backup_file", type=Path, help="Path to the backup JSON file")
+    parser.add_argument("backup_file", type=Path, help="Path to the backup file")
     parser.add_argument("--token", required=True, help="AniList API token")
     parser.add_argument(
         "--dry-run", action="store_true", help="Don't actually make any changes"
@@ -212,6 +212,11 @@ class PlexAnibridgeProfileConfig(BaseModel):
         default=PlexMetadataSource.LOCAL,
         description="Source of metadata for Plex media items",
     )
+    plex_watchlist_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds a fetched Plex watchlist is reused before refreshing",
+    )
     sync_interval: int = Field(
         default=86400, ge=0, description="Sync interval in seconds"
     )
@@ -241,6 +246,16 @@ class PlexAnibridgeProfileConfig(BaseModel):
     batch_requests: bool = Field(
         default=False, description="Batch AniList API requests for better performance"
     )
+    anilist_persisted_queries: bool = Field(
+        default=False,
+        description="Send AniList queries as automatic persisted queries by hash",
+    )
+    sync_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        description="Number of Plex items processed concurrently during a sync",
+    )
     search_fallback_threshold: int = Field(
         default=-1, ge=-1, le=100, description="Fuzzy search threshold"
     )
@@ -395,6 +410,11 @@ class PlexAnibridgeConfig(BaseSettings):
     plex_metadata_source: PlexMetadataSource | None = Field(
         default=None, description="Global default metadata source"
     )
+    plex_watchlist_ttl: int | None = Field(
+        default=None,
+        ge=0,
+        description="Global default watchlist cache duration in seconds",
+    )
     sync_interval: int | None = Field(
         default=None, ge=0, description="Global default sync interval in seconds"
     )
@@ -421,6 +441,15 @@ class PlexAnibridgeConfig(BaseSettings):
     batch_requests: bool | None = Field(
         default=None, description="Global default batch requests setting"
     )
+    anilist_persisted_queries: bool | None = Field(
+        default=None, description="Global default AniList persisted queries setting"
+    )
+    sync_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        le=32,
+        description="Global default number of items processed concurrently",
+    )
     search_fallback_threshold: int | None = Field(
         default=None,
         ge=-1,
@@ -5,39 +5,69 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import re
 from collections.abc import AsyncIterator, Iterable
 from datetime import UTC, datetime, timedelta, timezone
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import aiohttp
 from async_lru import alru_cache
-from limiter import Limiter
+from pydantic_core import from_json, to_json
 
-from src import __version__, log
+from src import log
+from src.config.database import db
+from src.core.anilist_backup import AniListBackupStore
+from src.core.anilist_cache import shared_media_store
 from src.exceptions import (
     AniListFilterError,
+    AniListMediaNotFoundError,
+    AniListQueryComplexityError,
     AniListSearchError,
     AniListTokenRequiredError,
+    AniListUnavailableError,
 )
+from src.models.db.housekeeping import Housekeeping
 from src.models.schemas.anilist import (
+    GraphQLResponse,
     Media,
     MediaFormat,
     MediaList,
-    MediaListCollection,
     MediaListCollectionWithMedia,
     MediaListGroup,
+    MediaListPage,
+    MediaListSaveResult,
     MediaListWithMedia,
+    MediaPage,
+    MediaProjection,
     MediaStatus,
+    MediaWithoutList,
     User,
 )
 from src.utils.cache import gattl_cache, generic_hash, glru_cache
+from src.utils.circuit import CircuitBreaker
+from src.utils.graphql import (
+    GraphQLDocument,
+    estimate_complexity,
+    pack_by_complexity,
+)
+from src.utils.ratelimit import AdaptiveRateLimiter, RequestPriority
+from src.utils.requests import create_client_session
 
 __all__ = ["AniListClient"]
 
-# The rate limit for the AniList API *should* be 90 requests per minute, but in practice
-# it seems to be around 30 requests per minute
-anilist_limiter = Limiter(rate=30 / 60, capacity=3, jitter=False)
+# The rate limit for the AniList API is 90 requests per minute, but it is often lowered
+# to 30 requests per minute. Start conservatively and adapt to the advertised limit.
+anilist_limiter = AdaptiveRateLimiter(rate=30 / 60, capacity=3, name="AniList")
+# Global circuit breaker that pauses AniList requests while the API is down
+anilist_breaker = CircuitBreaker(name="AniList")
+
+# Hashes of prebuilt documents the server has registered as persisted queries
+_persisted_query_hashes: set[str] = set()
+
+# AniList reports complexity errors as "Max query complexity should be X but got Y."
+_COMPLEXITY_ERROR_RE = re.compile(r"complexity\D*(\d+)?", re.IGNORECASE)
 
 
 class AniListClient:
@@ -50,6 +80,10 @@ class AniListClient:
 
     API_URL = "https://graphql.anilist.co"
     BACKUP_RETENTION_DAYS = 30
+    FULL_REFRESH_INTERVAL = timedelta(days=7)
+    ANIME_BATCH_SIZE = 50  # AniList caps `perPage` at 50
+    LOADER_WINDOW = 0.01
+    MAX_QUERY_COMPLEXITY = 500
 
     def __init__(
         self,
@@ -58,6 +92,8 @@ class AniListClient:
         dry_run: bool,
         profile_name: str | None,
         backup_retention_days: int | None = None,
+        request_priority: RequestPriority = RequestPriority.SYNC_READ,
+        persisted_queries: bool = False,
     ) -> None:
         """Initialize the AniList client.
 
@@ -69,11 +105,17 @@ class AniListClient:
             profile_name (str | None): Owning profile name; optional in public mode
             backup_retention_days (int | None): Days to retain backups before cleanup;
                 defaults to BACKUP_RETENTION_DAYS when None.
+            request_priority (RequestPriority): Rate limiter priority of read requests
+                made by this client.
+            persisted_queries (bool): Send prebuilt documents as automatic persisted
+                queries, by hash once the server has registered them.
         """
         self.anilist_token = anilist_token
         self.backup_dir = backup_dir
         self.dry_run = dry_run
         self.profile_name = profile_name or "public"
+        self.request_priority = request_priority
+        self.persisted_queries = persisted_queries
         self._session: aiohttp.ClientSession | None = None
         self.backup_retention_days = (
             self.BACKUP_RETENTION_DAYS
@@ -81,7 +123,31 @@ class AniListClient:
             else backup_retention_days
         )
 
-        self.offline_anilist_entries: dict[int, Media] = {}
+        # Media metadata is shared by every client, only the user's list entries
+        # are kept per client. None marks media known not to be on the list.
+        self.media_store = shared_media_store
+        self.list_entries: dict[int, MediaList | None] = {}
+        self._list_loaded = False
+        self.backup_store = (
+            AniListBackupStore(backup_dir, self.profile_name) if backup_dir else None
+        )
+
+        self._anime_loads: dict[
+            tuple[int, MediaProjection], asyncio.Future[Media | None]
+        ] = {}
+        self._anime_load_queue: list[tuple[int, MediaProjection]] = []
+        self._anime_load_task: asyncio.Task | None = None
+
+        self.max_query_complexity = self.MAX_QUERY_COMPLEXITY
+
+    @property
+    def list_loaded(self) -> bool:
+        """Whether `list_entries` holds the user's whole list.
+
+        When loaded, media missing from `list_entries` are known not to be on the
+        user's list.
+        """
+        return self._list_loaded
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create the aiohttp session.
@@ -93,12 +159,11 @@ class AniListClient:
             headers = {
                 "Accept": "application/json",
                 "Content-Type": "application/json",
-                "User-Agent": f"PlexAniBridge/{__version__}",
             }
             if self.anilist_token:
                 headers["Authorization"] = f"Bearer {self.anilist_token}"
 
-            self._session = aiohttp.ClientSession(headers=headers)
+            self._session = create_client_session(headers)
 
         return self._session
 
@@ -128,17 +193,205 @@ class AniListClient:
     async def initialize(self):
         """Initialize the client by getting user info and backing up data.
 
+        The user's list is refreshed incrementally from the last backup when
+        possible, falling back to a full download every FULL_REFRESH_INTERVAL.
+
         In public (unauthenticated) mode, initialization is a no-op.
         """
         # If no token is provided, operate in public mode without user context
         if not self.anilist_token:
-            self.offline_anilist_entries.clear()
+            self.list_entries.clear()
             return
 
         self.user = await self.get_user()
         self.user_tz = self.get_user_tz()
-        self.offline_anilist_entries.clear()
-        await self.backup_anilist()
+        self.list_entries.clear()
+        self._list_loaded = False
+        if not await self.refresh_anilist():
+            self.list_entries.clear()
+            await self.backup_anilist()
+        self._list_loaded = True
+
+    @staticmethod
+    @cache
+    def _viewer_document() -> GraphQLDocument:
+        """Build the query fetching the authenticated user."""
+        return GraphQLDocument.build(
+            f"""
+            query Viewer {{
+                Viewer {{
+                    {User.model_dump_graphql()}
+                }}
+            }}
+            """
+        )
+
+    @staticmethod
+    @cache
+    def _save_entries_document(size: int) -> GraphQLDocument:
+        """Build the aliased mutation saving a batch of list entries.
+
+        Args:
+            size (int): Number of entries saved by the mutation
+
+        Returns:
+            GraphQLDocument: Mutation whose fields are aliased `m0` to `m<size - 1>`.
+        """
+        variable_declarations = []
+        mutation_fields = []
+
+        for j in range(size):
+            variable_declarations.extend(
+                [
+                    f"$mediaId{j}: Int",
+                    f"$status{j}: MediaListStatus",
+                    f"$score{j}: Float",
+                    f"$progress{j}: Int",
+                    f"$repeat{j}: Int",
+                    f"$notes{j}: String",
+                    f"$startedAt{j}: FuzzyDateInput",
+                    f"$completedAt{j}: FuzzyDateInput",
+                ]
+            )
+            mutation_fields.append(
+                f"""
+                m{j}: SaveMediaListEntry(
+                    mediaId: $mediaId{j},
+                    status: $status{j},
+                    score: $score{j},
+                    progress: $progress{j},
+                    repeat: $repeat{j},
+                    notes: $notes{j},
+                    startedAt: $startedAt{j},
+                    completedAt: $completedAt{j}
+                ) {{
+                    {MediaListSaveResult.model_dump_graphql()}
+                }}
+                """
+            )
+
+        nl = "\n"
+        return GraphQLDocument.build(
+            f"""
+            mutation BatchUpdateEntries({", ".join(variable_declarations)}) {{
+                {nl.join(mutation_fields)}
+            }}
+            """
+        )
+
+    @staticmethod
+    @cache
+    def _save_entry_complexity() -> int:
+        """Estimate the complexity each saved entry adds to the batch mutation.
+
+        The estimate is the difference between the mutations actually sent for two
+        entries and for one, so it follows the fields selected from saved entries.
+
+        Returns:
+            int: Estimated complexity of saving a single entry.
+        """
+        single = AniListClient._save_entries_document(1).query
+        double = AniListClient._save_entries_document(2).query
+        return estimate_complexity(double) - estimate_complexity(single)
+
+    @staticmethod
+    @cache
+    def _search_anime_document() -> GraphQLDocument:
+        """Build the query searching anime by title."""
+        return GraphQLDocument.build(
+            f"""
+            query SearchAnime($search: String, $formats: [MediaFormat], $limit: Int) {{
+                Page(perPage: $limit) {{
+                    media(search: $search, type: ANIME, format_in: $formats) {{
+                        {Media.model_dump_graphql()}
+                    }}
+                }}
+            }}
+            """
+        )
+
+    @staticmethod
+    @cache
+    def _get_anime_document(
+        size: int, projection: MediaProjection = MediaProjection.UI_DISPLAY
+    ) -> GraphQLDocument:
+        """Build the query fetching anime by ID.
+
+        Args:
+            size (int): Number of anime fetched by the query
+            projection (MediaProjection): Media fields selected by the query
+
+        Returns:
+            GraphQLDocument: `Media` query for a single anime, `Page` query otherwise.
+        """
+        if size == 1:
+            return GraphQLDocument.build(
+                f"""
+                query GetAnime($id: Int) {{
+                    Media(id: $id, type: ANIME) {{
+                        {projection.model_dump_graphql()}
+                    }}
+                }}
+                """
+            )
+        return GraphQLDocument.build(
+            f"""
+            query BatchGetAnime($ids: [Int]) {{
+                Page(perPage: {size}) {{
+                    media(id_in: $ids, type: ANIME) {{
+                        {projection.model_dump_graphql()}
+                    }}
+                }}
+            }}
+            """
+        )
+
+    @staticmethod
+    @cache
+    def _list_collection_document() -> GraphQLDocument:
+        """Build the query fetching a chunk of the user's list collection."""
+        return GraphQLDocument.build(
+            f"""
+            query MediaListCollection($userId: Int, $type: MediaType, $chunk: Int) {{
+                MediaListCollection(userId: $userId, type: $type, chunk: $chunk) {{
+                    {MediaListCollectionWithMedia.model_dump_graphql()}
+                }}
+            }}
+            """
+        )
+
+    @classmethod
+    @cache
+    def _list_entries_document(cls) -> GraphQLDocument:
+        """Build the query fetching the user's list entries of specific anime."""
+        return GraphQLDocument.build(
+            f"""
+            query ListEntries($userId: Int, $ids: [Int]) {{
+                Page(perPage: {cls.ANIME_BATCH_SIZE}) {{
+                    mediaList(userId: $userId, mediaId_in: $ids, type: ANIME) {{
+                        {MediaList.model_dump_graphql()}
+                    }}
+                }}
+            }}
+            """
+        )
+
+    @classmethod
+    @cache
+    def _changed_entries_document(cls) -> GraphQLDocument:
+        """Build the query paging through list entries, most recently updated first."""
+        return GraphQLDocument.build(
+            f"""
+            query ChangedEntries($userId: Int, $page: Int) {{
+                Page(page: $page, perPage: {cls.ANIME_BATCH_SIZE}) {{
+                    pageInfo {{ hasNextPage }}
+                    mediaList(userId: $userId, type: ANIME, sort: UPDATED_TIME_DESC) {{
+                        {MediaListWithMedia.model_dump_graphql()}
+                    }}
+                }}
+            }}
+            """
+        )
 
     def _ensure_authenticated(self) -> None:
         """Ensure that client has authentication for privileged operations."""
@@ -159,16 +412,10 @@ class AniListClient:
         Raises:
             aiohttp.ClientError: If the API request fails
         """
-        query = f"""
-        query {{
-            Viewer {{
-                {User.model_dump_graphql()}
-            }}
-        }}
-        """
-
-        response = await self._make_request(query)
-        return User(**response["data"]["Viewer"])
+        response = await self._make_typed_request(
+            self._viewer_document(), dict[str, User]
+        )
+        return response["Viewer"]
 
     def get_user_tz(self) -> timezone:
         """Returns the authenticated user's timezone.
@@ -242,22 +489,6 @@ class AniListClient:
         """
         self._ensure_authenticated()
 
-        query = f"""
-        mutation (
-            $mediaId: Int, $status: MediaListStatus, $score: Float, $progress: Int,
-            $repeat: Int, $notes: String, $startedAt: FuzzyDateInput,
-            $completedAt: FuzzyDateInput
-        ) {{
-            SaveMediaListEntry(
-                mediaId: $mediaId, status: $status, score: $score, progress: $progress,
-                repeat: $repeat, notes: $notes, startedAt: $startedAt,
-                completedAt: $completedAt
-            ) {{
-                {MediaListWithMedia.model_dump_graphql()}
-            }}
-        }}
-        """
-
         if self.dry_run:  # Skip the request, only log the variables
             log.info(
                 f"Dry run enabled, skipping anime entry "
@@ -265,22 +496,18 @@ class AniListClient:
             )
             return None
 
-        variables = media_list_entry.model_dump_json(exclude_none=True)
-
-        response = await self._make_request(query, variables)
-        save_response = response["data"]["SaveMediaListEntry"]
-
-        self.offline_anilist_entries[media_list_entry.media_id] = (
-            self._media_list_entry_to_media(MediaListWithMedia(**save_response))
-        )
+        await self._save_anime_entries([media_list_entry])
 
     async def batch_update_anime_entries(
         self, media_list_entries: list[MediaList]
     ) -> None:
         """Updates multiple anime entries on the authenticated user's list.
 
-        Sends a batch mutation to modify multiple existing anime entries in the user's
-        list. Processes entries in batches of 10 to avoid overwhelming the API.
+        Sends batch mutations to modify multiple existing anime entries in the user's
+        list. Entries are packed into as few requests as AniList's query complexity
+        limit allows. A batch rejected for being too complex is split in half and
+        retried. The mutations only return the saved entries' identifiers, and the
+        locally cached entries are patched with the saved values.
 
         Args:
             media_list_entries (list[MediaList]): List of updated AniList entries to
@@ -291,81 +518,93 @@ class AniListClient:
         """
         self._ensure_authenticated()
 
-        BATCH_SIZE = 10
-
         if not media_list_entries:
             return None
 
-        for i in range(0, len(media_list_entries), BATCH_SIZE):
-            batch = media_list_entries[i : i + BATCH_SIZE]
-            log.debug(
-                f"Updating batch of anime entries "
-                f"$${{anilist_id: {[m.media_id for m in batch]}}}$$"
-            )
+        entry_complexity = self._save_entry_complexity()
+        for batch in pack_by_complexity(
+            media_list_entries,
+            lambda _: entry_complexity,
+            self.max_query_complexity,
+        ):
+            await self._save_anime_entries(batch)
 
-            variable_declarations = []
-            mutation_fields = []
-            variables = {}
-
-            for j, media_list_entry in enumerate(batch):
-                variable_declarations.extend(
-                    [
-                        f"$mediaId{j}: Int",
-                        f"$status{j}: MediaListStatus",
-                        f"$score{j}: Float",
-                        f"$progress{j}: Int",
-                        f"$repeat{j}: Int",
-                        f"$notes{j}: String",
-                        f"$startedAt{j}: FuzzyDateInput",
-                        f"$completedAt{j}: FuzzyDateInput",
-                    ]
-                )
-                mutation_field = f"""
-                    m{j}: SaveMediaListEntry(
-                        mediaId: $mediaId{j},
-                        status: $status{j},
-                        score: $score{j},
-                        progress: $progress{j},
-                        repeat: $repeat{j},
-                        notes: $notes{j},
-                        startedAt: $startedAt{j},
-                        completedAt: $completedAt{j}
-                    ) {{
-                        {MediaListWithMedia.model_dump_graphql()}
-                    }}
-                """
-                mutation_fields.append(mutation_field)
+    async def _save_anime_entries(self, media_list_entries: list[MediaList]) -> None:
+        """Saves a batch of anime entries in a single aliased mutation.
 
-                entry_vars: dict = json.loads(
-                    media_list_entry.model_dump_json(exclude_none=True)
-                )
-                for k, v in entry_vars.items():
-                    variables[f"{k}{j}"] = v
+        Args:
+            media_list_entries (list[MediaList]): The AniList entries to save.
 
-            nl = "\n"
-            query = f"""
-            mutation BatchUpdateEntries({", ".join(variable_declarations)}) {{
-                {nl.join(mutation_fields)}
-            }}
-            """
+        Raises:
+            aiohttp.ClientError: If the API request fails.
+            AniListQueryComplexityError: If a single entry is too complex to save.
+        """
+        log.debug(
+            f"Updating batch of anime entries "
+            f"$${{anilist_id: {[m.media_id for m in media_list_entries]}}}$$"
+        )
 
-            if self.dry_run:
-                log.info(
-                    f"Dry run enabled, skipping anime entry "
-                    f"update $${{anilist_id: {[m.media_id for m in batch]}}}$$"
-                )
-                continue
+        variables = {}
+        for j, media_list_entry in enumerate(media_list_entries):
+            entry_vars = media_list_entry.model_dump(mode="json", exclude_none=True)
+            for k, v in entry_vars.items():
+                variables[f"{k}{j}"] = v
 
-            response: dict[str, dict[str, dict]] = await self._make_request(
-                query, json.dumps(variables)
+        if self.dry_run:
+            log.info(
+                f"Dry run enabled, skipping anime entry update "
+                f"$${{anilist_id: {[m.media_id for m in media_list_entries]}}}$$"
             )
+            return
 
-            for mutation_data in response["data"].values():
-                if "mediaId" not in mutation_data:
-                    continue
-                self.offline_anilist_entries[mutation_data["mediaId"]] = (
-                    self._media_list_entry_to_media(MediaListWithMedia(**mutation_data))
-                )
+        try:
+            response = await self._make_typed_request(
+                self._save_entries_document(len(media_list_entries)),
+                dict[str, MediaListSaveResult | None],
+                variables,
+                priority=RequestPriority.SYNC_WRITE,
+            )
+        except AniListQueryComplexityError:
+            if len(media_list_entries) == 1:
+                raise
+            mid = len(media_list_entries) // 2
+            log.debug(
+                f"Batch of {len(media_list_entries)} anime entries was too complex, "
+                f"splitting it in half"
+            )
+            await self._save_anime_entries(media_list_entries[:mid])
+            await self._save_anime_entries(media_list_entries[mid:])
+            return
+
+        for j, media_list_entry in enumerate(media_list_entries):
+            saved = response.get(f"m{j}")
+            if saved is not None:
+                self._patch_saved_entry(media_list_entry, saved)
+
+    def _patch_saved_entry(
+        self, media_list_entry: MediaList, saved: MediaListSaveResult
+    ) -> None:
+        """Applies a saved list entry to the locally cached list entries.
+
+        AniList only updates the fields sent in the mutation, so the sent fields are
+        merged over the cached entry along with the identifiers AniList returned.
+
+        Args:
+            media_list_entry (MediaList): The entry that was sent
+            saved (MediaListSaveResult): The fields returned by AniList
+        """
+        fields: dict[str, Any] = {}
+        cached_entry = self.list_entries.get(saved.media_id)
+        if cached_entry is not None:
+            fields.update(cached_entry)
+        fields.update(
+            (field, value)
+            for field, value in media_list_entry
+            if field in MediaList.model_fields and value is not None
+        )
+        fields.update(id=saved.id, media_id=saved.media_id, updated_at=saved.updated_at)
+
+        self.list_entries[saved.media_id] = MediaList(**fields)
 
     async def delete_anime_entry(self, entry_id: int, media_id: int) -> bool:
         """Deletes an anime entry from the authenticated user's list.
@@ -404,11 +643,12 @@ class AniListClient:
             id=entry_id, media_id=media_id, user_id=self.user.id
         ).model_dump_json(exclude_none=True)
 
-        response = await self._make_request(query, variables)
+        response = await self._make_request(
+            query, variables, priority=RequestPriority.SYNC_WRITE
+        )
         delete_response = response["data"]["DeleteMediaListEntry"]
 
-        with contextlib.suppress(KeyError):
-            del self.offline_anilist_entries[media_id]
+        self.list_entries[media_id] = None
 
         return delete_response["deleted"]
 
@@ -461,16 +701,6 @@ class AniListClient:
         self, search_str: str, is_movie: bool | None, limit: int = 10
     ) -> list[Media]:
         """Cached helper function for anime searches."""
-        query = f"""
-        query ($search: String, $formats: [MediaFormat], $limit: Int) {{
-            Page(perPage: $limit) {{
-                media(search: $search, type: ANIME, format_in: $formats) {{
-                    {Media.model_dump_graphql()}
-                }}
-            }}
-        }}
-        """
-
         formats = (
             [MediaFormat.MOVIE, MediaFormat.SPECIAL]
             if is_movie is True
@@ -497,8 +727,10 @@ class AniListClient:
             "limit": limit,
         }
 
-        response = await self._make_request(query, variables)
-        return [Media(**m) for m in response["data"]["Page"]["media"]]
+        response = await self._make_typed_request(
+            self._search_anime_document(), dict[str, MediaPage], variables
+        )
+        return [m for m in response["Page"].media if m]
 
     @gattl_cache(
         ttl=3600,
@@ -677,54 +909,59 @@ class AniListClient:
 
         return result[:max_results]
 
-    async def get_anime(self, anilist_id: int) -> Media:
+    async def get_anime(
+        self,
+        anilist_id: int,
+        projection: MediaProjection = MediaProjection.UI_DISPLAY,
+    ) -> Media:
         """Retrieves detailed information about a specific anime.
 
-        Attempts to fetch anime data from local cache first, falling back to
-        an API request if not found in cache.
+        Attempts to fetch the anime metadata from the shared media store first,
+        falling back to an API request if not found. Metadata is shared by every
+        client, so only the user's list entry may need to be fetched. Concurrent
+        API lookups are coalesced into batched requests.
 
         Args:
             anilist_id (int): The AniList ID of the anime to retrieve.
+            projection (MediaProjection): Media fields the caller needs. Anime
+                fetched with SYNC_MINIMAL are only cached for SYNC_MINIMAL callers.
 
         Returns:
             Media: Detailed information about the requested anime.
 
         Raises:
             aiohttp.ClientError: If the API request fails.
+            AniListMediaNotFoundError: If the anime does not exist.
         """
-        if anilist_id in self.offline_anilist_entries:
+        media = self.media_store.get_many([anilist_id], projection).get(anilist_id)
+        if media is not None:
             log.debug(
-                f"Pulling AniList data from local cache "
+                f"Pulling AniList data from shared cache "
                 f"$${{anilist_id: {anilist_id}}}$$"
             )
-            return self.offline_anilist_entries[anilist_id]
-
-        query = f"""
-        query ($id: Int) {{
-            Media(id: $id, type: ANIME) {{
-                {Media.model_dump_graphql()}
-            }}
-        }}
-        """
-
-        log.debug(f"Pulling AniList data from API $${{anilist_id: {anilist_id}}}$$")
-
-        response = await self._make_request(query, {"id": anilist_id})
-        result = Media(**response["data"]["Media"])
-
-        self.offline_anilist_entries[anilist_id] = result
+            await self._fetch_list_entries([anilist_id])
+            return self._with_list_entry(media)
 
+        result = await self._load_anime(anilist_id, projection)
+        if result is None:
+            raise AniListMediaNotFoundError(f"AniList media {anilist_id} not found")
         return result
 
-    async def batch_get_anime(self, anilist_ids: list[int]) -> list[Media]:
+    async def batch_get_anime(
+        self,
+        anilist_ids: list[int],
+        projection: MediaProjection = MediaProjection.UI_DISPLAY,
+    ) -> list[Media]:
         """Retrieves detailed information about a list of anime.
 
-        Attempts to fetch anime data from local cache first, falling back to
-        batch API requests for entries not found in cache. Processes requests
-        in batches of 10 to avoid overwhelming the API.
+        Attempts to fetch the anime metadata from the shared media store first,
+        falling back to batch API requests for entries not found. For anime whose
+        metadata is already shared, only the user's list entries are fetched.
 
         Args:
             anilist_ids (list[int]): The AniList IDs of the anime to retrieve.
+            projection (MediaProjection): Media fields the caller needs. Anime
+                fetched with SYNC_MINIMAL are only cached for SYNC_MINIMAL callers.
 
         Returns:
             list[Media]: Detailed information about the requested anime.
@@ -732,66 +969,242 @@ class AniListClient:
         Raises:
             aiohttp.ClientError: If the API request fails.
         """
-        BATCH_SIZE = 50
-
         if not anilist_ids:
             return []
 
-        result: list[Media] = []
-        missing_ids = []
-
-        cached_ids = [id for id in anilist_ids if id in self.offline_anilist_entries]
-        if cached_ids:
+        shared = self.media_store.get_many(anilist_ids, projection)
+        if shared:
             log.debug(
-                f"Pulling AniList data from local cache in "
-                f"batched mode $${{anilist_ids: {cached_ids}}}$$"
+                f"Pulling AniList data from shared cache in "
+                f"batched mode $${{anilist_ids: {list(shared)}}}$$"
             )
-            result.extend(self.offline_anilist_entries[id] for id in cached_ids)
+            await self._fetch_list_entries(list(shared))
+        result = [self._with_list_entry(media) for media in shared.values()]
 
-        missing_ids = [
-            id for id in anilist_ids if id not in self.offline_anilist_entries
-        ]
+        missing_ids = [id for id in anilist_ids if id not in shared]
         if not missing_ids:
             return result
 
-        for i in range(0, len(missing_ids), BATCH_SIZE):
-            batch_ids = missing_ids[i : i + BATCH_SIZE]
+        loaded = await asyncio.gather(
+            *(self._load_anime(id, projection) for id in missing_ids)
+        )
+        result.extend(media for media in loaded if media is not None)
+
+        return result
+
+    def _with_list_entry(self, media: Media) -> Media:
+        """Attaches the user's list entry to shared media metadata.
+
+        Args:
+            media (Media): Media metadata without list entry.
+
+        Returns:
+            Media: The media with the user's list entry, if any.
+        """
+        entry = self.list_entries.get(media.id)
+        if entry is None:
+            return media
+        return media.model_copy(update={"media_list_entry": entry})
+
+    async def _fetch_list_entries(self, anilist_ids: list[int]) -> None:
+        """Fetches the user's list entries of anime not known to the client.
+
+        Once the user's list is loaded, every anime missing from it is known not to
+        be on the list, so nothing is fetched. Otherwise, only the list entries are
+        fetched, without the media metadata.
+
+        Args:
+            anilist_ids (list[int]): The AniList IDs of the anime.
+        """
+        if not self.anilist_token or self._list_loaded:
+            return
+        unknown_ids = [id for id in anilist_ids if id not in self.list_entries]
+        if unknown_ids:
+            await self.get_list_entries(unknown_ids)
+
+    async def get_list_entries(
+        self, anilist_ids: list[int]
+    ) -> dict[int, MediaList | None]:
+        """Fetches the user's current list entries of anime from the API.
+
+        The entries are always fetched, without the media metadata, and replace the
+        cached list entries.
+
+        Args:
+            anilist_ids (list[int]): The AniList IDs of the anime.
+
+        Returns:
+            dict[int, MediaList | None]: The list entries keyed by AniList ID, None
+                for anime that are not on the user's list.
+
+        Raises:
+            aiohttp.ClientError: If the API request fails.
+        """
+        self._ensure_authenticated()
+
+        log.debug(
+            f"Pulling AniList list entries from API $${{anilist_ids: {anilist_ids}}}$$"
+        )
+        result: dict[int, MediaList | None] = {}
+        for i in range(0, len(anilist_ids), self.ANIME_BATCH_SIZE):
+            batch = anilist_ids[i : i + self.ANIME_BATCH_SIZE]
+            response = await self._make_typed_request(
+                self._list_entries_document(),
+                dict[str, MediaListPage],
+                {"userId": self.user.id, "ids": batch},
+            )
+            entries = {
+                entry.media_id: self._strip_media(entry)
+                for entry in response["Page"].media_list
+            }
+            for anilist_id in batch:
+                result[anilist_id] = entries.get(anilist_id)
+
+        self.list_entries.update(result)
+        return result
+
+    async def _load_anime(
+        self,
+        anilist_id: int,
+        projection: MediaProjection = MediaProjection.UI_DISPLAY,
+    ) -> Media | None:
+        """Loads an anime from the API through the request coalescing loader.
+
+        Calls made within LOADER_WINDOW seconds of each other are merged into
+        batched requests per projection, and concurrent calls for the same ID share
+        a single in-flight request when it selects the needed fields.
+
+        Args:
+            anilist_id (int): The AniList ID of the anime to load.
+            projection (MediaProjection): Media fields to load.
+
+        Returns:
+            Media | None: The requested anime, or None if it does not exist.
+        """
+        future = self._anime_loads.get((anilist_id, projection))
+        if future is None and projection == MediaProjection.SYNC_MINIMAL:
+            future = self._anime_loads.get((anilist_id, MediaProjection.UI_DISPLAY))
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._anime_loads[(anilist_id, projection)] = future
+            self._anime_load_queue.append((anilist_id, projection))
+            if self._anime_load_task is None:
+                self._anime_load_task = asyncio.create_task(
+                    self._dispatch_anime_loads()
+                )
+        return await asyncio.shield(future)
+
+    async def _dispatch_anime_loads(self) -> None:
+        """Fetches every anime queued by `_load_anime()` during the loader window."""
+        await asyncio.sleep(self.LOADER_WINDOW)
+
+        queue, self._anime_load_queue = self._anime_load_queue, []
+        self._anime_load_task = None
+
+        by_projection: dict[MediaProjection, list[int]] = {}
+        for anilist_id, projection in queue:
+            by_projection.setdefault(projection, []).append(anilist_id)
+
+        await asyncio.gather(
+            *(
+                self._resolve_anime_loads(
+                    anilist_ids[i : i + self.ANIME_BATCH_SIZE], projection
+                )
+                for projection, anilist_ids in by_projection.items()
+                for i in range(0, len(anilist_ids), self.ANIME_BATCH_SIZE)
+            )
+        )
+
+    async def _resolve_anime_loads(
+        self, anilist_ids: list[int], projection: MediaProjection
+    ) -> None:
+        """Fetches a batch of queued anime and resolves their waiting callers.
+
+        Args:
+            anilist_ids (list[int]): The AniList IDs in the batch.
+            projection (MediaProjection): Media fields to fetch.
+        """
+        try:
+            media_by_id = await self._fetch_anime(anilist_ids, projection)
+        except Exception as e:
+            for anilist_id in anilist_ids:
+                future = self._anime_loads.pop((anilist_id, projection))
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for anilist_id in anilist_ids:
+            future = self._anime_loads.pop((anilist_id, projection))
+            if not future.done():
+                future.set_result(media_by_id.get(anilist_id))
+
+    async def _fetch_anime(
+        self,
+        anilist_ids: list[int],
+        projection: MediaProjection = MediaProjection.UI_DISPLAY,
+    ) -> dict[int, Media]:
+        """Fetches anime from the API and stores them in the caches.
+
+        Args:
+            anilist_ids (list[int]): The AniList IDs of the anime to fetch.
+            projection (MediaProjection): Media fields to fetch. Only anime fetched
+                with every field are served to callers needing every field.
+
+        Returns:
+            dict[int, Media]: The fetched anime keyed by AniList ID.
+        """
+        document = self._get_anime_document(len(anilist_ids), projection)
+        if len(anilist_ids) == 1:
             log.debug(
-                f"Pulling AniList data from API in batched "
-                f"mode $${{anilist_ids: {batch_ids}}}$$"
+                f"Pulling AniList data from API $${{anilist_id: {anilist_ids[0]}}}$$"
             )
 
-            query = f"""
-            query BatchGetAnime($ids: [Int]) {{
-                Page(perPage: {len(batch_ids)}) {{
-                    media(id_in: $ids, type: ANIME) {{
-                        {Media.model_dump_graphql()}
-                    }}
-                }}
-            }}
-            """
+            response = await self._make_typed_request(
+                document, dict[str, Media | None], {"id": anilist_ids[0]}
+            )
+            media_list = [response["Media"]]
+        else:
+            log.debug(
+                f"Pulling AniList data from API in batched "
+                f"mode $${{anilist_ids: {anilist_ids}}}$$"
+            )
 
-            variables = {"ids": batch_ids}
-            response = await self._make_request(query, variables)
+            try:
+                page = await self._make_typed_request(
+                    document, dict[str, MediaPage], {"ids": anilist_ids}
+                )
+            except AniListQueryComplexityError:
+                mid = len(anilist_ids) // 2
+                log.debug(
+                    f"Batch of {len(anilist_ids)} anime was too complex, splitting "
+                    f"it in half"
+                )
+                first, second = await asyncio.gather(
+                    self._fetch_anime(anilist_ids[:mid], projection),
+                    self._fetch_anime(anilist_ids[mid:], projection),
+                )
+                return first | second
+            media_list = page["Page"].media
 
-            media_list = response.get("data", {}).get("Page", {}).get("media", []) or []
-            media_by_id = {m["id"]: Media(**m) for m in media_list}
+        media_by_id = {m.id: m for m in media_list if m}
 
-            for anilist_id in batch_ids:
+        self.media_store.put_many(media_by_id.values(), projection)
+        if self.anilist_token:
+            for anilist_id in anilist_ids:
                 media = media_by_id.get(anilist_id)
-                if not media:
-                    continue
-                self.offline_anilist_entries[anilist_id] = media
-                result.append(media)
+                self.list_entries[anilist_id] = (
+                    media.media_list_entry if media else None
+                )
 
-        return result
+        return media_by_id
 
     async def backup_anilist(self) -> None:
         """Creates a JSON backup of the user's AniList data.
 
-        Fetches all anime entries from the user's lists and saves them to a JSON
-        file. Implements a rotating backup system that maintains backups for the
-        configured retention period.
+        Fetches all anime entries from the user's lists and saves them to the backup
+        store, which deduplicates unchanged entries across backups. Implements a
+        rotating backup system that maintains backups for the configured retention
+        period.
 
         The backup includes:
             - User information
@@ -806,14 +1219,6 @@ class AniListClient:
         if self.backup_dir is None:
             raise aiohttp.ClientError("backup_dir must be set for backups")
 
-        query = f"""
-        query MediaListCollection($userId: Int, $type: MediaType, $chunk: Int) {{
-            MediaListCollection(userId: $userId, type: $type, chunk: $chunk) {{
-                {MediaListCollectionWithMedia.model_dump_graphql()}
-            }}
-        }}
-        """
-
         data = MediaListCollectionWithMedia(user=self.user, has_next_chunk=True)
         variables: dict[str, Any] = {
             "userId": self.user.id,
@@ -821,11 +1226,15 @@ class AniListClient:
             "chunk": 0,
         }
 
-        while data.has_next_chunk:
-            response = await self._make_request(query, variables)
-            collection_data = response["data"]["MediaListCollection"]
+        media: list[MediaWithoutList] = []
 
-            new_data = MediaListCollectionWithMedia(**collection_data)
+        while data.has_next_chunk:
+            response = await self._make_typed_request(
+                self._list_collection_document(),
+                dict[str, MediaListCollectionWithMedia],
+                variables,
+            )
+            new_data = response["MediaListCollection"]
 
             data.has_next_chunk = new_data.has_next_chunk
             variables["chunk"] += 1
@@ -835,144 +1244,509 @@ class AniListClient:
                     continue
                 data.lists.append(li)
                 for entry in li.entries:
-                    self.offline_anilist_entries[entry.media_id] = (
-                        self._media_list_entry_to_media(entry)
-                    )
+                    self.list_entries[entry.media_id] = self._strip_media(entry)
+                    if entry.media is not None:
+                        media.append(entry.media)
 
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        backup_filename = f"plexanibridge-{self.profile_name}.{timestamp}.json"
-        backup_file = self.backup_dir / backup_filename
-
-        if not backup_file.parent.exists():
-            backup_file.parent.mkdir(parents=True)
-
-        # To compress the backup file, remove the unecessary media field from each entry
-        sanitized_lists: list[MediaListGroup] = []
-        for li in data.lists:
-            sanitized_entries: list[MediaList] = []
-            for entry in li.entries:
-                sanitized_entry = MediaList(
-                    **{
-                        field: getattr(entry, field)
-                        for field in MediaList.model_fields
-                        if hasattr(entry, field)
-                    }
-                )
-                sanitized_entries.append(sanitized_entry)
-
-            sanitized_lists.append(
-                MediaListGroup(
-                    entries=sanitized_entries,
-                    name=li.name,
-                    is_custom_list=li.is_custom_list,
-                    is_split_completed_list=li.is_split_completed_list,
-                    status=li.status,
-                )
+        self.media_store.put_many(media)
+        self._write_backup(data.lists, refreshed_at=datetime.now(UTC))
+
+    async def refresh_anilist(self) -> bool:
+        """Refreshes the user's AniList data from the last backup.
+
+        Loads the entries of the last backup and patches them with the entries that
+        changed since its `updatedAt` high-water mark, pulled newest first. Media
+        metadata for unchanged entries is read from the shared media store. Entries
+        keep the lists of the last backup, including custom lists, and the result is
+        written as a new backup.
+
+        Entries deleted on AniList are not detected, so a full refresh through
+        `backup_anilist()` is still needed every FULL_REFRESH_INTERVAL.
+
+        Returns:
+            bool: True if the data was refreshed, False if a full refresh is needed.
+
+        Raises:
+            aiohttp.ClientError: If the API request fails.
+        """
+        self._ensure_authenticated()
+        if self.backup_store is None:
+            return False
+
+        state = self._get_list_state()
+        if state is None:
+            return False
+
+        refreshed_at = datetime.fromisoformat(state["refreshed_at"])
+        if datetime.now(UTC) - refreshed_at >= self.FULL_REFRESH_INTERVAL:
+            log.debug(f"[{self.profile_name}] AniList data is due for a full refresh")
+            return False
+
+        try:
+            snapshot = self.backup_store.read_collection(state["backup"])
+        except (OSError, ValueError, KeyError):
+            log.debug(
+                f"[{self.profile_name}] Could not read the last AniList backup "
+                f"$$'{state['backup']}'$$, falling back to a full refresh"
             )
+            return False
+
+        entries: dict[int, MediaList] = {
+            entry.media_id: entry for li in snapshot.lists for entry in li.entries
+        }
 
-        data_without_media = MediaListCollection(
-            user=data.user, lists=sanitized_lists, has_next_chunk=data.has_next_chunk
+        changed = await self._get_changed_list_entries(
+            datetime.fromtimestamp(state["updated_at"] or 0, UTC)
         )
 
-        backup_file.write_text(data_without_media.model_dump_json())
-        log.info(f"Exported AniList data to $$'{backup_file}'$$")
+        stale_ids = [media_id for media_id in entries if media_id not in changed]
+        cached = self.media_store.get_many(stale_ids)
+        missing = [media_id for media_id in stale_ids if media_id not in cached]
+        if len(missing) > self.ANIME_BATCH_SIZE:
+            log.debug(
+                f"[{self.profile_name}] Media metadata of {len(missing)} AniList "
+                f"entries is not cached, falling back to a full refresh"
+            )
+            return False
 
-        if self.backup_retention_days <= 0:
-            return
+        log.info(
+            f"[{self.profile_name}] Refreshing AniList data incrementally with "
+            f"{len(changed)} changed entries"
+        )
+
+        for media_id, entry in changed.items():
+            entries[media_id] = self._strip_media(entry)
+        self.media_store.put_many(
+            entry.media for entry in changed.values() if entry.media is not None
+        )
+        if missing:
+            # Fetched media carry the current list entry, which supersedes the backup
+            fetched = await self._fetch_anime(missing)
+            for media_id in missing:
+                media = fetched.get(media_id)
+                if media is None or media.media_list_entry is None:
+                    del entries[media_id]
+                else:
+                    entries[media_id] = media.media_list_entry
+        self.list_entries.update(entries)
+
+        self._write_backup(
+            self._regroup_list_entries(snapshot.lists, entries),
+            refreshed_at=refreshed_at,
+        )
+        return True
+
+    @staticmethod
+    def _regroup_list_entries(
+        lists: list[MediaListGroup], entries: dict[int, MediaList]
+    ) -> list[MediaListGroup]:
+        """Groups refreshed list entries like the lists of the last backup.
+
+        Custom lists keep their members, and entries that were only on custom lists
+        stay off the status lists. Entries stay on their status list while their
+        status is unchanged, other entries are moved to a list of their new status.
+
+        Args:
+            lists (list[MediaListGroup]): The lists of the last backup
+            entries (dict[int, MediaList]): The refreshed entries keyed by media ID
+
+        Returns:
+            list[MediaListGroup]: The refreshed lists, without empty lists.
+        """
+        custom_only = {
+            entry.media_id for li in lists if li.is_custom_list for entry in li.entries
+        } - {
+            entry.media_id
+            for li in lists
+            if not li.is_custom_list
+            for entry in li.entries
+        }
 
-        cutoff_date = datetime.now() - timedelta(days=self.backup_retention_days)
+        groups: list[MediaListGroup] = []
+        placed: set[int] = set(custom_only)
+        for li in lists:
+            group_entries = []
+            for old_entry in li.entries:
+                entry = entries.get(old_entry.media_id)
+                if entry is None:
+                    continue
+                if not li.is_custom_list:
+                    if li.status is not None and entry.status != li.status:
+                        continue
+                    placed.add(entry.media_id)
+                group_entries.append(entry)
+            groups.append(li.model_copy(update={"entries": group_entries}, deep=False))
 
-        retention_pattern = f"plexanibridge-{self.profile_name}.*.json"
-        for file in self.backup_dir.glob(retention_pattern):
-            file_mtime = datetime.fromtimestamp(file.stat().st_mtime)
-            if file_mtime < cutoff_date:
-                file.unlink()
-                log.debug(f"Deleted old backup '{file}'")
+        for media_id, entry in entries.items():
+            if media_id in placed:
+                continue
+            group = next(
+                (
+                    li
+                    for li in groups
+                    if not li.is_custom_list and li.status == entry.status
+                ),
+                None,
+            )
+            if group is None:
+                group = MediaListGroup(is_custom_list=False, status=entry.status)
+                groups.append(group)
+            group.entries.append(entry)
 
-    def _media_list_entry_to_media(self, media_list_entry: MediaListWithMedia) -> Media:
-        """Converts a MediaListWithMedia object to a Media object.
+        return [li for li in groups if li.entries]
 
-        Creates a new Media object that combines the user's list entry data
-        with the anime's metadata.
+    async def _get_changed_list_entries(
+        self, updated_since: datetime
+    ) -> dict[int, MediaListWithMedia]:
+        """Fetches the user's list entries updated since a point in time.
 
         Args:
-            media_list_entry (MediaListWithMedia): Combined object containing both list
-                entry and media information.
+            updated_since (datetime): Only entries updated at or after this time are
+                returned.
 
         Returns:
-            Media: New Media object containing all relevant fields from both the list
-                entry and media information.
+            dict[int, MediaListWithMedia]: The changed entries keyed by media ID.
+        """
+        changed: dict[int, MediaListWithMedia] = {}
+        variables: dict[str, Any] = {"userId": self.user.id, "page": 1}
 
-        Note:
-            This is an internal helper method used primarily by backup_anilist().
-        """
-        return Media(
-            media_list_entry=MediaList(
-                **{
-                    field: getattr(media_list_entry, field)
-                    for field in MediaList.model_fields
-                    if hasattr(media_list_entry, field)
-                }
+        while True:
+            response = await self._make_typed_request(
+                self._changed_entries_document(), dict[str, MediaListPage], variables
+            )
+            page = response["Page"]
+
+            for entry in page.media_list:
+                if entry.updated_at and entry.updated_at < updated_since:
+                    return changed
+                changed.setdefault(entry.media_id, entry)
+
+            if not (page.page_info and page.page_info.has_next_page):
+                return changed
+            variables["page"] += 1
+
+    def _get_list_state_key(self) -> str:
+        """Generate the database key for this profile's AniList list state.
+
+        Returns:
+            str: Database key for the list state
+        """
+        return f"anilist_list_state_{self.profile_name}"
+
+    def _get_list_state(self) -> dict[str, Any] | None:
+        """Retrieves the state of the last AniList backup from the database.
+
+        Returns:
+            dict[str, Any] | None: The backup file name, its `updatedAt` high-water
+                mark and the time of the last full refresh, None if never backed up.
+        """
+        with db() as ctx:
+            state = ctx.session.get(Housekeeping, self._get_list_state_key())
+            if state is None or state.value is None:
+                return None
+            return json.loads(state.value)
+
+    def _write_backup(
+        self, lists: list[MediaListGroup], refreshed_at: datetime
+    ) -> None:
+        """Writes the user's lists to a new backup and records its state.
+
+        Args:
+            lists (list[MediaListGroup]): The lists of the user.
+            refreshed_at (datetime): Time of the last full refresh the lists are
+                based on.
+
+        Raises:
+            OSError: If unable to create backup directory or write backup file.
+        """
+        if self.backup_store is None:
+            raise aiohttp.ClientError("backup_dir must be set for backups")
+
+        backup_file = self.backup_store.write(self.user, lists)
+        log.info(f"Exported AniList data to $$'{backup_file}'$$")
+
+        updated_at = max(
+            (
+                entry.updated_at
+                for li in lists
+                for entry in li.entries
+                if entry.updated_at
             ),
+            default=None,
+        )
+        with db() as ctx:
+            ctx.session.merge(
+                Housekeeping(
+                    key=self._get_list_state_key(),
+                    value=json.dumps(
+                        {
+                            "backup": backup_file.name,
+                            "updated_at": int(updated_at.timestamp())
+                            if updated_at
+                            else None,
+                            "refreshed_at": refreshed_at.isoformat(),
+                        }
+                    ),
+                )
+            )
+            ctx.session.commit()
+
+        self.backup_store.prune(self.backup_retention_days)
+
+    @staticmethod
+    def _strip_media(media_list_entry: MediaListWithMedia) -> MediaList:
+        """Gets a list entry without its attached media.
+
+        Args:
+            media_list_entry (MediaListWithMedia): List entry, possibly with media
+
+        Returns:
+            MediaList: The list entry fields only.
+        """
+        return MediaList(
             **{
-                field: getattr(media_list_entry.media, field)
-                for field in Media.model_fields
-                if hasattr(media_list_entry.media, field)
-            },
+                field: getattr(media_list_entry, field)
+                for field in MediaList.model_fields
+            }
         )
 
-    @anilist_limiter()
+    def _raise_for_complexity(self, response_text: str) -> None:
+        """Raises if an error response reports an exceeded query complexity.
+
+        The client's complexity budget is lowered to the maximum advertised in the
+        error so later batches are packed within it.
+
+        Args:
+            response_text (str): Body of the error response
+
+        Raises:
+            AniListQueryComplexityError: If the query exceeded the maximum complexity.
+        """
+        with contextlib.suppress(ValueError, AttributeError):
+            for error in json.loads(response_text).get("errors") or []:
+                message = str(error.get("message", ""))
+                match = _COMPLEXITY_ERROR_RE.search(message)
+                if not match:
+                    continue
+                if match.group(1):
+                    self.max_query_complexity = min(
+                        self.max_query_complexity, int(match.group(1))
+                    )
+                log.warning(f"AniList rejected a query as too complex: {message}")
+                raise AniListQueryComplexityError(message)
+
+    @staticmethod
+    def _encode_request_body(
+        query: str | GraphQLDocument,
+        variables: dict | str | None,
+        send_query: bool = True,
+        persisted_hash: str | None = None,
+    ) -> bytes:
+        """Encode the JSON body of a GraphQL request.
+
+        Args:
+            query (str | GraphQLDocument): GraphQL query string or prebuilt document
+            variables (dict | str | None): Variables for the GraphQL query, either as
+                a dict or already serialized to JSON
+            send_query (bool): Whether to include the query text
+            persisted_hash (str | None): SHA-256 hash of the query to send as a
+                persisted query, None to not use persisted queries
+
+        Returns:
+            bytes: The encoded request body.
+        """
+        parts = [b"{"]
+        if send_query:
+            text = query.query if isinstance(query, GraphQLDocument) else query
+            parts += [b'"query":', to_json(text), b","]
+        # Pre-serialized variables are spliced into the body as is
+        parts += [
+            b'"variables":',
+            variables.encode()
+            if isinstance(variables, str)
+            else to_json(variables or {}),
+        ]
+        if persisted_hash:
+            parts += [
+                b',"extensions":',
+                to_json(
+                    {"persistedQuery": {"version": 1, "sha256Hash": persisted_hash}}
+                ),
+            ]
+        parts.append(b"}")
+        return b"".join(parts)
+
     async def _make_request(
-        self, query: str, variables: dict | str | None = None, retry_count: int = 0
+        self,
+        query: str | GraphQLDocument,
+        variables: dict | str | None = None,
+        priority: RequestPriority | None = None,
     ) -> dict:
+        """Makes a request to the AniList GraphQL API and decodes the JSON response.
+
+        Args:
+            query (str | GraphQLDocument): GraphQL query string or prebuilt document
+            variables (dict | str | None): Variables for the GraphQL query, either as
+                a dict or already serialized to JSON
+            priority (RequestPriority | None): Rate limiter priority of the request;
+                defaults to the client's request priority when None.
+
+        Returns:
+            dict: JSON response from the API
+
+        Raises:
+            aiohttp.ClientError: If the request fails for any reason other than rate
+                limiting
+            AniListQueryComplexityError: If the query exceeds AniList's maximum query
+                complexity
+        """
+        return from_json(
+            await self._make_raw_request(query, variables, priority=priority)
+        )
+
+    async def _make_typed_request[T](
+        self,
+        query: str | GraphQLDocument,
+        data_type: type[T],
+        variables: dict | str | None = None,
+        priority: RequestPriority | None = None,
+    ) -> T:
+        """Makes a request to the AniList GraphQL API and validates its data.
+
+        The raw response body is validated straight into `data_type` by pydantic's
+        JSON parser, without decoding it into intermediate Python objects first.
+
+        Args:
+            query (str | GraphQLDocument): GraphQL query string or prebuilt document
+            data_type (type[T]): Type of the response's `data` field
+            variables (dict | str | None): Variables for the GraphQL query, either as
+                a dict or already serialized to JSON
+            priority (RequestPriority | None): Rate limiter priority of the request;
+                defaults to the client's request priority when None.
+
+        Returns:
+            T: The validated `data` field of the response.
+
+        Raises:
+            aiohttp.ClientError: If the request fails for any reason other than rate
+                limiting
+            AniListQueryComplexityError: If the query exceeds AniList's maximum query
+                complexity
+            pydantic.ValidationError: If the response does not match `data_type`
+        """
+        raw = await self._make_raw_request(query, variables, priority=priority)
+        return GraphQLResponse[data_type].model_validate_json(raw).data
+
+    async def _make_raw_request(
+        self,
+        query: str | GraphQLDocument,
+        variables: dict | str | None = None,
+        retry_count: int = 0,
+        priority: RequestPriority | None = None,
+    ) -> bytes:
         """Makes a rate-limited request to the AniList GraphQL API.
 
         Handles rate limiting, authentication, and automatic retries for
-        rate limit exceeded responses.
+        rate limit exceeded responses. When persisted queries are enabled, prebuilt
+        documents the server already knows are sent by hash only.
 
         Args:
-            query (str): GraphQL query string
-            variables (dict | str): Variables for the GraphQL query
+            query (str | GraphQLDocument): GraphQL query string or prebuilt document
+            variables (dict | str | None): Variables for the GraphQL query, either as
+                a dict or already serialized to JSON
             retry_count (int): Number of retries attempted (used for temporary errors)
+            priority (RequestPriority | None): Rate limiter priority of the request;
+                defaults to the client's request priority when None.
 
         Returns:
-            dict: JSON response from the API
+            bytes: Raw JSON response body from the API
 
         Raises:
             aiohttp.ClientError: If the request fails for any reason other than rate
                 limiting
+            AniListQueryComplexityError: If the query exceeds AniList's maximum query
+                complexity
+            AniListUnavailableError: If AniList is unreachable and the circuit
+                breaker is open
 
         Note:
-            - Implements rate limiting of 30 requests per minute
+            - Rate limits are shared across all clients and adapt to the limit
+              advertised by AniList's rate limit headers
             - Automatically retries after waiting if rate limit is exceeded
             - Includes Authorization header using the stored token
+            - Connection errors and server errors count towards the circuit
+              breaker, which fails requests fast while AniList is down
         """
         if retry_count >= 3:
             raise aiohttp.ClientError("Failed to make request after 3 tries")
+        if not anilist_breaker.allow_request():
+            raise AniListUnavailableError(
+                "AniList is unavailable, requests are paused until it recovers"
+            )
 
-        if variables is None:
-            variables = {}
+        if priority is None:
+            priority = self.request_priority
 
+        persisted_hash = (
+            query.sha256
+            if self.persisted_queries and isinstance(query, GraphQLDocument)
+            else None
+        )
+        send_query = persisted_hash not in _persisted_query_hashes
+        body = self._encode_request_body(
+            query, variables, send_query=send_query, persisted_hash=persisted_hash
+        )
+
+        await anilist_limiter.acquire(priority)
         session = await self._get_session()
+        responded = False
 
         try:
-            async with session.post(
-                self.API_URL, json={"query": query, "variables": variables}
-            ) as response:
+            async with session.post(self.API_URL, data=body) as response:
+                responded = True
+                anilist_limiter.update(response.headers)
+                if response.status >= 500:
+                    anilist_breaker.record_failure()
+                else:
+                    anilist_breaker.record_success()
+
+                if (
+                    not send_query
+                    and persisted_hash
+                    and b"PersistedQueryNotFound" in await response.read()
+                ):
+                    # The server evicted the document, resend it in full
+                    _persisted_query_hashes.discard(persisted_hash)
+                    return await self._make_raw_request(
+                        query=query,
+                        variables=variables,
+                        retry_count=retry_count,
+                        priority=priority,
+                    )
+
                 if response.status == 429:  # Handle rate limit retries
                     retry_after = int(response.headers.get("Retry-After", 60))
                     log.warning(f"Rate limit exceeded, waiting {retry_after} seconds")
-                    await asyncio.sleep(retry_after + 1)
-                    return await self._make_request(
-                        query=query, variables=variables, retry_count=retry_count + 1
+                    anilist_limiter.block(retry_after + 1)
+                    return await self._make_raw_request(
+                        query=query,
+                        variables=variables,
+                        retry_count=retry_count + 1,
+                        priority=priority,
                     )
                 elif response.status == 502:  # Bad Gateway
                     log.warning("Received 502 Bad Gateway, retrying")
                     await asyncio.sleep(1)
-                    return await self._make_request(
-                        query=query, variables=variables, retry_count=retry_count + 1
+                    return await self._make_raw_request(
+                        query=query,
+                        variables=variables,
+                        retry_count=retry_count + 1,
+                        priority=priority,
                     )
 
+                if response.status == 400:
+                    self._raise_for_complexity(await response.text())
+
                 try:
                     response.raise_for_status()
                 except aiohttp.ClientResponseError as e:
@@ -981,11 +1755,22 @@ class AniListClient:
                     log.error(f"\t\t{response_text}")
                     raise e
 
-                return await response.json()
+                if persisted_hash:
+                    _persisted_query_hashes.add(persisted_hash)
+                return await response.read()
 
-        except (TimeoutError, aiohttp.ClientError):
+        except (TimeoutError, aiohttp.ClientError) as e:
             log.error("Connection error while making request to AniList API")
+            if not responded:
+                anilist_breaker.record_failure()
+            if anilist_breaker.is_open:
+                raise AniListUnavailableError(
+                    "AniList is unavailable, requests are paused until it recovers"
+                ) from e
             await asyncio.sleep(1)
-            return await self._make_request(
-                query=query, variables=variables, retry_count=retry_count + 1
+            return await self._make_raw_request(
+                query=query,
+                variables=variables,
+                retry_count=retry_count + 1,
+                priority=priority,
             )
@@ -0,0 +1,312 @@
+"""AniList Backup Store Module."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from src import log
+from src.models.schemas.anilist import (
+    MediaList,
+    MediaListCollection,
+    MediaListGroup,
+    User,
+)
+
+__all__ = ["AniListBackupStore"]
+
+
+class AniListBackupStore:
+    """Deduplicated, compressed store of AniList list backups.
+
+    Each backup is a gzipped JSON lines manifest named
+    `plexanibridge-<profile>.<timestamp>.jsonl.gz`. Its first line holds the user,
+    every following line holds one list with references to its entries. Entries are
+    stored once by content hash in gzipped packs under `objects/`, and a backup only
+    writes the entries that changed since the previous one. Packs are deleted once no
+    remaining backup references them.
+
+    Legacy `plexanibridge-<profile>.<timestamp>.json` backups remain readable.
+    """
+
+    MANIFEST_SUFFIX = ".jsonl.gz"
+    LEGACY_SUFFIX = ".json"
+    OBJECTS_DIR = "objects"
+
+    def __init__(self, backup_dir: Path, profile_name: str) -> None:
+        """Initialize the backup store.
+
+        Args:
+            backup_dir (Path): Directory the backups are stored in
+            profile_name (str): Name of the profile owning the backups
+        """
+        self.backup_dir = backup_dir
+        self.profile_name = profile_name
+
+    @property
+    def objects_dir(self) -> Path:
+        """Directory holding the entry packs."""
+        return self.backup_dir / self.OBJECTS_DIR
+
+    def _pack_path(self, pack: str) -> Path:
+        """Get the path of an entry pack.
+
+        Args:
+            pack (str): Name of the pack
+
+        Returns:
+            Path: Path of the pack file.
+        """
+        return self.objects_dir / f"{self.profile_name}.{pack}{self.MANIFEST_SUFFIX}"
+
+    def list_backups(self) -> list[Path]:
+        """List the backups of the profile, oldest first.
+
+        Returns:
+            list[Path]: Paths of the manifests and legacy backup files.
+        """
+        files = [
+            *self.backup_dir.glob(
+                f"plexanibridge-{self.profile_name}.*{self.MANIFEST_SUFFIX}"
+            ),
+            *self.backup_dir.glob(
+                f"plexanibridge-{self.profile_name}.*{self.LEGACY_SUFFIX}"
+            ),
+        ]
+        return sorted(files, key=lambda f: self.get_timestamp(f.name) or "")
+
+    @classmethod
+    def get_timestamp(cls, filename: str) -> str | None:
+        """Extract the timestamp part of a backup filename.
+
+        Args:
+            filename (str): Backup filename
+
+        Returns:
+            str | None: The `YYYYMMDDHHMMSS` timestamp, None if not present.
+        """
+        for suffix in (cls.MANIFEST_SUFFIX, cls.LEGACY_SUFFIX):
+            if filename.endswith(suffix):
+                timestamp = filename.removesuffix(suffix).rsplit(".", 1)[-1]
+                return timestamp if timestamp.isdigit() else None
+        return None
+
+    @staticmethod
+    def _hash_entry(entry_json: str) -> str:
+        """Hash the serialized form of an entry.
+
+        Args:
+            entry_json (str): JSON serialized entry
+
+        Returns:
+            str: Content hash of the entry.
+        """
+        return hashlib.blake2b(entry_json.encode(), digest_size=10).hexdigest()
+
+    def _read_manifest(self, path: Path) -> tuple[dict[str, Any], list[dict]]:
+        """Read a manifest.
+
+        Args:
+            path (Path): Path of the manifest
+
+        Returns:
+            tuple[dict[str, Any], list[dict]]: The header line and the list lines.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            header = json.loads(fh.readline())
+            return header, [json.loads(line) for line in fh if line.strip()]
+
+    def write(self, user: User | None, lists: Iterable[MediaListGroup]) -> Path:
+        """Write a new backup, storing only entries not already in the store.
+
+        Entries are serialized one at a time straight into the compressed pack, so
+        the lists may hold entries with attached media without copying them.
+
+        Args:
+            user (User | None): The user owning the lists
+            lists (Iterable[MediaListGroup]): The lists to back up
+
+        Returns:
+            Path: Path of the written manifest.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        manifest_path = (
+            self.backup_dir
+            / f"plexanibridge-{self.profile_name}.{timestamp}{self.MANIFEST_SUFFIX}"
+        )
+        pack_path = self._pack_path(timestamp)
+        pack_existed = pack_path.exists()
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        # Entries unchanged since the last backup are referenced from its packs
+        known: dict[str, str] = {}
+        previous = [
+            f for f in self.list_backups() if f.name.endswith(self.MANIFEST_SUFFIX)
+        ]
+        if previous:
+            try:
+                _, prev_lists = self._read_manifest(previous[-1])
+                known = {h: pack for li in prev_lists for pack, h in li["entries"]}
+            except (OSError, ValueError, KeyError):
+                log.debug(f"Could not read previous backup $$'{previous[-1]}'$$")
+
+        entry_fields = set(MediaList.model_fields)
+        written = 0
+        list_lines: list[str] = []
+
+        # Appending keeps a pack written earlier in the same second intact
+        with gzip.open(pack_path, "at", encoding="utf-8") as pack:
+            for li in lists:
+                refs: list[tuple[str, str]] = []
+                for entry in li.entries:
+                    entry_json = entry.model_dump_json(include=entry_fields)
+                    entry_hash = self._hash_entry(entry_json)
+                    if entry_hash not in known:
+                        pack.write(f'{{"h":"{entry_hash}","e":{entry_json}}}\n')
+                        known[entry_hash] = timestamp
+                        written += 1
+                    refs.append((known[entry_hash], entry_hash))
+
+                list_data = li.model_dump(mode="json", exclude={"entries"})
+                list_data["entries"] = refs
+                list_lines.append(json.dumps(list_data))
+
+        if not written and not pack_existed:
+            pack_path.unlink()
+
+        tmp_path = manifest_path.with_name(f".{manifest_path.name}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as fh:
+            fh.write(
+                json.dumps(
+                    {
+                        "version": 1,
+                        "user": user.model_dump(mode="json") if user else None,
+                    }
+                )
+                + "\n"
+            )
+            for line in list_lines:
+                fh.write(line + "\n")
+        tmp_path.replace(manifest_path)
+
+        log.debug(f"Wrote backup $$'{manifest_path.name}'$$ with {written} new entries")
+        return manifest_path
+
+    def read_user(self, filename: str) -> dict[str, Any] | None:
+        """Read the user of a backup without reading its entries.
+
+        Args:
+            filename (str): Backup filename
+
+        Returns:
+            dict[str, Any] | None: The serialized user, None if not present.
+        """
+        path = self.backup_dir / filename
+        if filename.endswith(self.MANIFEST_SUFFIX):
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                return json.loads(fh.readline()).get("user")
+        return json.loads(path.read_text()).get("user")
+
+    def iter_lists(self, filename: str) -> Iterator[dict[str, Any]]:
+        """Lazily read the lists of a backup in the legacy JSON layout.
+
+        Packs are only opened for lists that reference them, and each list is
+        yielded with its entries resolved before the next one is read.
+
+        Args:
+            filename (str): Backup filename
+
+        Yields:
+            dict[str, Any]: Serialized list, including its entries.
+        """
+        path = self.backup_dir / filename
+        if not filename.endswith(self.MANIFEST_SUFFIX):
+            yield from json.loads(path.read_text()).get("lists") or []
+            return
+
+        _, lists = self._read_manifest(path)
+        objects: dict[str, dict] = {}
+        loaded: set[str] = set()
+
+        for li in lists:
+            for pack in {pack for pack, _ in li["entries"]} - loaded:
+                wanted = {
+                    h for other in lists for p, h in other["entries"] if p == pack
+                }
+                with gzip.open(self._pack_path(pack), "rt", encoding="utf-8") as fh:
+                    for line in fh:
+                        obj = json.loads(line)
+                        if obj["h"] in wanted:
+                            objects[obj["h"]] = obj["e"]
+                loaded.add(pack)
+
+            yield {**li, "entries": [objects[h] for _, h in li["entries"]]}
+
+    def read(self, filename: str) -> dict[str, Any]:
+        """Read a whole backup in the legacy JSON layout.
+
+        Args:
+            filename (str): Backup filename
+
+        Returns:
+            dict[str, Any]: The serialized media list collection.
+        """
+        return {
+            "user": self.read_user(filename),
+            "lists": list(self.iter_lists(filename)),
+            "hasNextChunk": False,
+        }
+
+    def read_collection(self, filename: str) -> MediaListCollection:
+        """Read a whole backup as a media list collection.
+
+        Args:
+            filename (str): Backup filename
+
+        Returns:
+            MediaListCollection: The backed up lists.
+        """
+        return MediaListCollection(**self.read(filename))
+
+    def prune(self, retention_days: int) -> None:
+        """Delete expired backups and the packs no remaining backup references.
+
+        Args:
+            retention_days (int): Days to retain backups for, 0 or less keeps all
+        """
+        if retention_days <= 0:
+            return
+
+        cutoff_date = datetime.now() - timedelta(days=retention_days)
+        live_packs: set[str] = set()
+
+        for file in self.list_backups():
+            file_mtime = datetime.fromtimestamp(file.stat().st_mtime)
+            if file_mtime < cutoff_date:
+                file.unlink()
+                log.debug(f"Deleted old backup '{file}'")
+                continue
+            if not file.name.endswith(self.MANIFEST_SUFFIX):
+                continue
+            try:
+                _, lists = self._read_manifest(file)
+            except (OSError, ValueError):
+                log.warning(f"Could not read backup '{file}', keeping all packs")
+                return
+            live_packs.update(pack for li in lists for pack, _ in li["entries"])
+
+        if not self.objects_dir.exists():
+            return
+
+        for pack_file in self.objects_dir.glob(
+            f"{self.profile_name}.*{self.MANIFEST_SUFFIX}"
+        ):
+            pack = pack_file.name.removesuffix(self.MANIFEST_SUFFIX).rsplit(".", 1)[-1]
+            if pack not in live_packs:
+                pack_file.unlink()
+                log.debug(f"Deleted unreferenced backup pack '{pack_file}'")
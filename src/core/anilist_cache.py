@@ -0,0 +1,300 @@
+"""AniList Media Cache Module."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar
+
+from sqlalchemy import delete, func, select
+
+from src import log
+from src.config.database import db
+from src.models.db.anilist_media import AniListMedia
+from src.models.schemas.anilist import (
+    Media,
+    MediaProjection,
+    MediaStatus,
+    MediaWithoutList,
+)
+
+__all__ = ["AniListMediaCache", "AniListMediaStore", "shared_media_store"]
+
+
+class AniListMediaCache:
+    """Persistent, database-backed cache of AniList media metadata.
+
+    Only media metadata is stored; user list entries are stripped before writing so
+    the cache can be shared between profiles. Entries expire based on the airing
+    status of the media, as finished shows rarely change while airing ones gain new
+    episodes. The table is bounded to MAX_ENTRIES rows, evicting the least recently
+    fetched entries first.
+    """
+
+    MAX_ENTRIES = 20000
+    DEFAULT_TTL = timedelta(days=1)
+    STATUS_TTLS: ClassVar[dict[MediaStatus, timedelta]] = {
+        MediaStatus.FINISHED: timedelta(days=7),
+        MediaStatus.CANCELLED: timedelta(days=7),
+        MediaStatus.HIATUS: timedelta(days=3),
+        MediaStatus.NOT_YET_RELEASED: timedelta(hours=12),
+        MediaStatus.RELEASING: timedelta(hours=6),
+    }
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries (int | None): Maximum number of cached entries; defaults to
+                MAX_ENTRIES when None.
+        """
+        self.max_entries = self.MAX_ENTRIES if max_entries is None else max_entries
+
+    @classmethod
+    def _get_ttl(cls, status: str | None) -> timedelta:
+        """Get the time-to-live for an entry with the given media status.
+
+        Args:
+            status (str | None): The media status of the entry
+
+        Returns:
+            timedelta: How long the entry stays fresh.
+        """
+        if status is None or status not in MediaStatus:
+            return cls.DEFAULT_TTL
+        return cls.STATUS_TTLS.get(MediaStatus(status), cls.DEFAULT_TTL)
+
+    def get_many(self, anilist_ids: Iterable[int]) -> dict[int, tuple[Media, datetime]]:
+        """Retrieve fresh cached media entries.
+
+        Args:
+            anilist_ids (Iterable[int]): AniList IDs to look up
+
+        Returns:
+            dict[int, tuple[Media, datetime]]: Cached media and the time they were
+                fetched, keyed by AniList ID. Missing and expired entries are
+                omitted.
+        """
+        ids = list(set(anilist_ids))
+        if not ids:
+            return {}
+
+        now = datetime.now(UTC)
+        res: dict[int, tuple[Media, datetime]] = {}
+
+        with db() as ctx:
+            rows = ctx.session.execute(
+                select(AniListMedia).where(AniListMedia.anilist_id.in_(ids))
+            ).scalars()
+
+            for row in rows:
+                fetched_at = row.fetched_at
+                if fetched_at.tzinfo is None:  # SQLite drops the timezone
+                    fetched_at = fetched_at.replace(tzinfo=UTC)
+                if now - fetched_at > self._get_ttl(row.status):
+                    continue
+                res[row.anilist_id] = (Media(**row.data), fetched_at)
+
+        return res
+
+    def put_many(self, media: Iterable[MediaWithoutList]) -> None:
+        """Store media entries in the cache.
+
+        Args:
+            media (Iterable[MediaWithoutList]): Media entries to store. Any user
+                list information is discarded.
+        """
+        now = datetime.now(UTC)
+        entries = {
+            m.id: AniListMedia(
+                anilist_id=m.id,
+                status=m.status.value if m.status else None,
+                data=m.model_dump(mode="json", exclude={"media_list_entry"}),
+                fetched_at=now,
+            )
+            for m in media
+        }
+        if not entries:
+            return
+
+        with db() as ctx:
+            for entry in entries.values():
+                ctx.session.merge(entry)
+            ctx.session.commit()
+
+            count = ctx.session.scalar(select(func.count()).select_from(AniListMedia))
+            overflow = (count or 0) - self.max_entries
+            if overflow > 0:
+                log.debug(f"Evicting {overflow} entries from the AniList media cache")
+                stale_ids = (
+                    select(AniListMedia.anilist_id)
+                    .order_by(AniListMedia.fetched_at.asc())
+                    .limit(overflow)
+                    .scalar_subquery()
+                )
+                ctx.session.execute(
+                    delete(AniListMedia).where(AniListMedia.anilist_id.in_(stale_ids))
+                )
+                ctx.session.commit()
+
+
+class AniListMediaStore:
+    """Process-wide, in-memory store of AniList media metadata.
+
+    Media metadata does not depend on the user, so every profile shares a single
+    copy per AniList ID instead of each client holding its own. User list entries
+    are stripped before storing and kept by each client. The store sits in front of
+    the persistent AniListMediaCache, expires entries with the same status based
+    TTLs, and is bounded to MAX_ENTRIES, evicting the least recently stored first.
+
+    Media fetched with the SYNC_MINIMAL projection are kept apart from full media,
+    so they are only served to callers needing those fields, and never persisted.
+    """
+
+    def __init__(self, cache: AniListMediaCache | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            cache (AniListMediaCache | None): Persistent cache backing the store;
+                a new AniListMediaCache when None.
+        """
+        self.cache = cache or AniListMediaCache()
+        self._media: dict[int, tuple[Media, datetime]] = {}
+        self._minimal: dict[int, tuple[Media, datetime]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of full media held in memory."""
+        return len(self._media)
+
+    @staticmethod
+    def _lookup(
+        tier: dict[int, tuple[Media, datetime]], anilist_id: int, now: datetime
+    ) -> Media | None:
+        """Get a fresh media from a tier of the store, dropping it if expired.
+
+        Args:
+            tier (dict[int, tuple[Media, datetime]]): Tier to look in
+            anilist_id (int): AniList ID of the media
+            now (datetime): Current time
+
+        Returns:
+            Media | None: The media, None if missing or expired.
+        """
+        stored = tier.get(anilist_id)
+        if stored is None:
+            return None
+        media, fetched_at = stored
+        if now - fetched_at > AniListMediaCache._get_ttl(
+            media.status.value if media.status else None
+        ):
+            del tier[anilist_id]
+            return None
+        return media
+
+    def get_many(
+        self,
+        anilist_ids: Iterable[int],
+        projection: MediaProjection = MediaProjection.UI_DISPLAY,
+    ) -> dict[int, Media]:
+        """Retrieve fresh media metadata, reading misses from the persistent cache.
+
+        Args:
+            anilist_ids (Iterable[int]): AniList IDs to look up
+            projection (MediaProjection): Media fields the caller needs
+
+        Returns:
+            dict[int, Media]: Media without list entries keyed by AniList ID. Missing
+                and expired entries are omitted.
+        """
+        now = datetime.now(UTC)
+        res: dict[int, Media] = {}
+        missing: list[int] = []
+
+        for anilist_id in dict.fromkeys(anilist_ids):
+            media = self._lookup(self._media, anilist_id, now)
+            if media is None and projection == MediaProjection.SYNC_MINIMAL:
+                media = self._lookup(self._minimal, anilist_id, now)
+            if media is None:
+                missing.append(anilist_id)
+            else:
+                res[anilist_id] = media
+
+        if missing:
+            # Persisted entries keep their fetch time so their TTL is not restarted
+            for anilist_id, (media, fetched_at) in self.cache.get_many(missing).items():
+                self._insert(self._media, anilist_id, media, fetched_at)
+                res[anilist_id] = media
+
+        return res
+
+    def put_many(
+        self,
+        media: Iterable[MediaWithoutList],
+        projection: MediaProjection = MediaProjection.UI_DISPLAY,
+    ) -> None:
+        """Store media metadata, discarding any user list information.
+
+        Args:
+            media (Iterable[MediaWithoutList]): Media entries to store
+            projection (MediaProjection): Media fields the entries were fetched
+                with. Only full media are written to the persistent cache.
+        """
+        now = datetime.now(UTC)
+        stripped = [self._strip(m) for m in media]
+        if not stripped:
+            return
+
+        if projection == MediaProjection.SYNC_MINIMAL:
+            for m in stripped:
+                self._insert(self._minimal, m.id, m, now)
+            return
+
+        for m in stripped:
+            self._insert(self._media, m.id, m, now)
+            self._minimal.pop(m.id, None)
+        self.cache.put_many(stripped)
+
+    def clear(self) -> None:
+        """Drop every media held in memory."""
+        self._media.clear()
+        self._minimal.clear()
+
+    def _insert(
+        self,
+        tier: dict[int, tuple[Media, datetime]],
+        anilist_id: int,
+        media: Media,
+        fetched_at: datetime,
+    ) -> None:
+        """Insert a media into a tier of the store, evicting the oldest if full.
+
+        Args:
+            tier (dict[int, tuple[Media, datetime]]): Tier to insert into
+            anilist_id (int): AniList ID of the media
+            media (Media): Media without list entry
+            fetched_at (datetime): Time the media was fetched
+        """
+        tier.pop(anilist_id, None)  # Move the entry to the end of the eviction order
+        tier[anilist_id] = (media, fetched_at)
+        while len(tier) > self.cache.max_entries:
+            del tier[next(iter(tier))]
+
+    @staticmethod
+    def _strip(media: MediaWithoutList) -> Media:
+        """Get the metadata of a media without its list entry.
+
+        Args:
+            media (MediaWithoutList): Media, with or without list entry
+
+        Returns:
+            Media: The media with no list entry attached.
+        """
+        if isinstance(media, Media):
+            if media.media_list_entry is None:
+                return media
+            return media.model_copy(update={"media_list_entry": None})
+        return Media(**dict(media))
+
+
+# Global media store shared by every AniList client in the process
+shared_media_store = AniListMediaStore()
@@ -0,0 +1,311 @@
+"""AniList Outbox Module."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select
+
+from src import log
+from src.config.database import db
+from src.core.anilist import AniListClient
+from src.models.db.anilist_outbox import AniListOutboxEntry
+from src.models.schemas.anilist import MediaList
+
+__all__ = ["AniListOutbox"]
+
+
+class AniListOutbox:
+    """Durable write-behind outbox of AniList list entry updates for a profile.
+
+    Updates are persisted before they are sent, so they survive failed requests and
+    restarts. Pending updates are coalesced per media, with the newest update
+    replacing older ones. Flushing writes every due update with packed batch
+    mutations; failed updates are retried with exponential backoff and dropped after
+    MAX_ATTEMPTS.
+
+    Each update remembers the `updatedAt` of the AniList entry it was computed from.
+    Updates whose entry was changed on AniList since are dropped instead of written,
+    so they do not overwrite newer changes. The next sync computes them again from
+    the current AniList state.
+    """
+
+    BASE_RETRY_DELAY = timedelta(minutes=1)
+    MAX_RETRY_DELAY = timedelta(hours=6)
+    MAX_ATTEMPTS = 10
+
+    def __init__(self, anilist_client: AniListClient, profile_name: str) -> None:
+        """Initialize the outbox.
+
+        Args:
+            anilist_client (AniListClient): Client used to write the updates
+            profile_name (str): Name of the profile owning the updates
+        """
+        self.anilist_client = anilist_client
+        self.profile_name = profile_name
+        self._lock = asyncio.Lock()
+
+        with db() as ctx:
+            self._pending_ids: set[int] = set(
+                ctx.session.scalars(
+                    select(AniListOutboxEntry.media_id).where(
+                        AniListOutboxEntry.profile_name == profile_name
+                    )
+                )
+            )
+
+    def __len__(self) -> int:
+        """Return the number of pending updates."""
+        return len(self._pending_ids)
+
+    def __contains__(self, media_id: object) -> bool:
+        """Check whether an update for the given media is pending."""
+        return media_id in self._pending_ids
+
+    def is_due(self) -> bool:
+        """Check whether any pending update is due to be written.
+
+        Returns:
+            bool: True if an update is due.
+        """
+        if not self._pending_ids:
+            return False
+
+        with db() as ctx:
+            return (
+                ctx.session.scalar(
+                    select(AniListOutboxEntry.id)
+                    .where(
+                        AniListOutboxEntry.profile_name == self.profile_name,
+                        AniListOutboxEntry.next_attempt_at <= datetime.now(UTC),
+                    )
+                    .limit(1)
+                )
+                is not None
+            )
+
+    @staticmethod
+    def _as_utc(value: datetime | None) -> datetime | None:
+        """Restore the timezone SQLite drops from stored datetimes."""
+        if value is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=UTC)
+
+    def _get_retry_delay(self, attempts: int) -> timedelta:
+        """Get the delay before retrying an update.
+
+        Args:
+            attempts (int): Number of failed attempts so far
+
+        Returns:
+            timedelta: How long to wait before the next attempt.
+        """
+        return min(
+            self.BASE_RETRY_DELAY * 2 ** max(attempts - 1, 0), self.MAX_RETRY_DELAY
+        )
+
+    def enqueue(self, entries: Iterable[MediaList]) -> None:
+        """Persist list entry updates, replacing pending updates for the same media.
+
+        Args:
+            entries (Iterable[MediaList]): The updated list entries
+        """
+        updates = {entry.media_id: entry for entry in entries}
+        if not updates:
+            return
+
+        now = datetime.now(UTC)
+        with db() as ctx:
+            existing = {
+                row.media_id: row
+                for row in ctx.session.scalars(
+                    select(AniListOutboxEntry).where(
+                        AniListOutboxEntry.profile_name == self.profile_name,
+                        AniListOutboxEntry.media_id.in_(updates),
+                    )
+                )
+            }
+
+            for media_id, entry in updates.items():
+                payload = entry.model_dump(mode="json")
+                row = existing.get(media_id)
+                if row is None:
+                    ctx.session.add(
+                        AniListOutboxEntry(
+                            profile_name=self.profile_name,
+                            media_id=media_id,
+                            payload=payload,
+                            base_updated_at=entry.updated_at,
+                            revision=0,
+                            attempts=0,
+                            next_attempt_at=now,
+                        )
+                    )
+                    continue
+                row.payload = payload
+                row.base_updated_at = entry.updated_at
+                row.revision += 1
+                row.attempts = 0
+                row.last_error = None
+                row.next_attempt_at = now
+
+            ctx.session.commit()
+
+        self._pending_ids.update(updates)
+
+    def discard(self, media_id: int) -> None:
+        """Drop the pending update for a media, if any.
+
+        Args:
+            media_id (int): AniList ID of the media
+        """
+        if media_id not in self._pending_ids:
+            return
+
+        with db() as ctx:
+            ctx.session.execute(
+                delete(AniListOutboxEntry).where(
+                    AniListOutboxEntry.profile_name == self.profile_name,
+                    AniListOutboxEntry.media_id == media_id,
+                )
+            )
+            ctx.session.commit()
+        self._pending_ids.discard(media_id)
+
+    async def flush(self) -> list[int]:
+        """Write every due update to AniList.
+
+        The current AniList entries of the due updates are fetched first, and
+        updates whose entry changed since they were computed are dropped. Updates
+        that are written or dropped are removed from the outbox unless a newer update
+        replaced them in the meantime. On failure, every attempted update is
+        rescheduled with backoff and the error is re-raised.
+
+        Returns:
+            list[int]: AniList IDs of the media whose updates were written.
+
+        Raises:
+            Exception: Any error raised while writing the updates.
+        """
+        async with self._lock:
+            if not self._pending_ids:
+                return []
+
+            now = datetime.now(UTC)
+            with db() as ctx:
+                rows = list(
+                    ctx.session.scalars(
+                        select(AniListOutboxEntry)
+                        .where(
+                            AniListOutboxEntry.profile_name == self.profile_name,
+                            AniListOutboxEntry.next_attempt_at <= now,
+                        )
+                        .order_by(AniListOutboxEntry.id)
+                    )
+                )
+            if not rows:
+                return []
+
+            revisions = {row.media_id: row.revision for row in rows}
+
+            log.debug(
+                f"[{self.profile_name}] Flushing {len(rows)} pending AniList "
+                f"updates $${{anilist_id: {list(revisions)}}}$$"
+            )
+
+            try:
+                current = await self.anilist_client.get_list_entries(list(revisions))
+                stale = [row.media_id for row in rows if self._is_stale(row, current)]
+                if stale:
+                    log.warning(
+                        f"[{self.profile_name}] Dropping {len(stale)} pending AniList "
+                        f"updates of entries changed on AniList since they were "
+                        f"computed $${{anilist_id: {stale}}}$$"
+                    )
+
+                entries = [
+                    MediaList(**row.payload)
+                    for row in rows
+                    if row.media_id not in stale
+                ]
+                if entries:
+                    await self.anilist_client.batch_update_anime_entries(entries)
+            except Exception as e:
+                self._reschedule(revisions, str(e))
+                raise
+
+            with db() as ctx:
+                for media_id, revision in revisions.items():
+                    ctx.session.execute(
+                        delete(AniListOutboxEntry).where(
+                            AniListOutboxEntry.profile_name == self.profile_name,
+                            AniListOutboxEntry.media_id == media_id,
+                            AniListOutboxEntry.revision == revision,
+                        )
+                    )
+                ctx.session.commit()
+
+                self._pending_ids = set(
+                    ctx.session.scalars(
+                        select(AniListOutboxEntry.media_id).where(
+                            AniListOutboxEntry.profile_name == self.profile_name
+                        )
+                    )
+                )
+
+            return [media_id for media_id in revisions if media_id not in stale]
+
+    def _is_stale(
+        self, row: AniListOutboxEntry, current: dict[int, MediaList | None]
+    ) -> bool:
+        """Check whether an update's AniList entry changed since it was computed.
+
+        Args:
+            row (AniListOutboxEntry): The pending update
+            current (dict[int, MediaList | None]): Current AniList entries keyed by
+                AniList ID
+
+        Returns:
+            bool: True if the entry was created, updated or deleted since.
+        """
+        entry = current.get(row.media_id)
+        base_updated_at = self._as_utc(row.base_updated_at)
+        if entry is None or entry.updated_at is None:
+            return base_updated_at is not None
+        return base_updated_at is None or entry.updated_at > base_updated_at
+
+    def _reschedule(self, revisions: dict[int, int], error: str) -> None:
+        """Schedule the retry of updates that failed to be written.
+
+        Args:
+            revisions (dict[int, int]): Attempted revision of each update keyed by
+                AniList ID
+            error (str): Error message of the failure
+        """
+        now = datetime.now(UTC)
+        with db() as ctx:
+            rows = ctx.session.scalars(
+                select(AniListOutboxEntry).where(
+                    AniListOutboxEntry.profile_name == self.profile_name,
+                    AniListOutboxEntry.media_id.in_(revisions),
+                )
+            )
+            for row in rows:
+                if row.revision != revisions[row.media_id]:
+                    continue  # Replaced by a newer update, which is due right away
+
+                row.attempts += 1
+                row.last_error = error
+                if row.attempts >= self.MAX_ATTEMPTS:
+                    log.error(
+                        f"[{self.profile_name}] Giving up on AniList update after "
+                        f"{row.attempts} attempts $${{anilist_id: {row.media_id}}}$$"
+                    )
+                    ctx.session.delete(row)
+                    self._pending_ids.discard(row.media_id)
+                    continue
+
+                row.next_attempt_at = now + self._get_retry_delay(row.attempts)
+            ctx.session.commit()
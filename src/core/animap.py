@@ -20,7 +20,7 @@ from src.models.db.housekeeping import Housekeeping
 from src.models.db.provenance import AniMapProvenance
 from src.utils.sql import json_array_contains
 
-__all__ = ["AniMapClient"]
+__all__ = ["AniMapClient", "AniMapIndex"]
 
 
 if TYPE_CHECKING:
@@ -411,3 +411,101 @@ class AniMapClient:
             query = select(AniMap).where(where_clause)
 
             yield from ctx.session.execute(query).scalars()
+
+
+class AniMapIndex:
+    """In-memory index of mappings prefetched for a set of external IDs.
+
+    Built from the result of a single `AniMapClient.get_mappings()` call, the index
+    answers the same lookups for any subset of the prefetched IDs without querying
+    the database again.
+    """
+
+    def __init__(
+        self,
+        animappings: Iterable[AniMap],
+        imdb: list[str],
+        tmdb: list[int],
+        tvdb: list[int],
+        is_movie: bool,
+    ) -> None:
+        """Initializes the index.
+
+        Args:
+            animappings (Iterable[AniMap]): Mappings returned for the prefetched IDs
+            imdb (list[str]): IMDB IDs the mappings were prefetched for
+            tmdb (list[int]): TMDB IDs the mappings were prefetched for
+            tvdb (list[int]): TVDB IDs the mappings were prefetched for
+            is_movie (bool): Whether the mappings were prefetched for movies
+        """
+        self.is_movie = is_movie
+        self._prefetched = {"imdb": set(imdb), "tmdb": set(tmdb), "tvdb": set(tvdb)}
+        self._order: dict[int, int] = {}
+        self._index: dict[tuple[str, int | str], list[AniMap]] = {}
+
+        for animapping in animappings:
+            if animapping.anilist_id in self._order:
+                continue
+            self._order[animapping.anilist_id] = len(self._order)
+
+            keys: list[tuple[str, int | str]] = [
+                ("imdb", imdb_id) for imdb_id in animapping.imdb_id or []
+            ]
+            if is_movie:
+                keys.extend(
+                    ("tmdb", tmdb_id) for tmdb_id in animapping.tmdb_movie_id or []
+                )
+            else:
+                if animapping.tmdb_show_id is not None:
+                    keys.append(("tmdb", animapping.tmdb_show_id))
+                if animapping.tvdb_id is not None:
+                    keys.append(("tvdb", animapping.tvdb_id))
+
+            for key in keys:
+                self._index.setdefault(key, []).append(animapping)
+
+    def get_mappings(
+        self,
+        imdb: str | None = None,
+        tmdb: int | None = None,
+        tvdb: int | None = None,
+        is_movie: bool = True,
+    ) -> list[AniMap] | None:
+        """Retrieve anime ID mappings from the index.
+
+        Matches the semantics of `AniMapClient.get_mappings()` for single IDs.
+
+        Args:
+            imdb: IMDB ID to match.
+            tmdb: TMDB ID to match.
+            tvdb: TVDB ID to match, for TV shows only.
+            is_movie: Whether the search is for a movie or TV show.
+
+        Returns:
+            list[AniMap] | None: Matching anime mapping entries, or None if the IDs
+                were not prefetched and the database has to be queried instead.
+        """
+        if is_movie != self.is_movie:
+            return None
+
+        if not imdb and not tmdb and not tvdb:
+            return []
+
+        keys: list[tuple[str, int | str]] = []
+        if isinstance(imdb, str):
+            keys.append(("imdb", imdb))
+        if isinstance(tmdb, int):
+            keys.append(("tmdb", tmdb))
+        if not is_movie and isinstance(tvdb, int):
+            keys.append(("tvdb", tvdb))
+
+        # Lookups the index cannot answer exactly are left to the database
+        if not keys or any(value not in self._prefetched[kind] for kind, value in keys):
+            return None
+
+        matches = {
+            animapping.anilist_id: animapping
+            for key in keys
+            for animapping in self._index.get(key, [])
+        }
+        return sorted(matches.values(), key=lambda m: self._order[m.anilist_id])
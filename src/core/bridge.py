@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from src import log
 from src.config.database import db
-from src.config.settings import PlexAnibridgeConfig, PlexAnibridgeProfileConfig
+from src.config.settings import (
+    PlexAnibridgeConfig,
+    PlexAnibridgeProfileConfig,
+    SyncField,
+)
 from src.core import AniListClient, AniMapClient, PlexClient
+from src.core.anilist import anilist_breaker
+from src.core.anilist_outbox import AniListOutbox
+from src.core.animap import AniMapIndex
+from src.core.pins import pin_index
+from src.core.plex_snapshot import PlexSnapshotStore
 from src.core.sync import BaseSyncClient, MovieSyncClient, ShowSyncClient
 from src.core.sync.base import ParsedGuids
 from src.core.sync.stats import SyncProgress, SyncStats
+from src.exceptions import AniListUnavailableError
 from src.models.db.housekeeping import Housekeeping
 from src.models.db.sync_history import SyncOutcome
+from src.models.schemas.anilist import MediaProjection
 
 __all__ = ["BridgeClient"]
 
@@ -21,6 +33,8 @@ __all__ = ["BridgeClient"]
 if TYPE_CHECKING:
     from plexapi.library import MovieSection, ShowSection
 
+    from src.core.plex import Media
+
 
 class BridgeClient:
     """Single-profile bridge client for synchronizing Plex and AniList libraries.
@@ -63,7 +77,9 @@ class BridgeClient:
             dry_run=profile_config.dry_run,
             profile_name=profile_name,
             backup_retention_days=profile_config.backup_retention_days,
+            persisted_queries=profile_config.anilist_persisted_queries,
         )
+        self.outbox = AniListOutbox(self.anilist_client, profile_name)
 
         self.plex_client = PlexClient(
             plex_token=profile_config.plex_token.get_secret_value(),
@@ -72,7 +88,9 @@ class BridgeClient:
             plex_sections=profile_config.plex_sections,
             plex_genres=profile_config.plex_genres,
             plex_metadata_source=profile_config.plex_metadata_source,
+            plex_watchlist_ttl=profile_config.plex_watchlist_ttl,
         )
+        self.plex_snapshot = PlexSnapshotStore(self.plex_client, profile_name)
 
         self.last_synced = self._get_last_synced()
         self.current_sync: SyncProgress | None = None
@@ -86,6 +104,7 @@ class BridgeClient:
 
         self.plex_client.clear_cache()
         await self.anilist_client.initialize()
+        await self.flush_outbox()
 
         log.info(
             f"[{self.profile_name}] Bridge client "
@@ -117,6 +136,23 @@ class BridgeClient:
         """
         await self.close()
 
+    async def flush_outbox(self) -> None:
+        """Retries AniList updates left pending by earlier failures or restarts."""
+        if not self.outbox.is_due():
+            return
+
+        log.info(
+            f"[{self.profile_name}] Retrying {len(self.outbox)} pending AniList updates"
+        )
+        try:
+            await self.outbox.flush()
+        except Exception:
+            log.warning(
+                f"[{self.profile_name}] Failed to write pending AniList updates, "
+                f"they will be retried later",
+                exc_info=True,
+            )
+
     def _get_last_synced_key(self) -> str:
         """Generate the database key for this profile's last sync timestamp.
 
@@ -160,7 +196,10 @@ class BridgeClient:
             ctx.session.commit()
 
     async def sync(
-        self, poll: bool = False, rating_keys: list[str] | None = None
+        self,
+        poll: bool = False,
+        rating_keys: list[str] | None = None,
+        force: bool = False,
     ) -> None:
         """Initiates the synchronization process for this profile.
 
@@ -169,10 +208,16 @@ class BridgeClient:
         2. Processes the configured Plex sections
         3. Updates sync metadata upon successful completion
 
+        While AniList is unavailable the sync is deferred, and a sync interrupted by
+        an outage stops early without advancing the last synced time, so the
+        remaining items are picked up once AniList recovers.
+
         Args:
             poll (bool): Flag to enable polling scan mode, default False
             rating_keys (list[str] | None): Optional list of Plex rating keys to
                 restrict the sync to.
+            force (bool): Flag to sync items unchanged since their last sync,
+                default False
         """
         log.info(
             f"[{self.profile_name}] Starting "
@@ -182,33 +227,47 @@ class BridgeClient:
             f"-> AniList user $$'{self.anilist_client.user.name}'$$"
         )
 
+        if anilist_breaker.is_open:
+            log.warning(
+                f"[{self.profile_name}] AniList is unavailable, deferring sync until "
+                f"it recovers"
+            )
+            return
+
         sync_start_time = datetime.now(UTC)
 
+        await self.flush_outbox()
+        pin_index.load(self.profile_name)
+
         movie_sync = MovieSyncClient(
             anilist_client=self.anilist_client,
             animap_client=self.animap_client,
             plex_client=self.plex_client,
+            outbox=self.outbox,
             excluded_sync_fields=self.profile_config.excluded_sync_fields,
             full_scan=self.profile_config.full_scan,
             destructive_sync=self.profile_config.destructive_sync,
             search_fallback_threshold=self.profile_config.search_fallback_threshold,
             batch_requests=self.profile_config.batch_requests,
             profile_name=self.profile_name,
+            force=force,
         )
 
         show_sync = ShowSyncClient(
             anilist_client=self.anilist_client,
             animap_client=self.animap_client,
             plex_client=self.plex_client,
+            outbox=self.outbox,
             excluded_sync_fields=self.profile_config.excluded_sync_fields,
             full_scan=self.profile_config.full_scan,
             destructive_sync=self.profile_config.destructive_sync,
             search_fallback_threshold=self.profile_config.search_fallback_threshold,
             batch_requests=self.profile_config.batch_requests,
             profile_name=self.profile_name,
+            force=force,
         )
 
-        plex_sections = self.plex_client.get_sections()
+        plex_sections = await self.plex_client.get_sections()
 
         self.current_sync = SyncProgress(
             state="running",
@@ -224,6 +283,10 @@ class BridgeClient:
 
         try:
             for idx, section in enumerate(plex_sections, start=1):
+                if anilist_breaker.is_open:
+                    raise AniListUnavailableError(
+                        "AniList became unavailable during the sync"
+                    )
                 if self.current_sync is not None:
                     self.current_sync = self.current_sync.model_copy(
                         update={
@@ -246,6 +309,11 @@ class BridgeClient:
                 )
                 sync_stats = sync_stats.combine(section_stats)
 
+            if anilist_breaker.is_open:
+                raise AniListUnavailableError(
+                    "AniList became unavailable during the sync"
+                )
+
             sync_completion_time = datetime.now(UTC)
             duration = sync_completion_time - sync_start_time
 
@@ -271,6 +339,11 @@ class BridgeClient:
                     }"
                 )
 
+        except AniListUnavailableError as e:
+            log.warning(
+                f"[{self.profile_name}] {e}, deferring the remaining items until it "
+                f"recovers ({sync_stats.synced} synced so far)"
+            )
         except Exception as e:
             end_time = datetime.now(UTC)
             duration = end_time - sync_start_time
@@ -319,13 +392,20 @@ class BridgeClient:
             seconds=15
         )
 
-        items = list(
-            self.plex_client.get_section_items(
-                section,
-                min_last_modified=min_last_modified if poll else None,
-                require_watched=not self.profile_config.full_scan,
-                rating_keys=rating_keys,
-            )
+        sync_client: BaseSyncClient = {
+            "movie": movie_sync,
+            "show": show_sync,
+        }[section.type]
+        sync_client.mapping_index = None
+
+        # Needed to tell whether items are unchanged before they are fetched
+        await self.plex_client.prefetch_watchlist()
+        items = await self.plex_snapshot.get_items(
+            section,
+            min_last_modified=min_last_modified if poll else None,
+            require_watched=not self.profile_config.full_scan,
+            rating_keys=rating_keys,
+            unchanged=sync_client.is_unchanged,
         )
 
         if self.current_sync is not None:
@@ -349,12 +429,17 @@ class BridgeClient:
             imdb_ids = [guid.imdb for guid in parsed_guids if guid.imdb is not None]
             tmdb_ids = [guid.tmdb for guid in parsed_guids if guid.tmdb is not None]
             tvdb_ids = [guid.tvdb for guid in parsed_guids if guid.tvdb is not None]
+            is_movie = section.type != "show"
 
             animappings = list(
                 self.animap_client.get_mappings(
-                    imdb_ids, tmdb_ids, tvdb_ids, is_movie=section.type != "show"
+                    imdb_ids, tmdb_ids, tvdb_ids, is_movie=is_movie
                 )
             )
+            # Let the per-item mappers reuse the prefetched mappings
+            sync_client.mapping_index = AniMapIndex(
+                animappings, imdb_ids, tmdb_ids, tvdb_ids, is_movie=is_movie
+            )
             anilist_ids = [
                 a.anilist_id for a in animappings if a.anilist_id is not None
             ]
@@ -370,17 +455,82 @@ class BridgeClient:
                     update={"stage": "prefetching"}
                 )
 
-            await self.anilist_client.batch_get_anime(anilist_ids)
+            await self.anilist_client.batch_get_anime(
+                anilist_ids, MediaProjection.SYNC_MINIMAL
+            )
 
-        sync_client: BaseSyncClient = {
-            "movie": movie_sync,
-            "show": show_sync,
-        }[section.type]
+        if items:
+            await asyncio.gather(
+                self.plex_client.prefetch_show_children(section, items),
+                self.plex_client.prefetch_history(section, items),
+            )
+            if SyncField.NOTES not in self.profile_config.excluded_sync_fields:
+                await self.plex_client.prefetch_reviews(items)
 
+        queue: asyncio.Queue[Media] = asyncio.Queue()
         for item in items:
+            queue.put_nowait(item)
+
+        worker_count = max(1, min(self.profile_config.sync_concurrency, len(items)))
+        if worker_count > 1:
+            log.debug(
+                f"[{self.profile_name}] Processing {len(items)} items "
+                f"with {worker_count} concurrent workers"
+            )
+
+        try:
+            await asyncio.gather(
+                *(self._process_items(sync_client, queue) for _ in range(worker_count))
+            )
+
+            if self.profile_config.batch_requests:
+                if self.current_sync is not None:
+                    self.current_sync = self.current_sync.model_copy(
+                        update={"stage": "finalizing"}
+                    )
+                await sync_client.batch_sync()
+        finally:
+            self.plex_client.clear_show_children()
+            self.plex_client.clear_history()
+            self.plex_client.clear_reviews()
+            sync_client.history.flush()
+            sync_client.mapping_index = None
+
+        return sync_client.sync_stats
+
+    async def _process_items(
+        self, sync_client: BaseSyncClient, queue: asyncio.Queue[Media]
+    ) -> None:
+        """Worker that processes queued Plex items until the queue is drained.
+
+        Several workers may share the same queue. All shared state (sync stats,
+        progress and queued batch requests) is only mutated between awaits, so the
+        workers can safely run concurrently on the event loop. Workers stop early
+        while AniList is unavailable, leaving the remaining items for the next sync.
+
+        Args:
+            sync_client (BaseSyncClient): Sync client for the section's media type
+            queue (asyncio.Queue[Media]): Queue of Plex items left to process
+        """
+        while not anilist_breaker.is_open:
             try:
-                await sync_client.process_media(item)
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
+            try:
+                await sync_client.process_media(item)
+            except AniListUnavailableError:
+                log.warning(
+                    f"[{self.profile_name}] AniList is unavailable, deferring "
+                    f"$$'{item.title}'$$"
+                )
+            except Exception:
+                log.error(
+                    f"[{self.profile_name}] Failed to sync item $$'{item.title}'$$",
+                    exc_info=True,
+                )
+            else:
                 if self.current_sync is not None:
                     self.current_sync = self.current_sync.model_copy(
                         update={
@@ -390,18 +540,5 @@ class BridgeClient:
                             ),
                         }
                     )
-
-            except Exception:
-                log.error(
-                    f"[{self.profile_name}] Failed to sync item $$'{item.title}'$$",
-                    exc_info=True,
-                )
-
-        if self.profile_config.batch_requests:
-            if self.current_sync is not None:
-                self.current_sync = self.current_sync.model_copy(
-                    update={"stage": "finalizing"}
-                )
-            await sync_client.batch_sync()
-
-        return sync_client.sync_stats
+            finally:
+                queue.task_done()
@@ -11,7 +11,8 @@ from urllib.parse import urljoin, urlparse
 import aiohttp
 import yaml
 
-from src import __version__, log
+from src import log
+from src.utils.requests import create_client_session
 
 __all__ = ["AniMapDict", "MappingsClient"]
 
@@ -48,9 +49,8 @@ class MappingsClient:
             headers = {
                 "Accept": "application/json",
                 "Content-Type": "application/json",
-                "User-Agent": f"PlexAniBridge/{__version__}",
             }
-            self._session = aiohttp.ClientSession(headers=headers)
+            self._session = create_client_session(headers)
         return self._session
 
     async def close(self):
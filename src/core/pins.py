@@ -0,0 +1,93 @@
+"""Pin Index Module."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+
+from sqlalchemy import select
+
+from src import log
+from src.config.database import db
+from src.models.db.pin import Pin
+
+__all__ = ["PinIndex", "pin_index"]
+
+
+class PinIndex:
+    """In-memory index of the pinned AniList fields of every profile.
+
+    A profile's pins are loaded with a single query, at the start of each sync or
+    on first use, and then served from memory. Changes made through the pin service
+    are pushed to the index with `notify()`, so syncs never query pins per entry.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pin index."""
+        self._pins: dict[str, dict[int, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, profile_name: str) -> None:
+        """Loads the pins of a profile from the database.
+
+        Args:
+            profile_name (str): Name of the profile
+        """
+        with db() as ctx:
+            pins = {
+                pin.anilist_id: list(pin.fields)
+                for pin in ctx.session.scalars(
+                    select(Pin).where(Pin.profile_name == profile_name)
+                )
+                if pin.fields
+            }
+
+        with self._lock:
+            self._pins[profile_name] = pins
+        log.debug(f"[{profile_name}] Loaded {len(pins)} pinned AniList entries")
+
+    def get(self, profile_name: str, anilist_id: int) -> list[str]:
+        """Gets the pinned fields of an AniList entry.
+
+        Args:
+            profile_name (str): Name of the profile
+            anilist_id (int): AniList ID of the entry
+
+        Returns:
+            list[str]: The pinned fields, empty if the entry is not pinned.
+        """
+        if profile_name not in self._pins:
+            self.load(profile_name)
+        return self._pins[profile_name].get(anilist_id, [])
+
+    def notify(
+        self, profile_name: str, anilist_id: int, fields: Iterable[str] | None
+    ) -> None:
+        """Applies a change of the pinned fields of an AniList entry.
+
+        Profiles that were not loaded yet are left alone, their pins are read from
+        the database once they are needed.
+
+        Args:
+            profile_name (str): Name of the profile
+            anilist_id (int): AniList ID of the entry
+            fields (Iterable[str] | None): The new pinned fields, None or empty if
+                the pin was deleted
+        """
+        with self._lock:
+            pins = self._pins.get(profile_name)
+            if pins is None:
+                return
+            if fields:
+                pins[anilist_id] = list(fields)
+            else:
+                pins.pop(anilist_id, None)
+
+    def clear(self) -> None:
+        """Drops the pins of every profile."""
+        with self._lock:
+            self._pins.clear()
+
+
+# Global pin index shared by the sync clients and the pin service
+pin_index = PinIndex()
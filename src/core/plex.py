@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import asyncio
+import time
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
-from math import isnan
+from math import ceil, isnan
 from urllib.parse import urlparse
 from xml.etree import ElementTree
 
 import plexapi.utils
 from async_lru import alru_cache
-from cachetools.func import ttl_cache
 from plexapi.library import LibrarySection, MovieSection, ShowSection
 from plexapi.myplex import MyPlexUser
 from plexapi.server import PlexServer
@@ -26,6 +27,7 @@ from src.exceptions import (
     PlexUserNotFoundError,
 )
 from src.plex.community import PlexCommunityClient
+from src.plex.executor import PlexExecutor
 from src.plex.metadata import PlexMetadataServer
 from src.utils.requests import SelectiveVerifySession
 
@@ -42,8 +44,14 @@ class PlexClient:
     This client provides methods to interact with both the Plex Media Server and Plex
     API, including accessing media sections, retrieving watch history, and managing
     user-specific features like watchlists and continue watching states.
+
+    Methods that perform network requests through plexapi are coroutines that run the
+    underlying blocking call on a shared thread pool, keeping the event loop free.
     """
 
+    PREFETCH_PAGE_SIZE = 1000
+    FETCH_BATCH_SIZE = 200  # Rating keys per request, keeping URLs short
+
     def __init__(
         self,
         plex_token: str,
@@ -52,6 +60,7 @@ class PlexClient:
         plex_sections: list[str],
         plex_genres: list[str],
         plex_metadata_source: PlexMetadataSource,
+        plex_watchlist_ttl: int = 300,
     ) -> None:
         """Initialize the Plex client with user credentials and server details."""
         self.plex_token = plex_token
@@ -60,7 +69,19 @@ class PlexClient:
         self.plex_sections = plex_sections
         self.plex_genres = plex_genres
         self.plex_metadata_source = plex_metadata_source
+        self.plex_watchlist_ttl = plex_watchlist_ttl
+
+        self.executor = PlexExecutor(plex_url)
 
+        self._season_index: dict[str, list[Season]] = {}
+        self._episode_index: dict[str, list[Episode]] = {}
+        self._history_index: dict[str, list[EpisodeHistory | MovieHistory]] = {}
+        self._review_index: dict[str, str | None] = {}
+        self._sections: dict[int, Section] = {}
+        self._watchlist_guids: frozenset[str] | None = None
+        self._watchlist_fetched_at = 0.0
+
+        self._session: SelectiveVerifySession
         self.admin_client: PlexServer
         self.user_client: PlexServer
         self.online_client: PlexMetadataServer | None
@@ -77,6 +98,8 @@ class PlexClient:
         """Close async clients."""
         if hasattr(self, "community_client"):
             await self.community_client.close()
+        if hasattr(self, "_session"):
+            self._session.close()
 
     async def __aenter__(self) -> PlexClient:
         """Context manager enter method.
@@ -110,11 +133,12 @@ class PlexClient:
         Handles authentication and client setup for the admin account.
         """
         parsed_url = urlparse(self.plex_url)
-        session = None
-        if parsed_url.scheme == "https":
-            session = SelectiveVerifySession(whitelist=[parsed_url.hostname])
+        self._session = SelectiveVerifySession(
+            whitelist=[parsed_url.hostname] if parsed_url.scheme == "https" else None,
+            pool_maxsize=PlexExecutor.MAX_WORKERS,
+        )
 
-        self.admin_client = PlexServer(self.plex_url, self.plex_token, session)
+        self.admin_client = PlexServer(self.plex_url, self.plex_token, self._session)
 
     def _init_online_client(self) -> None:
         """Initializes the Plex client for the online metadata source.
@@ -122,7 +146,9 @@ class PlexClient:
         Handles authentication and client setup for the online metadata source.
         """
         if self.plex_metadata_source == PlexMetadataSource.ONLINE:
-            self.online_client = PlexMetadataServer(self.plex_url, self.plex_token)
+            self.online_client = PlexMetadataServer(
+                self.plex_url, self.plex_token, self._session
+            )
         else:
             self.online_client = None
 
@@ -240,7 +266,7 @@ class PlexClient:
             raise InvalidGuidError("GUID cannot be None or empty")
         return guid.rsplit("/", 1)[-1]
 
-    def get_sections(self) -> list[Section]:
+    async def get_sections(self) -> list[Section]:
         """Retrieves configured Plex library sections.
 
         Returns only the sections that are specified in self.plex_sections,
@@ -257,23 +283,42 @@ class PlexClient:
 
         sections = {
             section.title: section
-            for section in self.user_client.library.sections()
+            for section in await self.executor.run(self.user_client.library.sections)
             if isinstance(section, (MovieSection, ShowSection))
         }
+        self._sections = {section.key: section for section in sections.values()}
         if self.plex_sections:
             return [
                 sections[title] for title in self.plex_sections if title in sections
             ]
         return list(sections.values())
 
-    def get_section_items(
+    async def get_section(self, item: Media) -> Section:
+        """Retrieves the library section an item belongs to.
+
+        Sections are cached by their ID, so only the first lookup for a section
+        not already returned by `get_sections()` performs a request.
+
+        Args:
+            item (Media): Media item to get the section of
+
+        Returns:
+            Section: The item's library section
+        """
+        section = self._sections.get(item.librarySectionID)
+        if section is None:
+            section = await self.executor.run(item.section)
+            self._sections[section.key] = section
+        return section
+
+    async def get_section_items(
         self,
         section: Section,
         min_last_modified: datetime | None = None,
         require_watched: bool = False,
         rating_keys: list[str] | None = None,
         **kwargs,
-    ) -> Iterator[Media]:
+    ) -> list[Media]:
         """Retrieve items from a specified Plex library section with optional filtering.
 
         Args:
@@ -287,8 +332,8 @@ class PlexClient:
                 be yielded. (Strings or ints coerced to string)
             **kwargs: Additional keyword arguments passed to section.search().
 
-        Yields:
-            Media: Media items matching the criteria.
+        Returns:
+            list[Media]: Media items matching the criteria.
 
         Raises:
             MediaTypeError: If the section type is unsupported.
@@ -394,20 +439,297 @@ class PlexClient:
             filters["and"].append({"genre": self.plex_genres})
 
         # Perform base search
-        items = section.search(filters=filters, **kwargs)
+        items = await self.executor.run(section.search, filters=filters, **kwargs)
 
         if rating_keys:
             rk_set = {str(rk) for rk in rating_keys}
-            yield from (i for i in items if str(i.ratingKey) in rk_set)
-        else:
-            yield from items
+            return [i for i in items if str(i.ratingKey) in rk_set]
+        return items
+
+    async def fetch_items(self, rating_keys: list[str]) -> list[Media]:
+        """Retrieves items by their rating keys in batched requests.
+
+        Items that no longer exist on the server are left out.
+
+        Args:
+            rating_keys (list[str]): Rating keys of the items to retrieve
+
+        Returns:
+            list[Media]: The items found, as seen by the Plex user.
+        """
+        if not rating_keys:
+            return []
+
+        batches = await asyncio.gather(
+            *(
+                self.executor.run(
+                    self.user_client.fetchItems,
+                    [int(rk) for rk in rating_keys[i : i + self.FETCH_BATCH_SIZE]],
+                )
+                for i in range(0, len(rating_keys), self.FETCH_BATCH_SIZE)
+            )
+        )
+        return [item for batch in batches for item in batch]
+
+    async def prefetch_show_children(
+        self, section: Section, items: list[Media]
+    ) -> None:
+        """Bulk fetches the seasons and episodes of a show section.
+
+        Instead of requesting the children of every show individually (two requests
+        per show), all seasons and episodes of the section are listed with a few
+        paginated requests and grouped by their parent show. Subsequent calls to
+        `get_seasons()` and `get_episodes()` for the given shows are served from the
+        resulting index until `clear_show_children()` is called.
+
+        The prefetch is skipped for movie sections and when listing the whole section
+        would take more requests than fetching the children show by show.
+
+        Args:
+            section (Section): Library section containing the shows
+            items (list[Media]): Shows whose children should be indexed
+        """
+        self.clear_show_children()
+
+        if self.is_online_user or section.TYPE != "show" or not items:
+            return
+
+        season_total, episode_total = await asyncio.gather(
+            self.executor.run(
+                section.totalViewSize, libtype="season", includeCollections=False
+            ),
+            self.executor.run(
+                section.totalViewSize, libtype="episode", includeCollections=False
+            ),
+        )
+        page_count = ceil(season_total / self.PREFETCH_PAGE_SIZE) + ceil(
+            episode_total / self.PREFETCH_PAGE_SIZE
+        )
+        if page_count >= len(items) * 2:
+            log.debug(
+                f"Skipping bulk prefetch of section $$'{section.title}'$$, "
+                f"fetching {len(items)} shows individually is cheaper"
+            )
+            return
+
+        log.debug(
+            f"Prefetching {season_total} seasons and {episode_total} episodes "
+            f"from section $$'{section.title}'$$"
+        )
+
+        seasons, episodes = await asyncio.gather(
+            self.executor.run(
+                section.search,
+                libtype="season",
+                container_size=self.PREFETCH_PAGE_SIZE,
+            ),
+            self.executor.run(
+                section.search,
+                libtype="episode",
+                container_size=self.PREFETCH_PAGE_SIZE,
+            ),
+        )
+
+        rating_keys = {str(item.ratingKey) for item in items}
+        season_index: defaultdict[str, list[Season]] = defaultdict(list)
+        episode_index: defaultdict[str, list[Episode]] = defaultdict(list)
+
+        for season in seasons:
+            if str(season.parentRatingKey) in rating_keys:
+                season_index[str(season.parentRatingKey)].append(season)
+        for episode in episodes:
+            if str(episode.grandparentRatingKey) in rating_keys:
+                episode_index[str(episode.grandparentRatingKey)].append(episode)
+
+        self._season_index = {
+            rk: sorted(season_index[rk], key=lambda s: s.index or 0)
+            for rk in rating_keys
+        }
+        self._episode_index = {
+            rk: sorted(
+                episode_index[rk], key=lambda e: (e.parentIndex or 0, e.index or 0)
+            )
+            for rk in rating_keys
+        }
+
+    def clear_show_children(self) -> None:
+        """Discards the season and episode index built by `prefetch_show_children()`."""
+        self._season_index = {}
+        self._episode_index = {}
+
+    async def prefetch_history(self, section: Section, items: list[Media]) -> None:
+        """Bulk fetches the user's watch history for a library section.
+
+        The section's history is listed in large pages and indexed by the rating key
+        of the watched item and of its grandparent show, so that `get_history()` can
+        answer with a dictionary lookup instead of one request per item. The index is
+        kept until `clear_history()` is called.
+
+        The prefetch is skipped when the history spans more pages than there are
+        items to look up. For online metadata users, the watch activity of all items
+        is fetched from the community API in batched requests instead.
+
+        Args:
+            section (Section): Library section containing the items
+            items (list[Media]): Items whose history should be indexed
+        """
+        self.clear_history()
+
+        if not items:
+            return
+
+        if self.is_online_user:
+            if self.online_client:
+                await self._prefetch_watch_activity(items, self.online_client._server)
+            return
+
+        args = {
+            "sort": "viewedAt:desc",
+            "accountID": self.user_account_id,
+            "librarySectionID": section.key,
+        }
+        key = f"/status/sessions/history/all{plexapi.utils.joinArgs(args)}"
+
+        container = await self.executor.run(
+            self.admin_client.query,
+            key,
+            params={"X-Plex-Container-Start": 0, "X-Plex-Container-Size": 0},
+        )
+        total_size = container.attrib.get("totalSize")
+        if total_size is None:
+            return
+
+        if ceil(int(total_size) / self.PREFETCH_PAGE_SIZE) >= len(items):
+            log.debug(
+                f"Skipping history prefetch of section $$'{section.title}'$$, "
+                f"fetching {len(items)} items individually is cheaper"
+            )
+            return
+
+        log.debug(
+            f"Prefetching {total_size} history entries "
+            f"from section $$'{section.title}'$$"
+        )
+
+        entries: list[EpisodeHistory | MovieHistory] = await self.executor.run(
+            self.admin_client.fetchItems,
+            key,
+            container_size=self.PREFETCH_PAGE_SIZE,
+        )
+
+        index: dict[str, list[EpisodeHistory | MovieHistory]] = {
+            str(item.ratingKey): [] for item in items
+        }
+        for entry in entries:
+            for rating_key in {
+                entry.ratingKey,
+                getattr(entry, "grandparentRatingKey", None),
+            }:
+                if rating_key is not None and str(rating_key) in index:
+                    index[str(rating_key)].append(entry)
+
+        self._history_index = index
+
+    async def _prefetch_watch_activity(
+        self, items: list[Media], server: PlexServer
+    ) -> None:
+        """Bulk fetches the community watch activity of items into the history index.
+
+        Args:
+            items (list[Media]): Items whose watch activity should be indexed
+            server (PlexServer): Server the history entries are bound to
+        """
+        keyed_items = {
+            self._guid_to_key(item.guid): item for item in items if item.guid
+        }
+
+        try:
+            activity = await self.community_client.batch_get_watch_activity(
+                list(keyed_items)
+            )
+        except Exception:
+            log.error("Failed to prefetch watch activity", exc_info=True)
+            return
+
+        self._history_index = {
+            str(item.ratingKey): self._watch_activity_to_history(
+                item, activity.get(key, []), server
+            )
+            for key, item in keyed_items.items()
+        }
+
+    def clear_history(self) -> None:
+        """Discards the history index built by `prefetch_history()`."""
+        self._history_index = {}
+
+    async def get_seasons(self, item: Show) -> list[Season]:
+        """Retrieves all seasons of a show.
+
+        Served from the prefetched section index when available.
+
+        Args:
+            item (Show): Show to get the seasons of
+
+        Returns:
+            list[Season]: Seasons of the show
+        """
+        cached = self._season_index.get(str(item.ratingKey))
+        if cached is not None:
+            return cached
+        return await self.executor.run(item.seasons)
+
+    async def get_episodes(self, item: Show) -> list[Episode]:
+        """Retrieves all episodes of a show.
+
+        Served from the prefetched section index when available.
+
+        Args:
+            item (Show): Show to get the episodes of
+
+        Returns:
+            list[Episode]: Episodes of the show
+        """
+        cached = self._episode_index.get(str(item.ratingKey))
+        if cached is not None:
+            return cached
+        return await self.executor.run(item.episodes)
+
+    async def prefetch_reviews(self, items: list[Media]) -> None:
+        """Bulk fetches the user's reviews for items and their seasons.
+
+        Reviews are requested from the community API in batched requests and kept
+        until `clear_reviews()` is called. Seasons are included for shows whose
+        children were indexed by `prefetch_show_children()`.
+
+        Args:
+            items (list[Media]): Items whose reviews should be indexed
+        """
+        self.clear_reviews()
+
+        if not self.is_admin_user or not items:
+            return
+
+        targets: list[Media] = list(items)
+        for item in items:
+            targets.extend(self._season_index.get(str(item.ratingKey), []))
+        keys = [self._guid_to_key(t.guid) for t in targets if t.guid]
+
+        try:
+            self._review_index = await self.community_client.batch_get_reviews(keys)
+        except Exception:
+            log.error("Failed to prefetch reviews", exc_info=True)
+
+    def clear_reviews(self) -> None:
+        """Discards the review index built by `prefetch_reviews()`."""
+        self._review_index = {}
 
     @alru_cache(maxsize=1024, ttl=30)
     async def get_user_review(self, item: Media) -> str | None:
         """Retrieves user review for a media item from Plex community.
 
         Makes a GraphQL query to the Plex community API to fetch review content.
-        Only works for admin users due to API limitations.
+        Only works for admin users due to API limitations. Served from the
+        prefetched reviews when available.
 
         Args:
             item (Media): Media item to get review for
@@ -425,12 +747,16 @@ class PlexClient:
         if not item.guid:
             return None
 
+        key = self._guid_to_key(item.guid)
+        if key in self._review_index:
+            return self._review_index[key]
+
         try:
             log.debug(
                 f"Getting reviews for {item.type} "
                 f"$$'{item.title}'$$ $${{ plex_id: {item.guid}}}$$"
             )
-            return await self.community_client.get_reviews(self._guid_to_key(item.guid))
+            return await self.community_client.get_reviews(key)
         except Exception:
             log.error(
                 f"Failed to get review for {item.type} $$'{item.title}'$$ "
@@ -439,21 +765,35 @@ class PlexClient:
             )
             return None
 
-    @ttl_cache(ttl=30)
-    def get_continue_watching_hub(
+    @alru_cache(maxsize=32, ttl=30)
+    async def get_continue_watching_index(
         self, section: LibrarySection
-    ) -> list[Episode] | list[Movie]:
-        """Retrieves all items in the Continue Watching hub.
+    ) -> dict[str, Movie | Episode]:
+        """Retrieves the Continue Watching hub of a section indexed by media.
+
+        Episodes are keyed by the rating key of their show and movies by their own
+        rating key. If a show has several entries, the first one in the hub wins.
 
         Args:
             section (MovieSection | ShowSection): The library section to query
 
         Returns:
-            list[Episode] | list[Movie]: The continue watching items
+            dict[str, Movie | Episode]: The continue watching items keyed by the
+                rating key of the show or movie they belong to
         """
-        return section.continueWatching()
+        hub: list[Movie | Episode] = await self.executor.run(section.continueWatching)
+
+        index: dict[str, Movie | Episode] = {}
+        for entry in hub:
+            key = (
+                entry.grandparentRatingKey
+                if entry.type == "episode"
+                else entry.ratingKey
+            )
+            index.setdefault(str(key), entry)
+        return index
 
-    def get_continue_watching(self, item: Movie | Show) -> Movie | Episode | None:
+    async def get_continue_watching(self, item: Movie | Show) -> Movie | Episode | None:
         """Retrieves all items in the Continue Watching hub.
 
         Args:
@@ -465,40 +805,32 @@ class PlexClient:
         if self.is_online_user:
             return None
 
-        if item.type == "show":
-            return next(
-                (
-                    e
-                    for e in self.get_continue_watching_hub(item.section())
-                    if item.ratingKey == e.grandparentRatingKey
-                ),
-                None,
-            )
-        else:
-            return next(
-                (
-                    e
-                    for e in self.get_continue_watching_hub(item.section())
-                    if item.ratingKey == e.ratingKey
-                ),
-                None,
-            )
+        section = await self.get_section(item)
+        index = await self.get_continue_watching_index(section)
+        return index.get(str(item.ratingKey))
 
     @alru_cache(maxsize=1024, ttl=30)
     async def get_history(self, item: Media) -> list[EpisodeHistory | MovieHistory]:
         """Retrieves watch history for a media item.
 
+        Served from the prefetched section history when available.
+
         Args:
             item (Media): Media item(s) to get history for
 
         Returns:
             list[EpisodeHistory | MovieHistory]: Watch history entries for the item
         """
+        cached = self._history_index.get(str(item.ratingKey))
+        if cached is not None:
+            return cached
+
         if not self.is_online_user or not self.online_client:
             args = {"metadataItemID": item.ratingKey, "accountID": self.user_account_id}
             return list(
-                self.admin_client.fetchItems(
-                    f"/status/sessions/history/all{plexapi.utils.joinArgs(args)}"
+                await self.executor.run(
+                    self.admin_client.fetchItems,
+                    f"/status/sessions/history/all{plexapi.utils.joinArgs(args)}",
                 )
             )
 
@@ -506,56 +838,9 @@ class PlexClient:
             data = await self.community_client.get_watch_activity(
                 self._guid_to_key(item.guid)
             )
-            history: list[EpisodeHistory | MovieHistory] = []
-            for entry in data:
-                metadata = entry["metadataItem"]
-                user = entry["userV2"]
-
-                attrib = {
-                    "accountID": str(user["id"]),
-                    "deviceID": "",
-                    "historyKey": f"/status/sessions/history/{entry['id']}",
-                    "ratingKey": metadata["id"],
-                    "guid": metadata["id"],
-                    "title": metadata["title"],
-                }
-
-                if metadata["type"] == "EPISODE":
-                    attrib["parentGuid"] = metadata["parent"]["id"]
-                    attrib["grandparentGuid"] = metadata["grandparent"]["id"]
-                    attrib["index"] = metadata["index"]
-                    attrib["parentIndex"] = metadata["parent"]["index"]
-                    attrib["parentTitle"] = metadata["parent"]["title"]
-                    attrib["grandparentTitle"] = metadata["grandparent"]["title"]
-
-                    history_data = ElementTree.Element("History", attrib=attrib)
-                    h = EpisodeHistory(
-                        server=self.online_client._server, data=history_data
-                    )
-                    h.parentRatingKey = metadata["parent"]["id"]
-                    h.grandparentRatingKey = metadata["grandparent"]["id"]
-                elif metadata["type"] == "MOVIE":
-                    history_data = ElementTree.Element("History", attrib=attrib)
-                    h = MovieHistory(
-                        server=self.online_client._server, data=history_data
-                    )
-                else:
-                    log.debug(
-                        f"Unexpected media type "
-                        f"$$'{metadata['type']}'$$ in watch history for item "
-                        f"$$'{item.title}'$$ $${{plex_id: {item.guid}}}$$"
-                    )
-                    continue
-
-                h.ratingKey = metadata["id"]
-                h.viewedAt = (
-                    datetime.fromisoformat(entry["date"])
-                    .astimezone(get_localzone())
-                    .replace(tzinfo=None)
-                )
-                history.append(h)
-
-            return history
+            return self._watch_activity_to_history(
+                item, data, self.online_client._server
+            )
         except Exception:
             log.error(
                 f"Failed to get watch history for {item.type} $$'{item.title}'$$ "
@@ -564,18 +849,125 @@ class PlexClient:
             )
             return []
 
-    def is_on_watchlist(self, item: Movie | Show) -> bool:
+    def _watch_activity_to_history(
+        self, item: Media, data: list, server: PlexServer
+    ) -> list[EpisodeHistory | MovieHistory]:
+        """Converts Plex Community watch activity into history entries.
+
+        Args:
+            item (Media): Media item the watch activity belongs to
+            data (list): Watch activity nodes returned by the community API
+            server (PlexServer): Server the history entries are bound to
+
+        Returns:
+            list[EpisodeHistory | MovieHistory]: Watch history entries for the item
+        """
+        history: list[EpisodeHistory | MovieHistory] = []
+        for entry in data:
+            metadata = entry["metadataItem"]
+            user = entry["userV2"]
+
+            attrib = {
+                "accountID": str(user["id"]),
+                "deviceID": "",
+                "historyKey": f"/status/sessions/history/{entry['id']}",
+                "ratingKey": metadata["id"],
+                "guid": metadata["id"],
+                "title": metadata["title"],
+            }
+
+            if metadata["type"] == "EPISODE":
+                attrib["parentGuid"] = metadata["parent"]["id"]
+                attrib["grandparentGuid"] = metadata["grandparent"]["id"]
+                attrib["index"] = metadata["index"]
+                attrib["parentIndex"] = metadata["parent"]["index"]
+                attrib["parentTitle"] = metadata["parent"]["title"]
+                attrib["grandparentTitle"] = metadata["grandparent"]["title"]
+
+                history_data = ElementTree.Element("History", attrib=attrib)
+                h = EpisodeHistory(server=server, data=history_data)
+                h.parentRatingKey = metadata["parent"]["id"]
+                h.grandparentRatingKey = metadata["grandparent"]["id"]
+            elif metadata["type"] == "MOVIE":
+                history_data = ElementTree.Element("History", attrib=attrib)
+                h = MovieHistory(server=server, data=history_data)
+            else:
+                log.debug(
+                    f"Unexpected media type "
+                    f"$$'{metadata['type']}'$$ in watch history for item "
+                    f"$$'{item.title}'$$ $${{plex_id: {item.guid}}}$$"
+                )
+                continue
+
+            h.ratingKey = metadata["id"]
+            h.viewedAt = (
+                datetime.fromisoformat(entry["date"])
+                .astimezone(get_localzone())
+                .replace(tzinfo=None)
+            )
+            history.append(h)
+
+        return history
+
+    async def prefetch_watchlist(self) -> None:
+        """Fetches a snapshot of the user's watchlist.
+
+        The full watchlist is downloaded page by page and reduced to a set of GUIDs
+        that `is_on_watchlist()` checks in memory. An existing snapshot is reused
+        until it is older than `plex_watchlist_ttl` seconds.
+        """
+        if not self.is_admin_user:
+            return
+
+        age = time.monotonic() - self._watchlist_fetched_at
+        if self._watchlist_guids is not None and age < self.plex_watchlist_ttl:
+            return
+
+        try:
+            account = await self.executor.run(self.admin_client.myPlexAccount)
+            watchlist = await self.executor.run(account.watchlist)
+        except Exception:
+            log.error("Failed to fetch the Plex watchlist", exc_info=True)
+            self._watchlist_guids = None
+            return
+
+        self._watchlist_guids = frozenset(item.guid for item in watchlist if item.guid)
+        self._watchlist_fetched_at = time.monotonic()
+        log.debug(f"Fetched {len(self._watchlist_guids)} items from the watchlist")
+
+    async def is_on_watchlist(self, item: Movie | Show) -> bool:
         """Checks if a media item is on the user's watchlist.
 
+        Served from the watchlist snapshot when available.
+
         Args:
             item (Movie | Show): Media item to check
 
         Returns:
             bool: True if item is on watchlist, False otherwise
         """
-        return bool(item.onWatchlist()) if self.is_admin_user else False
+        on_watchlist = self.is_guid_on_watchlist(item.guid)
+        if on_watchlist is not None:
+            return on_watchlist
+        return bool(await self.executor.run(item.onWatchlist))
+
+    def is_guid_on_watchlist(self, guid: str | None) -> bool | None:
+        """Checks if a media item is on the user's watchlist by its Plex GUID.
+
+        Args:
+            guid (str | None): Plex GUID of the media item
+
+        Returns:
+            bool | None: True if the item is on the watchlist, None if the watchlist
+                snapshot has not been fetched.
+        """
+        if not self.is_admin_user:
+            return False
+        if self._watchlist_guids is None:
+            return None
+        return guid in self._watchlist_guids
 
-    def is_on_continue_watching(self, item: Movie | Show) -> bool:
+    async def is_on_continue_watching(self, item: Movie | Show) -> bool:
         """Checks if a media item appears in the Continue Watching hub.
 
         Args:
@@ -585,7 +977,7 @@ class PlexClient:
         Returns:
             bool: True if item appears in Continue Watching hub, False otherwise
         """
-        return bool(self.get_continue_watching(item))
+        return bool(await self.get_continue_watching(item))
 
     def is_online_item(self, item: Media) -> bool:
         """Checks if a media item is from Plex's online API.
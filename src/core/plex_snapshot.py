@@ -0,0 +1,428 @@
+"""Plex Snapshot Module."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, select
+
+from src import log
+from src.config.database import db
+from src.core.plex import Media, PlexClient, Section
+from src.models.db.housekeeping import Housekeeping
+from src.models.db.plex_snapshot import PlexSnapshotItem
+
+__all__ = ["PlexSnapshotStore"]
+
+
+class PlexSnapshotStore:
+    """Persisted snapshot of a profile's Plex library sections.
+
+    The snapshot keeps the identifiers, season and episode counts, and the Plex
+    user's view state of every top level item of a section. It is refreshed
+    incrementally with the items added, updated, viewed or rated since a stored
+    cursor, and rebuilt from the whole section every FULL_REFRESH_INTERVAL to drop
+    items deleted from Plex. Items are then selected from the snapshot, so only the
+    items a sync needs are fetched from the server.
+
+    Each row records when the snapshot saw the item change, which is what the
+    `min_last_modified` filter of polling scans is matched against. Items that have
+    not changed since their last sync can be left out before they are fetched.
+
+    Whether a show was watched or rated depends on its seasons and episodes, so it is
+    read from the server with a second, filtered search of the refreshed shows.
+
+    Items of online users are keyed by metadata keys that cannot be fetched by rating
+    key, so their sections are searched directly instead.
+    """
+
+    FULL_REFRESH_INTERVAL = timedelta(days=1)
+    CURSOR_SLACK = timedelta(seconds=15)
+
+    def __init__(self, plex_client: PlexClient, profile_name: str) -> None:
+        """Initialize the snapshot store.
+
+        Args:
+            plex_client (PlexClient): Client used to read the sections
+            profile_name (str): Name of the profile owning the snapshot
+        """
+        self.plex_client = plex_client
+        self.profile_name = profile_name
+
+    def _get_state_key(self, section: Section) -> str:
+        """Generate the database key for the refresh state of a section.
+
+        Args:
+            section (Section): The library section
+
+        Returns:
+            str: Database key for the refresh state
+        """
+        return f"plex_snapshot_state_{self.profile_name}_{section.key}"
+
+    def _get_state(self, section: Section) -> dict[str, Any] | None:
+        """Retrieves the refresh state of a section from the database.
+
+        Args:
+            section (Section): The library section
+
+        Returns:
+            dict[str, Any] | None: The refresh cursor, the time of the last full
+                refresh and the genre filter the snapshot was built with, None if
+                never refreshed.
+        """
+        with db() as ctx:
+            state = ctx.session.get(Housekeeping, self._get_state_key(section))
+            if state is None or state.value is None:
+                return None
+            return json.loads(state.value)
+
+    def _set_state(self, section: Section, state: dict[str, Any]) -> None:
+        """Stores the refresh state of a section in the database.
+
+        Args:
+            section (Section): The library section
+            state (dict[str, Any]): The refresh state
+        """
+        with db() as ctx:
+            ctx.session.merge(
+                Housekeeping(key=self._get_state_key(section), value=json.dumps(state))
+            )
+            ctx.session.commit()
+
+    async def get_items(
+        self,
+        section: Section,
+        min_last_modified: datetime | None = None,
+        require_watched: bool = False,
+        rating_keys: list[str] | None = None,
+        unchanged: Callable[[PlexSnapshotItem], bool] | None = None,
+    ) -> list[Media]:
+        """Refreshes the snapshot of a section and retrieves the matching items.
+
+        Args:
+            section (Section): The library section to query
+            min_last_modified (datetime | None): If provided, only returns items the
+                snapshot saw change after this timestamp
+            require_watched (bool): If True, only returns items that have been
+                watched or rated
+            rating_keys (list[str] | None): Optional list of rating keys to restrict
+                results to
+            unchanged (Callable[[PlexSnapshotItem], bool] | None): If provided, items
+                that were not just read from the server and for which it returns True
+                are left out instead of being fetched
+
+        Returns:
+            list[Media]: Media items matching the criteria.
+        """
+        if self.plex_client.is_online_user:
+            return await self.plex_client.get_section_items(
+                section,
+                min_last_modified=min_last_modified,
+                require_watched=require_watched,
+                rating_keys=rating_keys,
+            )
+
+        refreshed = await self.refresh(section)
+
+        wanted = self.select(section, min_last_modified, require_watched, rating_keys)
+        missing = [
+            row.rating_key
+            for row in wanted
+            if row.rating_key not in refreshed and not (unchanged and unchanged(row))
+        ]
+        fetched = {
+            str(item.ratingKey): item
+            for item in await self.plex_client.fetch_items(missing)
+        }
+        if len(fetched) < len(missing):
+            self._delete(section, [rk for rk in missing if rk not in fetched])
+
+        items = [
+            item
+            for row in wanted
+            if (item := refreshed.get(row.rating_key) or fetched.get(row.rating_key))
+            is not None
+        ]
+        log.debug(
+            f"[{self.profile_name}] Selected {len(wanted)} items from the snapshot "
+            f"of section $$'{section.title}'$$, fetched {len(missing)} of them and "
+            f"left out {len(wanted) - len(items)} unchanged or deleted items"
+        )
+        return items
+
+    async def refresh(self, section: Section) -> dict[str, Media]:
+        """Brings the snapshot of a section up to date with the server.
+
+        A rebuild reads the whole section with a single search. Changes to seasons
+        and episodes leave no trace on the shows, so the cursor is kept through a
+        rebuild and the next incremental refresh picks them up.
+
+        Args:
+            section (Section): The library section to refresh
+
+        Returns:
+            dict[str, Media]: The items read from the server keyed by rating key.
+        """
+        now = datetime.now(UTC)
+        state = self._get_state(section) or {}
+        genres = sorted(self.plex_client.plex_genres or [])
+
+        refreshed_at = datetime.fromisoformat(state["refreshed_at"]) if state else None
+        full = (
+            refreshed_at is None
+            or state.get("genres") != genres
+            or now - refreshed_at >= self.FULL_REFRESH_INTERVAL
+        )
+        if full:
+            log.debug(
+                f"[{self.profile_name}] Rebuilding the snapshot of section "
+                f"$$'{section.title}'$$"
+            )
+            refreshed_at = now
+            min_last_modified = None
+            items = await self.plex_client.get_section_items(section)
+            touched: set[str] = set()
+        else:
+            min_last_modified = (
+                datetime.fromisoformat(state["cursor"]) - self.CURSOR_SLACK
+            )
+            items = await self.plex_client.get_section_items(
+                section, min_last_modified=min_last_modified
+            )
+            touched = {str(item.ratingKey) for item in items}
+
+        by_key = {str(item.ratingKey): item for item in items}
+        watched = None
+        # Shows already in the snapshot keep being watched through rebuilds, so only
+        # the first build and incremental refreshes ask the server
+        if section.type == "show" and by_key and (not full or not state):
+            watched = {
+                str(item.ratingKey)
+                for item in await self.plex_client.get_section_items(
+                    section, min_last_modified=min_last_modified, require_watched=True
+                )
+            }
+        changed = self._upsert(
+            section, by_key, now, replace=full, touched=touched, watched=watched
+        )
+
+        log.debug(
+            f"[{self.profile_name}] Refreshed the snapshot of section "
+            f"$$'{section.title}'$$ with {len(by_key)} items, {changed} changed"
+        )
+        self._set_state(
+            section,
+            {
+                "cursor": state["cursor"] if full and state else now.isoformat(),
+                "refreshed_at": (refreshed_at or now).isoformat(),
+                "genres": genres,
+            },
+        )
+        return by_key
+
+    def select(
+        self,
+        section: Section,
+        min_last_modified: datetime | None = None,
+        require_watched: bool = False,
+        rating_keys: list[str] | None = None,
+    ) -> list[PlexSnapshotItem]:
+        """Selects the snapshot items matching the criteria.
+
+        Args:
+            section (Section): The library section to query
+            min_last_modified (datetime | None): If provided, only selects items the
+                snapshot saw change after this timestamp
+            require_watched (bool): If True, only selects items that have been
+                watched or rated
+            rating_keys (list[str] | None): Optional list of rating keys to restrict
+                results to
+
+        Returns:
+            list[PlexSnapshotItem]: The matching items.
+        """
+        query = select(PlexSnapshotItem).where(
+            PlexSnapshotItem.profile_name == self.profile_name,
+            PlexSnapshotItem.section_key == str(section.key),
+        )
+        if min_last_modified is not None:
+            query = query.where(PlexSnapshotItem.changed_at >= min_last_modified)
+        if require_watched:
+            query = query.where(PlexSnapshotItem.watched.is_(True))
+        if rating_keys:
+            query = query.where(
+                PlexSnapshotItem.rating_key.in_({str(rk) for rk in rating_keys})
+            )
+
+        with db() as ctx:
+            return list(ctx.session.scalars(query.order_by(PlexSnapshotItem.id)))
+
+    def _upsert(
+        self,
+        section: Section,
+        items: dict[str, Media],
+        now: datetime,
+        replace: bool,
+        touched: set[str],
+        watched: set[str] | None,
+    ) -> int:
+        """Writes items read from the server to the snapshot.
+
+        Args:
+            section (Section): The library section of the items
+            items (dict[str, Media]): Items keyed by rating key
+            now (datetime): Time the items were read
+            replace (bool): Whether the items are the whole section, in which case
+                snapshot items missing from them are deleted
+            touched (set[str]): Rating keys of the items changed since the last
+                refresh, which are marked as changed even if their fields are not
+            watched (set[str] | None): Rating keys of the items that were watched or
+                rated, None to tell from the fields of the items themselves, in which
+                case shows already in the snapshot stay watched
+
+        Returns:
+            int: Number of items that were added or changed.
+        """
+        section_key = str(section.key)
+        changed = 0
+
+        query = select(PlexSnapshotItem).where(
+            PlexSnapshotItem.profile_name == self.profile_name,
+            PlexSnapshotItem.section_key == section_key,
+        )
+        if not replace:
+            query = query.where(PlexSnapshotItem.rating_key.in_(list(items)))
+
+        with db() as ctx:
+            existing = {row.rating_key: row for row in ctx.session.scalars(query)}
+
+            for rating_key, item in items.items():
+                fields = self._to_fields(item)
+                row = existing.pop(rating_key, None)
+                if watched is not None:
+                    fields["watched"] = rating_key in watched
+                elif row is not None and item.type == "show":
+                    fields["watched"] = fields["watched"] or row.watched
+                if row is None:
+                    # Items first seen by a full refresh were not necessarily
+                    # changed just now, so their own timestamps are used instead
+                    seen = [
+                        fields[f]
+                        for f in (
+                            "added_at",
+                            "updated_at",
+                            "last_viewed_at",
+                            "last_rated_at",
+                        )
+                        if fields[f] is not None
+                    ]
+                    ctx.session.add(
+                        PlexSnapshotItem(
+                            profile_name=self.profile_name,
+                            section_key=section_key,
+                            rating_key=rating_key,
+                            changed_at=(
+                                now if rating_key in touched else max(seen, default=now)
+                            ),
+                            **fields,
+                        )
+                    )
+                    changed += 1
+                    continue
+
+                # Items returned by an incremental refresh changed since the cursor
+                if rating_key in touched or any(
+                    self._normalize(getattr(row, f)) != self._normalize(v)
+                    for f, v in fields.items()
+                ):
+                    for f, v in fields.items():
+                        setattr(row, f, v)
+                    row.changed_at = now
+                    changed += 1
+
+            if replace and existing:
+                log.debug(
+                    f"[{self.profile_name}] Dropping {len(existing)} items deleted "
+                    f"from section $$'{section.title}'$$ from the snapshot"
+                )
+                for row in existing.values():
+                    ctx.session.delete(row)
+
+            ctx.session.commit()
+
+        return changed
+
+    def _delete(self, section: Section, rating_keys: list[str]) -> None:
+        """Deletes items that no longer exist on the server from the snapshot.
+
+        Args:
+            section (Section): The library section of the items
+            rating_keys (list[str]): Rating keys of the deleted items
+        """
+        log.debug(
+            f"[{self.profile_name}] Dropping {len(rating_keys)} items deleted from "
+            f"section $$'{section.title}'$$ from the snapshot"
+        )
+        with db() as ctx:
+            ctx.session.execute(
+                delete(PlexSnapshotItem).where(
+                    and_(
+                        PlexSnapshotItem.profile_name == self.profile_name,
+                        PlexSnapshotItem.section_key == str(section.key),
+                        PlexSnapshotItem.rating_key.in_(rating_keys),
+                    )
+                )
+            )
+            ctx.session.commit()
+
+    @staticmethod
+    def _to_utc(value: datetime | None) -> datetime | None:
+        """Converts a naive local timestamp from plexapi to UTC."""
+        if value is None:
+            return None
+        return value.astimezone(UTC)
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        """Normalizes a field value for comparison, as SQLite drops timezones."""
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        return value
+
+    @classmethod
+    def _to_fields(cls, item: Media) -> dict[str, Any]:
+        """Extracts the snapshot fields of an item.
+
+        Args:
+            item (Media): Movie or show read from the server
+
+        Returns:
+            dict[str, Any]: Column values of the snapshot row.
+        """
+        is_show = item.type == "show"
+        view_count = (
+            getattr(item, "viewedLeafCount", 0)
+            if is_show
+            else getattr(item, "viewCount", 0)
+        ) or 0
+        last_viewed_at = cls._to_utc(getattr(item, "lastViewedAt", None))
+        last_rated_at = cls._to_utc(getattr(item, "lastRatedAt", None))
+        return {
+            "type": item.type,
+            "title": item.title,
+            "guid": item.guid,
+            "guids": [g.id for g in item.guids],
+            "child_count": getattr(item, "childCount", None) if is_show else None,
+            "leaf_count": getattr(item, "leafCount", None) if is_show else None,
+            "view_count": view_count,
+            "user_rating": getattr(item, "userRating", None),
+            "added_at": cls._to_utc(item.addedAt),
+            "updated_at": cls._to_utc(item.updatedAt),
+            "last_viewed_at": last_viewed_at,
+            "last_rated_at": last_rated_at,
+            "watched": bool(view_count or last_viewed_at or last_rated_at),
+        }
@@ -15,7 +15,9 @@ from src.config.settings import (
     SyncMode,
 )
 from src.core import AniMapClient, BridgeClient
+from src.core.anilist import anilist_breaker
 from src.exceptions import ProfileNotFoundError
+from src.utils.requests import close_http_transport
 
 __all__ = ["SchedulerClient"]
 
@@ -24,9 +26,12 @@ class ProfileScheduler:
     """Individual profile scheduler for managing sync operations.
 
     Handles the scheduling logic for a single profile, including periodic
-    sync, polling mode, and single-run mode.
+    sync, polling mode, and single-run mode. While running, pending AniList updates
+    are retried between syncs as they become due.
     """
 
+    OUTBOX_INTERVAL = 60  # Seconds between checks for due AniList updates
+
     def __init__(
         self,
         profile_name: str,
@@ -59,7 +64,10 @@ class ProfileScheduler:
         self._tasks: set[asyncio.Task] = set()  # Prevents early GC
 
     async def sync(
-        self, poll: bool = False, rating_keys: list[str] | None = None
+        self,
+        poll: bool = False,
+        rating_keys: list[str] | None = None,
+        force: bool = False,
     ) -> None:
         """Execute a single synchronization cycle with error handling.
 
@@ -67,11 +75,14 @@ class ProfileScheduler:
             poll: Flag to enable polling-based sync
             rating_keys: Optional list of Plex rating keys to restrict the sync
                 to. When provided, only those items will be processed.
+            force: Flag to sync items unchanged since their last sync
         """
         async with self._sync_lock:
             try:
                 self._current_task = asyncio.create_task(
-                    self.bridge_client.sync(poll=poll, rating_keys=rating_keys)
+                    self.bridge_client.sync(
+                        poll=poll, rating_keys=rating_keys, force=force
+                    )
                 )
                 await self._current_task
             except asyncio.CancelledError:
@@ -119,6 +130,10 @@ class ProfileScheduler:
             self._tasks.add(task)
             task.add_done_callback(self._tasks.discard)
 
+        task = asyncio.create_task(self._outbox_loop())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     async def stop(self) -> None:
         """Stop the profile scheduler."""
         self._running = False
@@ -151,6 +166,25 @@ class ProfileScheduler:
                 log.error(f"[{self.profile_name}] Periodic sync error", exc_info=True)
                 await asyncio.sleep(10)
 
+    async def _outbox_loop(self) -> None:
+        """Write pending AniList updates as they become due between syncs."""
+        while self._running and not self.stop_event.is_set():
+            try:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self.stop_event.wait(), self.OUTBOX_INTERVAL)
+                if self.stop_event.is_set() or self._sync_lock.locked():
+                    continue  # Syncs write pending updates themselves
+
+                async with self._sync_lock:
+                    await self.bridge_client.flush_outbox()
+            except asyncio.CancelledError:
+                log.debug(f"[{self.profile_name}] AniList outbox writer cancelled")
+                break
+            except Exception:
+                log.error(
+                    f"[{self.profile_name}] AniList outbox writer error", exc_info=True
+                )
+
     async def _poll_loop(self) -> None:
         """Handle polling-based synchronization."""
         while self._running and not self.stop_event.is_set():
@@ -332,6 +366,7 @@ class SchedulerClient:
             await asyncio.gather(*close_tasks, return_exceptions=True)
 
         await self.shared_animap_client.close()
+        await close_http_transport()
 
         self.profile_schedulers.clear()
         self.bridge_clients.clear()
@@ -354,6 +389,7 @@ class SchedulerClient:
         profile_name: str | None = None,
         poll: bool = False,
         rating_keys: list[str] | None = None,
+        force: bool = False,
     ) -> None:
         """Manually trigger a sync for one or all profiles.
 
@@ -362,6 +398,7 @@ class SchedulerClient:
             poll: Whether to use polling mode for the sync
             rating_keys: Optional list of Plex rating keys to restrict the sync
                 scope for each profile.
+            force: Whether to sync items unchanged since their last sync
 
         Raises:
             KeyError: If the specified profile doesn't exist
@@ -372,13 +409,15 @@ class SchedulerClient:
 
             log.info(f"[{profile_name}] Manually triggering sync (poll={poll})")
             scheduler = self.profile_schedulers[profile_name]
-            await scheduler.sync(poll=poll, rating_keys=rating_keys)
+            await scheduler.sync(poll=poll, rating_keys=rating_keys, force=force)
         else:
             log.info(f"Manually triggering sync for all profiles (poll={poll})")
             sync_tasks = []
             for name, scheduler in self.profile_schedulers.items():
                 log.info(f"[{name}] Triggering sync")
-                sync_tasks.append(scheduler.sync(poll=poll, rating_keys=rating_keys))
+                sync_tasks.append(
+                    scheduler.sync(poll=poll, rating_keys=rating_keys, force=force)
+                )
 
             if sync_tasks:
                 await asyncio.gather(*sync_tasks, return_exceptions=True)
@@ -419,6 +458,7 @@ class SchedulerClient:
                         if bridge_client and bridge_client.current_sync is not None
                         else None
                     ),
+                    "anilist_circuit": anilist_breaker.status(),
                 },
             }
 
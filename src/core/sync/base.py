@@ -3,22 +3,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from datetime import UTC, datetime
+from typing import Any
 
 from plexapi.media import Guid
 from plexapi.video import Episode, Movie, Season, Show
 from pydantic import BaseModel
 from rapidfuzz import fuzz
-from sqlalchemy import or_
 
 from src import log
-from src.config.database import db
 from src.config.settings import SyncField
 from src.core import AniListClient, AniMapClient, PlexClient
+from src.core.anilist_outbox import AniListOutbox
+from src.core.animap import AniMapIndex
+from src.core.pins import pin_index
+from src.core.sync.fingerprint import SyncFingerprintStore
+from src.core.sync.history import SyncHistoryWriter
 from src.core.sync.stats import ItemIdentifier, SyncOutcome, SyncStats
+from src.exceptions import AniListUnavailableError
 from src.models.db.animap import AniMap
-from src.models.db.pin import Pin
+from src.models.db.plex_snapshot import PlexSnapshotItem
 from src.models.db.sync_history import MediaType, SyncHistory
 from src.models.schemas.anilist import (
     FuzzyDate,
@@ -64,16 +69,28 @@ class ParsedGuids(BaseModel):
         Args:
             guids (list[Guid]): List of Plex GUID objects
 
+        Returns:
+            ParsedGuids: New instance with parsed IDs
+        """
+        return ParsedGuids.from_ids(guid.id for guid in guids)
+
+    @staticmethod
+    def from_ids(guid_ids: Iterable[str | None]) -> ParsedGuids:
+        """Creates a ParsedGuids instance from Plex GUID strings.
+
+        Args:
+            guid_ids (Iterable[str | None]): Plex GUIDs, such as "tmdb://123456"
+
         Returns:
             ParsedGuids: New instance with parsed IDs
         """
         parsed_guids = ParsedGuids()
 
-        for guid in guids:
-            if not guid.id:
+        for guid_id in guid_ids:
+            if not guid_id:
                 continue
 
-            split_guid = guid.id.split("://")
+            split_guid = guid_id.split("://")
             if len(split_guid) != 2:
                 continue
 
@@ -130,12 +147,14 @@ class BaseSyncClient[
         anilist_client: AniListClient,
         animap_client: AniMapClient,
         plex_client: PlexClient,
+        outbox: AniListOutbox,
         excluded_sync_fields: list[SyncField],
         full_scan: bool,
         destructive_sync: bool,
         search_fallback_threshold: int,
         batch_requests: bool,
         profile_name: str,
+        force: bool = False,
     ) -> None:
         """Initializes a new synchronization client.
 
@@ -143,6 +162,7 @@ class BaseSyncClient[
             anilist_client (AniListClient): AniList API client.
             animap_client (AniMapClient): AniMap API client.
             plex_client (PlexClient): Plex API client.
+            outbox (AniListOutbox): Durable outbox AniList updates are written through.
             excluded_sync_fields (list[SyncField]): Fields to exclude from
                                                     synchronization.
             full_scan (bool): Whether to perform a full scan of all media.
@@ -151,21 +171,33 @@ class BaseSyncClient[
                                              title matching.
             batch_requests (bool): Whether to use batch requests to reduce API calls.
             profile_name (str): Name of the sync profile for logging.
+            force (bool): Whether to sync every item, ignoring the fingerprints of
+                          items unchanged since their last sync.
         """
         self.anilist_client = anilist_client
         self.animap_client = animap_client
         self.plex_client = plex_client
+        self.outbox = outbox
 
         self.excluded_sync_fields = set(field.value for field in excluded_sync_fields)
         self.full_scan = full_scan
         self.destructive_sync = destructive_sync
         self.search_fallback_threshold = search_fallback_threshold
         self.batch_requests = batch_requests
+        self.force = force
 
         self.profile_name = profile_name
+        self.fingerprints = SyncFingerprintStore(profile_name)
+        # Notes are read from the Plex user's reviews, which only admins can read
+        self.fingerprint_reviews = (
+            SyncField.NOTES.value not in self.excluded_sync_fields
+            and plex_client.is_admin_user
+        )
+        self.history = SyncHistoryWriter(profile_name)
+        # Mappings prefetched for the section being synced, if any
+        self.mapping_index: AniMapIndex | None = None
 
         self.sync_stats = SyncStats()
-        self._pin_cache: dict[int, list[str]] = {}
 
         extra_fields: dict[SyncField, Callable] = {
             SyncField.STATUS: lambda **kwargs: self._calculate_status(**kwargs),
@@ -184,9 +216,10 @@ class BaseSyncClient[
             if k.value not in self.excluded_sync_fields
         }
 
-        self.queued_batch_requests: list[MediaList] = []
         # Track batch items for history recording
         self.batch_history_items: list[tuple[T, S, MediaList | None, MediaList]] = []
+        # Items whose fingerprints are stored once their batched updates are written
+        self._deferred_fingerprints: dict[str, tuple[T, list[int]]] = {}
 
     def clear_cache(self) -> None:
         """Clears the cache for all decorated methods in the class.
@@ -199,29 +232,41 @@ class BaseSyncClient[
                 getattr(self, attr), "cache_clear"
             ):
                 getattr(self, attr).cache_clear()
-        self._pin_cache.clear()
 
-    def _get_pinned_fields(self, anilist_id: int | None) -> list[str]:
-        """Retrieve pinned fields for the current profile and AniList entry."""
-        if not anilist_id:
-            return []
+    def _get_mappings(
+        self,
+        imdb: str | None = None,
+        tmdb: int | None = None,
+        tvdb: int | None = None,
+        is_movie: bool = True,
+    ) -> Iterator[AniMap]:
+        """Retrieve anime ID mappings, from the prefetched mappings when possible.
 
-        cached = self._pin_cache.get(anilist_id)
-        if cached is not None:
-            return cached
+        Args:
+            imdb (str | None): IMDB ID to match.
+            tmdb (int | None): TMDB ID to match.
+            tvdb (int | None): TVDB ID to match, for TV shows only.
+            is_movie (bool): Whether the search is for a movie or TV show.
 
-        with db() as ctx:
-            pin: Pin | None = (
-                ctx.session.query(Pin)
-                .filter(
-                    Pin.profile_name == self.profile_name, Pin.anilist_id == anilist_id
-                )
-                .first()
+        Returns:
+            Iterator[AniMap]: Matching anime mapping entries.
+        """
+        if self.mapping_index is not None:
+            animappings = self.mapping_index.get_mappings(
+                imdb=imdb, tmdb=tmdb, tvdb=tvdb, is_movie=is_movie
             )
+            if animappings is not None:
+                return iter(animappings)
 
-        fields = list(pin.fields) if pin and pin.fields else []
-        self._pin_cache[anilist_id] = fields
-        return fields
+        return self.animap_client.get_mappings(
+            imdb=imdb, tmdb=tmdb, tvdb=tvdb, is_movie=is_movie
+        )
+
+    def _get_pinned_fields(self, anilist_id: int | None) -> list[str]:
+        """Retrieve pinned fields for the current profile and AniList entry."""
+        if not anilist_id:
+            return []
+        return pin_index.get(self.profile_name, anilist_id)
 
     async def _create_sync_history(
         self,
@@ -235,6 +280,8 @@ class BaseSyncClient[
     ) -> None:
         """Creates a sync history record for tracking synchronization operations.
 
+        Records are buffered by the history writer and written in bulk.
+
         Args:
             item (T): Grandparent Plex media item.
             child_item (S): Target child item to sync.
@@ -253,89 +300,29 @@ class BaseSyncClient[
             _after_state.model_dump(mode="json") if _after_state is not None else None
         )
 
-        plex_rating_key = str(item.ratingKey)
-        plex_child_rating_key = str(child_item.ratingKey) if child_item else None
-        plex_type = MediaType.from_item(item)
-
-        with db() as ctx:
-            if outcome == SyncOutcome.SYNCED:
-                delete_query = ctx.session.query(SyncHistory).filter(
-                    SyncHistory.profile_name == self.profile_name,
-                    SyncHistory.plex_rating_key == plex_rating_key,
-                    SyncHistory.plex_type == plex_type,
-                    SyncHistory.outcome.in_(
-                        [SyncOutcome.NOT_FOUND, SyncOutcome.FAILED]
-                    ),
-                )
-
-                if plex_child_rating_key is not None:
-                    delete_query = delete_query.filter(
-                        or_(
-                            SyncHistory.plex_child_rating_key == plex_child_rating_key,
-                            SyncHistory.plex_child_rating_key.is_(None),
-                        )
-                    )
-                else:
-                    delete_query = delete_query.filter(
-                        SyncHistory.plex_child_rating_key.is_(None)
-                    )
-
-                delete_query.delete(synchronize_session=False)
-
-            if outcome == SyncOutcome.SKIPPED:
-                # If skipped, no need to create a history record
-                return
-            if outcome in (SyncOutcome.NOT_FOUND, SyncOutcome.FAILED):
-                # On error, upsert existing record if it exists
-                existing_record = (
-                    ctx.session.query(SyncHistory)
-                    .filter(
-                        SyncHistory.profile_name == self.profile_name,
-                        SyncHistory.plex_rating_key == plex_rating_key,
-                        SyncHistory.plex_child_rating_key == plex_child_rating_key,
-                        SyncHistory.plex_type == plex_type,
-                        SyncHistory.outcome == outcome,
-                    )
-                    .first()
-                )
-                if existing_record:
-                    if existing_record.error_message == error_message:
-                        return
-                    existing_record.before_state = before_state
-                    existing_record.after_state = after_state
-                    existing_record.error_message = error_message
-                    existing_record.timestamp = datetime.now(UTC)
-                    ctx.session.commit()
-                    return
-
-            try:
-                history_record = SyncHistory(
-                    profile_name=self.profile_name,
-                    plex_guid=item.guid,
-                    plex_rating_key=plex_rating_key,
-                    plex_child_rating_key=plex_child_rating_key,
-                    plex_type=plex_type,
-                    anilist_id=animapping.anilist_id if animapping else None,
-                    outcome=outcome,
-                    before_state=before_state,
-                    after_state=after_state,
-                    error_message=error_message,
-                )
-
-                ctx.session.add(history_record)
-                ctx.session.commit()
-
-            except Exception as e:
-                log.error(
-                    f"Failed to create sync history record for {item.title} "
-                    f"({item.ratingKey}): {e}",
-                    exc_info=True,
-                )
-                ctx.session.rollback()
+        self.history.add(
+            SyncHistory(
+                profile_name=self.profile_name,
+                plex_guid=item.guid,
+                plex_rating_key=str(item.ratingKey),
+                plex_child_rating_key=(
+                    str(child_item.ratingKey) if child_item else None
+                ),
+                plex_type=MediaType.from_item(item),
+                anilist_id=animapping.anilist_id if animapping else None,
+                outcome=outcome,
+                before_state=before_state,
+                after_state=after_state,
+                error_message=error_message,
+            )
+        )
 
     async def process_media(self, item: T) -> None:
         """Processes a single media item for synchronization.
 
+        Items whose fingerprint matches the one stored after their last successful
+        sync are skipped, unless the sync is forced.
+
         Args:
             item (T): Grandparent Plex media item to sync.
         """
@@ -366,7 +353,26 @@ class BaseSyncClient[
             self.sync_stats.track_item(item_id, SyncOutcome.SKIPPED)
             return
 
+        rating_key = str(item.ratingKey)
+        last_sync = None if self.force else self.fingerprints.get(rating_key)
+        state = (
+            await self._get_fingerprint(item, last_sync.anilist_ids)
+            if last_sync is not None
+            else None
+        )
+        if last_sync is not None and state and state[0] == last_sync.fingerprint:
+            log.debug(
+                f"[{self.profile_name}] "
+                f"Skipping {item.type} because it is unchanged since its last sync "
+                f"{debug_log_title} {debug_log_ids}"
+            )
+            self.sync_stats.track_items(all_trackable_items, SyncOutcome.SKIPPED)
+            self.sync_stats.track_item(item_id, SyncOutcome.SKIPPED)
+            return
+
         found_match = False
+        succeeded = True
+        synced_ids: list[int] = []
         async for (
             child_item,
             grandchild_items,
@@ -400,6 +406,23 @@ class BaseSyncClient[
                 self.sync_stats.track_items(grandchild_ids, outcome)
                 self.sync_stats.track_item(item_id, outcome)
 
+                synced_ids.append(anilist_media.id)
+                if outcome not in (
+                    SyncOutcome.SYNCED,
+                    SyncOutcome.SKIPPED,
+                    SyncOutcome.DELETED,
+                ):
+                    succeeded = False
+
+            except AniListUnavailableError:
+                log.warning(
+                    f"[{self.profile_name}] AniList is unavailable, deferring "
+                    f"{item.type} until it recovers {debug_log_title} {debug_log_ids}"
+                )
+                self.sync_stats.track_items(grandchild_ids, SyncOutcome.PENDING)
+                self.sync_stats.track_item(item_id, SyncOutcome.PENDING)
+                succeeded = False
+
             except Exception as e:
                 log.error(
                     f"[{self.profile_name}] Failed to "
@@ -419,6 +442,12 @@ class BaseSyncClient[
 
                 self.sync_stats.track_items(grandchild_ids, SyncOutcome.FAILED)
                 self.sync_stats.track_item(item_id, SyncOutcome.FAILED)
+                succeeded = False
+
+        if found_match and succeeded:
+            await self._record_fingerprint(item, synced_ids)
+        else:
+            self.fingerprints.discard(rating_key)
 
         if not found_match:
             await self._create_sync_history(
@@ -432,6 +461,235 @@ class BaseSyncClient[
             )
             self.sync_stats.track_item(item_id, SyncOutcome.NOT_FOUND)
 
+    def _get_fingerprint_context(
+        self,
+        guid_ids: Iterable[str],
+        on_watchlist: bool,
+        on_deck: bool,
+        is_movie: bool,
+        anilist_ids: Iterable[int],
+    ) -> str | None:
+        """Computes the fingerprint of the sync state not read from Plex metadata.
+
+        The context covers the rows of the item's candidate mappings, the list entry
+        and pinned fields of every AniList media it maps to, the sync settings, and
+        whether the item is on the watchlist or was viewed within the on deck window.
+        It can be computed from a Plex snapshot row as well as from a Plex item.
+
+        Args:
+            guid_ids (Iterable[str]): Plex GUIDs of the item.
+            on_watchlist (bool): Whether the item is on the user's watchlist.
+            on_deck (bool): Whether the item was viewed within the on deck window.
+            is_movie (bool): Whether the item is a movie.
+            anilist_ids (Iterable[int]): AniList IDs the item was synced to, in
+                addition to those of its mappings.
+
+        Returns:
+            str | None: The context, or None if the state of the user's list entries
+                is not known.
+        """
+        guids = ParsedGuids.from_ids(guid_ids)
+        animappings = {
+            animapping.anilist_id: animapping
+            for animapping in self._get_mappings(
+                imdb=guids.imdb if is_movie else None,
+                tmdb=guids.tmdb,
+                tvdb=guids.tvdb,
+                is_movie=is_movie,
+            )
+            if animapping.anilist_id
+        }
+
+        list_entries: dict[int, datetime | None] = {}
+        for anilist_id in sorted({*anilist_ids, *animappings}):
+            if anilist_id in self.outbox:
+                return None  # An update is still pending
+            if (
+                anilist_id not in self.anilist_client.list_entries
+                and not self.anilist_client.list_loaded
+            ):
+                return None
+            entry = self.anilist_client.list_entries.get(anilist_id)
+            list_entries[anilist_id] = entry.updated_at if entry else None
+
+        return self.fingerprints.digest(
+            {
+                "settings": [
+                    sorted(self.excluded_sync_fields),
+                    self.full_scan,
+                    self.destructive_sync,
+                    self.search_fallback_threshold,
+                ],
+                "plex": [on_watchlist, on_deck],
+                "mappings": {
+                    anilist_id: {
+                        column.name: getattr(animapping, column.name)
+                        for column in AniMap.__table__.columns
+                    }
+                    for anilist_id, animapping in animappings.items()
+                },
+                "anilist": {
+                    anilist_id: [
+                        updated_at,
+                        sorted(self._get_pinned_fields(anilist_id)),
+                    ]
+                    for anilist_id, updated_at in list_entries.items()
+                },
+            }
+        )
+
+    async def _get_fingerprint(
+        self, item: T, anilist_ids: Iterable[int]
+    ) -> tuple[str, str] | None:
+        """Computes the fingerprint of everything a sync of an item depends on.
+
+        The fingerprint covers the Plex user's view state of the item, its episode
+        counts, its review when notes are synced and the state of its children from
+        `_get_children_fingerprint()`, along with the context of
+        `_get_fingerprint_context()`.
+
+        Args:
+            item (T): Grandparent Plex media item.
+            anilist_ids (Iterable[int]): AniList IDs the item was synced to, in
+                addition to those of its mappings.
+
+        Returns:
+            tuple[str, str] | None: The fingerprint and its context, or None if the
+                state of the user's list entries is not known.
+        """
+        is_movie = item.type == "movie"
+        last_viewed_at: datetime | None = getattr(item, "lastViewedAt", None)
+        context = self._get_fingerprint_context(
+            [guid.id for guid in item.guids],
+            on_watchlist=await self.plex_client.is_on_watchlist(item),
+            on_deck=bool(
+                last_viewed_at
+                and last_viewed_at + self.plex_client.on_deck_window > datetime.now()
+            ),
+            is_movie=is_movie,
+            anilist_ids=anilist_ids,
+        )
+        if context is None:
+            return None
+
+        fingerprint = self.fingerprints.digest(
+            {
+                "context": context,
+                "plex": [
+                    sorted(guid.id for guid in item.guids),
+                    getattr(item, "viewCount" if is_movie else "viewedLeafCount", 0),
+                    getattr(item, "childCount", None),
+                    getattr(item, "leafCount", None),
+                    getattr(item, "userRating", None),
+                    last_viewed_at,
+                    getattr(item, "lastRatedAt", None),
+                ],
+                "review": (
+                    await self.plex_client.get_user_review(item)
+                    if self.fingerprint_reviews
+                    else None
+                ),
+                "children": await self._get_children_fingerprint(item),
+            }
+        )
+        return fingerprint, context
+
+    async def _get_children_fingerprint(self, item: T) -> list[Any]:
+        """Gets the state of an item's children its fingerprint depends on.
+
+        Media types whose sync reads state from the children of an item (such as
+        season and episode ratings) override this so that changes to that state
+        invalidate the item's fingerprint.
+
+        Args:
+            item (T): Grandparent Plex media item.
+
+        Returns:
+            list[Any]: JSON serializable state of the item's children.
+        """
+        return []
+
+    def is_unchanged(self, row: PlexSnapshotItem) -> bool:
+        """Checks whether a Plex snapshot item is unchanged since its last sync.
+
+        The item is unchanged if the snapshot has not seen it change since its last
+        successful sync and the context of its fingerprint still matches, so it can
+        be skipped without reading it from Plex. Reviews are not part of the
+        snapshot, so items are never skipped this way while notes are synced.
+        Skipped items are tracked as such.
+
+        Args:
+            row (PlexSnapshotItem): Snapshot row of a grandparent Plex media item.
+
+        Returns:
+            bool: True if the item can be skipped.
+        """
+        if self.force or self.fingerprint_reviews:
+            return False
+
+        last_sync = self.fingerprints.get(row.rating_key)
+        if last_sync is None or last_sync.context is None:
+            return False
+
+        if self._as_utc(row.changed_at) >= self._as_utc(last_sync.synced_at):
+            return False
+
+        on_watchlist = self.plex_client.is_guid_on_watchlist(row.guid)
+        if on_watchlist is None:
+            return False
+
+        last_viewed_at = (
+            self._as_utc(row.last_viewed_at) if row.last_viewed_at else None
+        )
+        context = self._get_fingerprint_context(
+            row.guids,
+            on_watchlist=on_watchlist,
+            on_deck=bool(
+                last_viewed_at
+                and last_viewed_at + self.plex_client.on_deck_window > datetime.now(UTC)
+            ),
+            is_movie=row.type == "movie",
+            anilist_ids=last_sync.anilist_ids,
+        )
+        if context != last_sync.context:
+            return False
+
+        self.sync_stats.track_item(
+            ItemIdentifier(
+                rating_key=row.rating_key, title=row.title, item_type=row.type
+            ),
+            SyncOutcome.SKIPPED,
+        )
+        return True
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Converts a stored timestamp to UTC, as SQLite drops timezones."""
+        return value.astimezone(UTC) if value.tzinfo else value.replace(tzinfo=UTC)
+
+    async def _record_fingerprint(self, item: T, anilist_ids: list[int]) -> None:
+        """Stores the fingerprint of an item after a successful sync.
+
+        Items with updates queued for batch sync are fingerprinted once the updates
+        are written.
+
+        Args:
+            item (T): Grandparent Plex media item.
+            anilist_ids (list[int]): AniList IDs the item was synced to.
+        """
+        rating_key = str(item.ratingKey)
+        if self.batch_requests and any(i in self.outbox for i in anilist_ids):
+            self.fingerprints.discard(rating_key)
+            self._deferred_fingerprints[rating_key] = (item, anilist_ids)
+            return
+
+        state = await self._get_fingerprint(item, anilist_ids)
+        if state is None:
+            self.fingerprints.discard(rating_key)
+        else:
+            fingerprint, context = state
+            self.fingerprints.put(rating_key, fingerprint, anilist_ids, context)
+
     @abstractmethod
     async def _get_all_trackable_items(self, item: T) -> list[ItemIdentifier]:
         """Get all trackable items (episodes/movies) for a given parent item.
@@ -573,6 +831,7 @@ class BaseSyncClient[
                 f"{item.type} because it is already up to date "
                 f"{debug_log_title} {debug_log_ids}"
             )
+            self.outbox.discard(anilist_media.id)
             return SyncOutcome.SKIPPED
 
         pinned_fields: list[str] = self._get_pinned_fields(anilist_media.id)
@@ -623,6 +882,7 @@ class BaseSyncClient[
                     f"{item.type} because it is already up to date "
                     f"{debug_log_title} {debug_log_ids}"
                 )
+                self.outbox.discard(anilist_media.id)
                 return SyncOutcome.SKIPPED
 
         if (
@@ -637,6 +897,7 @@ class BaseSyncClient[
             log.success(f"\t\tDELETE: {original_anilist_media_list}")
 
             if anilist_media.media_list_entry:
+                self.outbox.discard(anilist_media.id)
                 await self.anilist_client.delete_anime_entry(
                     anilist_media.media_list_entry.id,
                     anilist_media.media_list_entry.media_id,
@@ -672,7 +933,7 @@ class BaseSyncClient[
                     MediaList.diff(original_anilist_media_list, final_media_list)
                 }"
             )
-            self.queued_batch_requests.append(final_media_list)
+            self.outbox.enqueue([final_media_list])
 
             # Store for batch history tracking
             self.batch_history_items.append(
@@ -692,6 +953,7 @@ class BaseSyncClient[
 
             try:
                 await self.anilist_client.update_anime_entry(final_media_list)
+                self.outbox.discard(final_media_list.media_id)
 
                 log.success(
                     f"[{self.profile_name}] Synced "
@@ -709,11 +971,21 @@ class BaseSyncClient[
 
                 return SyncOutcome.SYNCED
 
+            except AniListUnavailableError:
+                log.warning(
+                    f"[{self.profile_name}] AniList is unavailable, deferring "
+                    f"{item.type} until it recovers {debug_log_title} {debug_log_ids}"
+                )
+                self.outbox.enqueue([final_media_list])
+                return SyncOutcome.PENDING
+
             except Exception as e:
                 log.error(
                     f"Failed to sync {item.type} {debug_log_title} {debug_log_ids}",
                     exc_info=True,
                 )
+                # Keep the update so it is retried instead of lost until the next scan
+                self.outbox.enqueue([final_media_list])
 
                 await self._create_sync_history(
                     item=item,
@@ -730,32 +1002,38 @@ class BaseSyncClient[
     async def batch_sync(self) -> None:
         """Executes batch synchronization of queued media lists.
 
-        Sends all queued media lists to AniList in a single batch request.
-        This is more efficient than sending individual requests for each media list.
+        Flushes the outbox the queued media lists were written to, sending them to
+        AniList in as few batch requests as possible. Updates to the same media are
+        coalesced, and updates that fail stay in the outbox to be retried later. While
+        AniList is unavailable, the flush is deferred to a later sync.
         """
-        if not self.queued_batch_requests:
+        if not self.batch_history_items:
+            self._deferred_fingerprints.clear()
             return
 
+        media_ids = list(
+            dict.fromkeys(after.media_id for *_, after in self.batch_history_items)
+        )
         log.info(
             f"[{self.profile_name}] Syncing "
-            f"{len(self.queued_batch_requests)} items to AniList "
+            f"{len(media_ids)} items to AniList "
             f"with batch mode "
-            f"$${{anilist_id: {[m.media_id for m in self.queued_batch_requests]}}}$$"
+            f"$${{anilist_id: {media_ids}}}$$"
         )
 
         try:
-            await self.anilist_client.batch_update_anime_entries(
-                self.queued_batch_requests
-            )
+            written = set(await self.outbox.flush())
 
             log.success(
                 f"[{self.profile_name}] Synced "
-                f"{len(self.queued_batch_requests)} items to AniList "
+                f"{len(written)} items to AniList "
                 f"with batch mode $${{anilist_id: "
-                f"{[m.media_id for m in self.queued_batch_requests]}}}$$"
+                f"{[i for i in media_ids if i in written]}}}$$"
             )
 
             for item, child_item, before_state, after_state in self.batch_history_items:
+                if after_state.media_id not in written:
+                    continue  # Dropped as AniList changed since, or retried later
                 await self._create_sync_history(
                     item=item,
                     child_item=child_item,
@@ -765,6 +1043,19 @@ class BaseSyncClient[
                     outcome=SyncOutcome.SYNCED,
                 )
 
+            for item, anilist_ids in self._deferred_fingerprints.values():
+                if all(
+                    i not in self.outbox and (i in written or i not in media_ids)
+                    for i in anilist_ids
+                ):
+                    await self._record_fingerprint(item, anilist_ids)
+
+        except AniListUnavailableError:
+            log.warning(
+                f"[{self.profile_name}] AniList is unavailable, deferring "
+                f"{len(media_ids)} queued updates until it recovers"
+            )
+
         except Exception as e:
             error_msg = str(e)
             log.error(f"Batch sync failed: {e}", exc_info=True)
@@ -783,8 +1074,8 @@ class BaseSyncClient[
             raise
 
         finally:
-            self.queued_batch_requests.clear()
             self.batch_history_items.clear()
+            self._deferred_fingerprints.clear()
 
     async def _get_plex_media_list(
         self,
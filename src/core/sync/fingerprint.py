@@ -0,0 +1,139 @@
+"""Sync Fingerprint Module."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, select
+
+from src.config.database import db
+from src.models.db.sync_fingerprint import SyncFingerprint
+
+__all__ = ["SyncFingerprintStore"]
+
+
+class SyncFingerprintStore:
+    """Fingerprints of the state a profile's Plex items were last synced with.
+
+    A fingerprint is a digest of everything a sync of an item depends on. Items
+    whose fingerprint matches the one stored after their last successful sync can be
+    skipped without mapping them or reading their Plex history. Fingerprints expire
+    after MAX_AGE, so state that cannot be fingerprinted cheaply (the Continue
+    Watching hub, episode reviews) is still picked up eventually.
+    """
+
+    MAX_AGE = timedelta(days=7)
+
+    def __init__(self, profile_name: str) -> None:
+        """Initialize the fingerprint store.
+
+        Args:
+            profile_name (str): Name of the profile owning the fingerprints
+        """
+        self.profile_name = profile_name
+        self._fingerprints: dict[str, SyncFingerprint] | None = None
+
+    @staticmethod
+    def digest(state: Any) -> str:
+        """Computes the fingerprint of a JSON serializable state.
+
+        Args:
+            state (Any): The state to fingerprint
+
+        Returns:
+            str: Hex digest of the state.
+        """
+        return hashlib.sha256(
+            json.dumps(state, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _load(self) -> dict[str, SyncFingerprint]:
+        """Loads the fingerprints of the profile, once per store.
+
+        Returns:
+            dict[str, SyncFingerprint]: Fingerprints keyed by Plex rating key.
+        """
+        if self._fingerprints is None:
+            with db() as ctx:
+                self._fingerprints = {
+                    row.plex_rating_key: row
+                    for row in ctx.session.scalars(
+                        select(SyncFingerprint).where(
+                            SyncFingerprint.profile_name == self.profile_name
+                        )
+                    )
+                }
+        return self._fingerprints
+
+    def get(self, rating_key: str) -> SyncFingerprint | None:
+        """Retrieves the unexpired fingerprint of an item.
+
+        Args:
+            rating_key (str): Plex rating key of the item
+
+        Returns:
+            SyncFingerprint | None: The stored fingerprint, None if the item has no
+                fingerprint or it expired.
+        """
+        row = self._load().get(rating_key)
+        if row is None:
+            return None
+
+        synced_at = row.synced_at
+        if synced_at.tzinfo is None:  # SQLite drops timezones
+            synced_at = synced_at.replace(tzinfo=UTC)
+        if datetime.now(UTC) - synced_at >= self.MAX_AGE:
+            return None
+        return row
+
+    def put(
+        self,
+        rating_key: str,
+        fingerprint: str,
+        anilist_ids: list[int],
+        context: str | None = None,
+    ) -> None:
+        """Stores the fingerprint of an item after a successful sync.
+
+        Args:
+            rating_key (str): Plex rating key of the item
+            fingerprint (str): The fingerprint of the synced state
+            anilist_ids (list[int]): AniList IDs the item was synced to
+            context (str | None): The fingerprint of the synced state that does not
+                depend on the item's Plex metadata
+        """
+        fingerprints = self._load()
+        row = fingerprints.get(rating_key)
+
+        with db() as ctx:
+            if row is None:
+                row = SyncFingerprint(
+                    profile_name=self.profile_name, plex_rating_key=rating_key
+                )
+            row.fingerprint = fingerprint
+            row.context = context
+            row.anilist_ids = sorted(anilist_ids)
+            row.synced_at = datetime.now(UTC)
+            fingerprints[rating_key] = ctx.session.merge(row)
+            ctx.session.commit()
+
+    def discard(self, rating_key: str) -> None:
+        """Drops the fingerprint of an item, if any.
+
+        Args:
+            rating_key (str): Plex rating key of the item
+        """
+        if self._load().pop(rating_key, None) is None:
+            return
+
+        with db() as ctx:
+            ctx.session.execute(
+                delete(SyncFingerprint).where(
+                    SyncFingerprint.profile_name == self.profile_name,
+                    SyncFingerprint.plex_rating_key == rating_key,
+                )
+            )
+            ctx.session.commit()
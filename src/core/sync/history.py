@@ -0,0 +1,163 @@
+"""Sync History Writer Module."""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from src import log
+from src.config.database import db
+from src.models.db.sync_history import MediaType, SyncHistory, SyncOutcome
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+__all__ = ["SyncHistoryWriter"]
+
+_ERROR_OUTCOMES = (SyncOutcome.NOT_FOUND, SyncOutcome.FAILED)
+
+type _UpsertKey = tuple[str, str | None, MediaType, SyncOutcome]
+
+
+class SyncHistoryWriter:
+    """Buffered writer of a profile's sync history records.
+
+    Records are accumulated in memory and written in a single transaction once
+    FLUSH_SIZE records are buffered or FLUSH_INTERVAL seconds have passed since the
+    last flush, instead of committing every record on its own.
+
+    The write semantics of each record are unchanged and applied in order:
+
+    - A synced record deletes the not found and failed records of the same item.
+    - A skipped record is not written.
+    - A not found or failed record updates the existing record with the same item
+      and outcome instead of adding another one, unless its error is unchanged.
+    """
+
+    FLUSH_SIZE = 100
+    FLUSH_INTERVAL = 5.0
+
+    def __init__(self, profile_name: str) -> None:
+        """Initialize the history writer.
+
+        Args:
+            profile_name (str): Name of the profile owning the records
+        """
+        self.profile_name = profile_name
+        self._buffer: list[SyncHistory] = []
+        self._flushed_at = time.monotonic()
+
+    def __len__(self) -> int:
+        """Return the number of buffered records."""
+        return len(self._buffer)
+
+    def add(self, record: SyncHistory) -> None:
+        """Buffers a record, flushing the buffer if it is due.
+
+        Args:
+            record (SyncHistory): The transient record to write
+        """
+        record.timestamp = record.timestamp or datetime.now(UTC)
+        self._buffer.append(record)
+
+        if (
+            len(self._buffer) >= self.FLUSH_SIZE
+            or time.monotonic() - self._flushed_at >= self.FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes every buffered record in a single transaction."""
+        self._flushed_at = time.monotonic()
+        if not self._buffer:
+            return
+
+        records, self._buffer = self._buffer, []
+
+        with db() as ctx:
+            try:
+                # Not found and failed records the buffered records may replace
+                existing: dict[_UpsertKey, list[SyncHistory]] = defaultdict(list)
+                for row in ctx.session.scalars(
+                    select(SyncHistory).where(
+                        SyncHistory.profile_name == self.profile_name,
+                        SyncHistory.plex_rating_key.in_(
+                            {r.plex_rating_key for r in records}
+                        ),
+                        SyncHistory.outcome.in_(_ERROR_OUTCOMES),
+                    )
+                ):
+                    existing[self._get_upsert_key(row)].append(row)
+
+                for record in records:
+                    self._apply(ctx.session, record, existing)
+
+                ctx.session.commit()
+            except Exception as e:
+                log.error(
+                    f"[{self.profile_name}] Failed to write {len(records)} sync "
+                    f"history records: {e}",
+                    exc_info=True,
+                )
+                ctx.session.rollback()
+
+    def _apply(
+        self,
+        session: Session,
+        record: SyncHistory,
+        existing: dict[_UpsertKey, list[SyncHistory]],
+    ) -> None:
+        """Applies a buffered record to the session.
+
+        Args:
+            session (Session): Session of the flush transaction
+            record (SyncHistory): The buffered record
+            existing (dict[_UpsertKey, list[SyncHistory]]): Not found and failed
+                records of the buffered items, updated as records are applied
+        """
+        if record.outcome == SyncOutcome.SYNCED:
+            for outcome in _ERROR_OUTCOMES:
+                for child_key in {record.plex_child_rating_key, None}:
+                    key = (
+                        record.plex_rating_key,
+                        child_key,
+                        record.plex_type,
+                        outcome,
+                    )
+                    for row in existing.pop(key, []):
+                        if row in session.new:
+                            session.expunge(row)
+                        else:
+                            session.delete(row)
+
+        if record.outcome == SyncOutcome.SKIPPED:
+            return
+
+        if record.outcome in _ERROR_OUTCOMES:
+            rows = existing[self._get_upsert_key(record)]
+            if rows:
+                row = rows[0]
+                if row.error_message == record.error_message:
+                    return
+                row.before_state = record.before_state
+                row.after_state = record.after_state
+                row.error_message = record.error_message
+                row.timestamp = record.timestamp
+                return
+            rows.append(record)
+
+        session.add(record)
+
+    @staticmethod
+    def _get_upsert_key(record: SyncHistory) -> _UpsertKey:
+        """Gets the key a not found or failed record is upserted by."""
+        return (
+            record.plex_rating_key,
+            record.plex_child_rating_key,
+            record.plex_type,
+            record.outcome,
+        )
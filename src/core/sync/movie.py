@@ -8,8 +8,14 @@ from tzlocal import get_localzone
 from src import log
 from src.core.sync.base import BaseSyncClient, ParsedGuids
 from src.core.sync.stats import ItemIdentifier
+from src.exceptions import AniListUnavailableError
 from src.models.db.animap import AniMap
-from src.models.schemas.anilist import FuzzyDate, Media, MediaListStatus
+from src.models.schemas.anilist import (
+    FuzzyDate,
+    Media,
+    MediaListStatus,
+    MediaProjection,
+)
 
 
 class MovieSyncClient(BaseSyncClient[Movie, Movie, list[Movie]]):
@@ -43,7 +49,7 @@ class MovieSyncClient(BaseSyncClient[Movie, Movie, list[Movie]]):
         guids = ParsedGuids.from_guids(item.guids)
 
         animapping: AniMap = next(
-            self.animap_client.get_mappings(
+            self._get_mappings(
                 imdb=guids.imdb, tmdb=guids.tmdb, tvdb=guids.tvdb, is_movie=True
             ),
             AniMap(
@@ -58,13 +64,15 @@ class MovieSyncClient(BaseSyncClient[Movie, Movie, list[Movie]]):
         try:
             if animapping.anilist_id:
                 anilist_media = await self.anilist_client.get_anime(
-                    animapping.anilist_id
+                    animapping.anilist_id, MediaProjection.SYNC_MINIMAL
                 )
             else:
                 _anilist_media = await self.search_media(item, item)
                 if not _anilist_media:
                     return
                 anilist_media = _anilist_media
+        except AniListUnavailableError:
+            raise
         except Exception:
             log.error(
                 f"Failed to fetch AniList data for {self._debug_log_title(item)}: "
@@ -131,7 +139,7 @@ class MovieSyncClient(BaseSyncClient[Movie, Movie, list[Movie]]):
         """
         is_viewed = item.viewCount > 0
         is_partially_viewed = item.viewOffset > 0
-        is_on_continue_watching = self.plex_client.is_on_continue_watching(item)
+        is_on_continue_watching = await self.plex_client.is_on_continue_watching(item)
 
         # We've already watched it and are in the process of watching it again
         if is_viewed and is_on_continue_watching:
@@ -143,7 +151,7 @@ class MovieSyncClient(BaseSyncClient[Movie, Movie, list[Movie]]):
         if is_on_continue_watching:
             return MediaListStatus.PAUSED
 
-        is_on_watchlist = self.plex_client.is_on_watchlist(item)
+        is_on_watchlist = await self.plex_client.is_on_watchlist(item)
 
         # We've watched part of it and it's not on continue watching. However, we've
         # watchlisted it
@@ -6,16 +6,23 @@ from collections import Counter
 from collections.abc import AsyncIterator
 from datetime import datetime
 from math import isnan
-from typing import Literal
+from typing import Any, Literal
 
+from async_lru import alru_cache
 from plexapi.video import Episode, EpisodeHistory, MovieHistory, Season, Show
 from tzlocal import get_localzone
 
 from src import log
 from src.core.sync.base import BaseSyncClient, ParsedGuids
 from src.core.sync.stats import ItemIdentifier, SyncOutcome
+from src.exceptions import AniListUnavailableError
 from src.models.db.animap import AniMap, EpisodeMapping
-from src.models.schemas.anilist import FuzzyDate, Media, MediaListStatus
+from src.models.schemas.anilist import (
+    FuzzyDate,
+    Media,
+    MediaListStatus,
+    MediaProjection,
+)
 from src.utils.cache import gattl_cache, generic_hash, glru_cache
 
 
@@ -55,14 +62,14 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
         """
         guids = ParsedGuids.from_guids(item.guids)
 
-        seasons = self.__get_wanted_seasons(item)
+        seasons = await self.__get_wanted_seasons(item)
         if not seasons:
             return
 
         # Pre-fetch all episodes of the show. Instead of fetching episodes for each
         # season individually, we can fetch all episodes at once and filter them later.
         episodes_by_season: dict[int, list[Episode]] = {idx: [] for idx in seasons}
-        _wanted_episodes = self.__get_wanted_episodes(item)
+        _wanted_episodes = await self.__get_wanted_episodes(item)
         for episode in _wanted_episodes:
             if episode.parentIndex in episodes_by_season:
                 episodes_by_season[episode.parentIndex].append(episode)
@@ -78,9 +85,7 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
             )
 
         animappings = list(
-            self.animap_client.get_mappings(
-                tmdb=guids.tmdb, tvdb=guids.tvdb, is_movie=False
-            )
+            self._get_mappings(tmdb=guids.tmdb, tvdb=guids.tvdb, is_movie=False)
         )
 
         for animapping in animappings:
@@ -122,8 +127,10 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
 
             try:
                 anilist_media = await self.anilist_client.get_anime(
-                    animapping.anilist_id
+                    animapping.anilist_id, MediaProjection.SYNC_MINIMAL
                 )
+            except AniListUnavailableError:
+                raise
             except Exception:
                 log.error(
                     f"Failed to fetch AniList data for {
@@ -226,6 +233,8 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
                         f"{self._debug_log_ids(item.ratingKey, season.guid, guids)}"
                     )
                 anilist_media = _anilist_media
+            except AniListUnavailableError:
+                raise
             except Exception:
                 log.error(
                     f"Failed to fetch AniList data for {self._debug_log_title(item)}",
@@ -308,17 +317,45 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
         Returns:
             list[ItemIdentifier]: All episode identifiers that should be tracked.
         """
-        episodes = self.__get_wanted_episodes(item)
+        episodes = await self.__get_wanted_episodes(item)
         if not episodes:
             return []
 
         return ItemIdentifier.from_items(episodes)
 
-    @glru_cache(
-        maxsize=1,
-        key=lambda self, item: generic_hash(id(self), item.ratingKey),
-    )
-    def __get_wanted_seasons(self, item: Show) -> dict[int, Season]:
+    async def _get_children_fingerprint(self, item: Show) -> list[Any]:
+        """Gets the ratings and reviews of a show's wanted seasons and episodes.
+
+        Season and episode ratings take precedence over the show's own rating when
+        calculating scores, and season reviews over the show's own review when
+        choosing notes, so they are part of the show's fingerprint. The children
+        are shared with the sync of the show, so they are only read once.
+
+        Args:
+            item (Show): Plex show item.
+
+        Returns:
+            list[Any]: Rating key, rating and rated timestamp of every wanted season
+                and episode, followed by the review of every wanted season when
+                notes are synced.
+        """
+        seasons = await self.__get_wanted_seasons(item)
+        episodes = await self.__get_wanted_episodes(item)
+        state: list[Any] = [
+            [child.ratingKey, child.userRating, child.lastRatedAt]
+            for child in [*seasons.values(), *episodes]
+        ]
+        if self.fingerprint_reviews:
+            state.extend(
+                [
+                    [season.ratingKey, await self.plex_client.get_user_review(season)]
+                    for season in seasons.values()
+                ]
+            )
+        return state
+
+    @alru_cache(maxsize=32, ttl=30)  # Enough for every concurrent sync worker
+    async def __get_wanted_seasons(self, item: Show) -> dict[int, Season]:
         """Get seasons that are wanted for syncing.
 
         Args:
@@ -329,7 +366,7 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
         """
         return {
             s.index: s
-            for s in item.seasons() or []
+            for s in await self.plex_client.get_seasons(item) or []
             if s is not None
             and s.leafCount  # Skip empty seasons
             and (
@@ -339,11 +376,8 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
             )
         }
 
-    @glru_cache(
-        maxsize=1,
-        key=lambda self, item: generic_hash(id(self), item.ratingKey),
-    )
-    def __get_wanted_episodes(self, item: Show) -> list[Episode]:
+    @alru_cache(maxsize=32, ttl=30)  # Enough for every concurrent sync worker
+    async def __get_wanted_episodes(self, item: Show) -> list[Episode]:
         """Get episodes that are wanted for syncing.
 
         Args:
@@ -352,11 +386,15 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
         Returns:
             list[Episode]: List of episodes to process.
         """
-        seasons = self.__get_wanted_seasons(item)
+        seasons = await self.__get_wanted_seasons(item)
         if not seasons:
             return []
 
-        return [e for e in item.episodes() if e.parentIndex in seasons]
+        return [
+            e
+            for e in await self.plex_client.get_episodes(item)
+            if e.parentIndex in seasons
+        ]
 
     async def _calculate_status(
         self,
@@ -389,7 +427,7 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
 
         is_online_item = self.plex_client.is_online_item(item)
 
-        continue_watching_episode = self.plex_client.get_continue_watching(item)
+        continue_watching_episode = await self.plex_client.get_continue_watching(item)
         is_parent_on_continue_watching = bool(continue_watching_episode)
         is_on_continue_watching = continue_watching_episode in all_episodes
 
@@ -425,7 +463,7 @@ class ShowSyncClient(BaseSyncClient[Show, Season, list[Episode]]):
         if is_in_deck_window and is_online_item:
             return MediaListStatus.CURRENT
 
-        is_on_watchlist = self.plex_client.is_on_watchlist(item)
+        is_on_watchlist = await self.plex_client.is_on_watchlist(item)
 
         # We've watched some episodes but it's no longer on continue watching.
         # However, it's on the watchlist
@@ -102,6 +102,24 @@ class AniListSearchError(AniListQueryError):
     status_code = 502
 
 
+class AniListMediaNotFoundError(AniListQueryError, KeyError):
+    """Requested AniList media does not exist."""
+
+    status_code = 404
+
+
+class AniListQueryComplexityError(AniListQueryError):
+    """AniList rejected a query for exceeding its maximum complexity."""
+
+    status_code = 502
+
+
+class AniListUnavailableError(AniListError):
+    """AniList is unreachable and requests are paused until it recovers."""
+
+    status_code = 503
+
+
 # Plex client errors
 class PlexError(PlexAniBridgeError):
     """Base class for Plex-related failures."""
@@ -1,17 +1,25 @@
 """Models for PlexAniBridge database tables."""
 
+from src.models.db.anilist_media import AniListMedia
+from src.models.db.anilist_outbox import AniListOutboxEntry
 from src.models.db.animap import AniMap
 from src.models.db.base import Base
 from src.models.db.housekeeping import Housekeeping
 from src.models.db.pin import Pin
+from src.models.db.plex_snapshot import PlexSnapshotItem
 from src.models.db.provenance import AniMapProvenance
+from src.models.db.sync_fingerprint import SyncFingerprint
 from src.models.db.sync_history import SyncHistory
 
 __all__ = [
+    "AniListMedia",
+    "AniListOutboxEntry",
     "AniMap",
     "AniMapProvenance",
     "Base",
     "Housekeeping",
     "Pin",
+    "PlexSnapshotItem",
+    "SyncFingerprint",
     "SyncHistory",
 ]
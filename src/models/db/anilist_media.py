@@ -0,0 +1,28 @@
+"""AniList Media Cache Model Module."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.db.base import Base
+
+__all__ = ["AniListMedia"]
+
+
+class AniListMedia(Base):
+    """Model for the AniList media cache table.
+
+    Stores AniList media metadata (without any user list information) so that it
+    survives restarts and can be shared between profiles.
+    """
+
+    __tablename__ = "anilist_media"
+
+    anilist_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str | None] = mapped_column(String, nullable=True)
+    data: Mapped[dict[str, Any]] = mapped_column(JSON)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
+    )
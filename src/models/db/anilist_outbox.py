@@ -0,0 +1,50 @@
+"""AniList Outbox Model Module."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.db.base import Base
+
+__all__ = ["AniListOutboxEntry"]
+
+
+class AniListOutboxEntry(Base):
+    """Model for the AniList outbox table.
+
+    Holds list entry updates that still have to be written to AniList. There is at
+    most one row per profile and media, so newer updates replace pending ones. Each
+    update keeps the `updatedAt` of the AniList entry it was computed from.
+    """
+
+    __tablename__ = "anilist_outbox"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    profile_name: Mapped[str] = mapped_column(String, index=True)
+    media_id: Mapped[int] = mapped_column(Integer)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON)
+    base_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    revision: Mapped[int] = mapped_column(Integer, default=0)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_anilist_outbox_profile_media", "profile_name", "media_id", unique=True
+        ),
+    )
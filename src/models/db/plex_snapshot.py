@@ -0,0 +1,62 @@
+"""Plex Snapshot Model Module."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, Boolean, DateTime, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.db.base import Base
+
+__all__ = ["PlexSnapshotItem"]
+
+
+class PlexSnapshotItem(Base):
+    """Model for the Plex snapshot table.
+
+    Holds a lightweight copy of the top level items of a profile's Plex library
+    sections: their identifiers, their season and episode counts, and the view state
+    of the profile's Plex user. `watched` tells whether the item, or any of its
+    seasons or episodes, was watched or rated. There is one row per profile, section
+    and item.
+    """
+
+    __tablename__ = "plex_snapshot"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    profile_name: Mapped[str] = mapped_column(String, index=True)
+    section_key: Mapped[str] = mapped_column(String)
+    rating_key: Mapped[str] = mapped_column(String)
+    type: Mapped[str] = mapped_column(String)
+    title: Mapped[str | None] = mapped_column(String, nullable=True)
+    guid: Mapped[str | None] = mapped_column(String, nullable=True)
+    guids: Mapped[list[str]] = mapped_column(JSON, default=list)
+    child_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    leaf_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    view_count: Mapped[int] = mapped_column(Integer, default=0)
+    user_rating: Mapped[float | None] = mapped_column(Float, nullable=True)
+    added_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_viewed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_rated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    watched: Mapped[bool] = mapped_column(Boolean, default=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_plex_snapshot_profile_section_item",
+            "profile_name",
+            "section_key",
+            "rating_key",
+            unique=True,
+        ),
+    )
@@ -0,0 +1,41 @@
+"""Sync Fingerprint Model Module."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.db.base import Base
+
+__all__ = ["SyncFingerprint"]
+
+
+class SyncFingerprint(Base):
+    """Model for the sync fingerprint table.
+
+    Holds a digest of the Plex, mapping and AniList state an item was last
+    successfully synced with, along with the AniList IDs it was synced to. The
+    context is a digest of the part of that state that does not depend on the
+    item's Plex metadata. There is one row per profile and top level Plex item.
+    """
+
+    __tablename__ = "sync_fingerprint"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    profile_name: Mapped[str] = mapped_column(String, index=True)
+    plex_rating_key: Mapped[str] = mapped_column(String)
+    anilist_ids: Mapped[list[int]] = mapped_column(JSON, default=list)
+    fingerprint: Mapped[str] = mapped_column(String)
+    context: Mapped[str | None] = mapped_column(String, nullable=True)
+    synced_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_sync_fingerprint_profile_item",
+            "profile_name",
+            "plex_rating_key",
+            unique=True,
+        ),
+    )
@@ -566,6 +566,34 @@ class MediaListWithMedia(MediaList):
     media: MediaWithoutList | None = None
 
 
+class MediaListSaveResult(AniListBaseModel):
+    """Model representing the fields returned when saving a media list entry."""
+
+    id: int
+    media_id: int
+    updated_at: UTCDateTime | None = None
+
+
+class MediaProjection(StrEnum):
+    """Named selections of media fields to fetch from AniList."""
+
+    SYNC_MINIMAL = "sync-minimal"  # Fields needed to sync a list entry
+    UI_DISPLAY = "ui-display"  # Every field, including titles and cover images
+
+    def model_dump_graphql(self) -> str:
+        """Generate the GraphQL query fields of this projection.
+
+        Returns:
+            str: The GraphQL query fields.
+        """
+        if self is MediaProjection.SYNC_MINIMAL:
+            return (
+                "id\nformat\nstatus\nepisodes\n"
+                f"mediaListEntry {{\n{MediaList.model_dump_graphql()}\n}}"
+            )
+        return Media.model_dump_graphql()
+
+
 class MediaListGroupWithMedia(MediaListGroup[MediaListWithMedia]):
     """Model representing a group of media list entries with media info."""
 
@@ -583,3 +611,23 @@ class MediaConnection(AniListBaseModel):
 
     nodes: list[Media]
     pageInfo: PageInfo = PageInfo()
+
+
+class MediaPage(AniListBaseModel):
+    """Model representing a page of media entries."""
+
+    page_info: PageInfo | None = None
+    media: list[Media | None] = []
+
+
+class MediaListPage(AniListBaseModel):
+    """Model representing a page of media list entries with media info."""
+
+    page_info: PageInfo | None = None
+    media_list: list[MediaListWithMedia] = []
+
+
+class GraphQLResponse[DataT](BaseModel):
+    """Model representing the envelope of a GraphQL response."""
+
+    data: DataT
@@ -8,18 +8,66 @@ from typing import Any
 import aiohttp
 from limiter import Limiter
 
-from src import __version__, log
+from src import log
+from src.utils.requests import create_client_session
 
 __all__ = ["PlexCommunityClient"]
 
 plex_community_limiter = Limiter(rate=300 / 60, capacity=30, jitter=True)
 
+_WATCH_ACTIVITY_FIELDS = """
+nodes {
+    ... on ActivityWatchHistory {
+        id
+        date
+        metadataItem {
+            id
+            type
+            title
+            index
+            parent {
+                id
+                type
+                title
+                index
+            }
+            grandparent {
+                id
+                type
+                title
+                index
+            }
+        }
+        userV2 {
+            id
+        }
+    }
+}
+pageInfo {
+    endCursor
+    hasNextPage
+}
+"""
+
+_REVIEW_FIELDS = """
+... on ActivityReview {
+    message
+}
+... on ActivityWatchReview {
+    message
+}
+"""
+
 
 class PlexCommunityClient:
     """Client for interacting with the Plex Community API."""
 
     API_URL = "https://community.plex.tv/api"
 
+    REVIEW_BATCH_SIZE = 25
+    WATCH_ACTIVITY_BATCH_SIZE = 10
+    WATCH_ACTIVITY_PAGE_SIZE = 50
+
     def __init__(self, plex_token: str) -> None:
         """Initialize the PlexCommunityClient with a Plex token.
 
@@ -35,10 +83,9 @@ class PlexCommunityClient:
             headers = {
                 "Accept": "application/json",
                 "Content-Type": "application/json",
-                "User-Agent": f"PlexAniBridge/{__version__}",
                 "X-Plex-Token": self.plex_token,
             }
-            self._session = aiohttp.ClientSession(headers=headers)
+            self._session = create_client_session(headers)
         return self._session
 
     async def close(self):
@@ -76,69 +123,92 @@ class PlexCommunityClient:
         Returns:
             list: A list of PlexAPI EpisodeHistory or MovieHistory objects.
         """
-        query = """
-        query GetWatchActivity(
-            $first: PaginationInt!, $after: String, $metadataID: ID
-        ) {
-            activityFeed(
-                first: $first
-                after: $after
-                metadataID: $metadataID
-                types: [WATCH_HISTORY]
-                includeDescendants: true
-            ) {
-                nodes {
-                    ... on ActivityWatchHistory {
-                        id
-                        date
-                        metadataItem {
-                            id
-                            type
-                            title
-                            index
-                            parent {
-                                id
-                                type
-                                title
-                                index
-                            }
-                            grandparent {
-                                id
-                                type
-                                title
-                                index
-                            }
-                        }
-                        userV2 {
-                            id
-                        }
-                    }
-                }
-                pageInfo {
-                    endCursor
-                    hasNextPage
-                }
-            }
-        }
+        return (await self.batch_get_watch_activity([metadata_id]))[metadata_id]
+
+    async def batch_get_watch_activity(
+        self, metadata_ids: list[str]
+    ) -> dict[str, list]:
+        """Get watch activity for multiple metadata IDs from the Plex Community API.
+
+        Up to WATCH_ACTIVITY_BATCH_SIZE activity feeds are aliased into a single
+        GraphQL document. Feeds with more pages are requested again with their own
+        cursor until exhausted, and separate batches are fetched concurrently.
+
+        Args:
+            metadata_ids (list[str]): The metadata IDs to fetch watch activity for.
+
+        Returns:
+            dict[str, list]: Watch activity nodes keyed by metadata ID.
         """
+        unique_ids = list(dict.fromkeys(metadata_ids))
+        batches = await asyncio.gather(
+            *(
+                self._get_watch_activity_batch(
+                    unique_ids[i : i + self.WATCH_ACTIVITY_BATCH_SIZE]
+                )
+                for i in range(0, len(unique_ids), self.WATCH_ACTIVITY_BATCH_SIZE)
+            )
+        )
+        return {k: v for batch in batches for k, v in batch.items()}
+
+    async def _get_watch_activity_batch(
+        self, metadata_ids: list[str]
+    ) -> dict[str, list]:
+        """Fetch every page of watch activity for a batch of metadata IDs.
+
+        Args:
+            metadata_ids (list[str]): The metadata IDs in the batch.
+
+        Returns:
+            dict[str, list]: Watch activity nodes keyed by metadata ID.
+        """
+        res: dict[str, list] = {metadata_id: [] for metadata_id in metadata_ids}
+        cursors: dict[str, str | None] = dict.fromkeys(metadata_ids)
+
+        while cursors:
+            pending = list(cursors.items())
+            variable_defs = ", ".join(
+                f"$m{i}: ID, $a{i}: String" for i in range(len(pending))
+            )
+            feeds = "\n".join(
+                f"""
+                f{i}: activityFeed(
+                    first: $first
+                    after: $a{i}
+                    metadataID: $m{i}
+                    types: [WATCH_HISTORY]
+                    includeDescendants: true
+                ) {{
+                    {_WATCH_ACTIVITY_FIELDS}
+                }}
+                """
+                for i in range(len(pending))
+            )
+            query = f"""
+            query BatchGetWatchActivity($first: PaginationInt!, {variable_defs}) {{
+                {feeds}
+            }}
+            """
+
+            variables: dict[str, Any] = {"first": self.WATCH_ACTIVITY_PAGE_SIZE}
+            for i, (metadata_id, after) in enumerate(pending):
+                variables[f"m{i}"] = metadata_id
+                variables[f"a{i}"] = after
 
-        res = []
-        current_after = None
-        while True:
             response = await self._make_request(
-                query,
-                {"metadataID": metadata_id, "first": 50, "after": current_after},
-                "GetWatchActivity",
+                query, variables, "BatchGetWatchActivity"
             )
+            response_data = response.get("data") or {}
 
-            data = response["data"]["activityFeed"]
-            if not data or not data["nodes"]:
-                break
-            res.extend(data["nodes"])
+            cursors = {}
+            for i, (metadata_id, _) in enumerate(pending):
+                data = response_data.get(f"f{i}")
+                if not data or not data["nodes"]:
+                    continue
+                res[metadata_id].extend(data["nodes"])
 
-            if not data["pageInfo"]["hasNextPage"]:
-                break
-            current_after = data["pageInfo"]["endCursor"]
+                if data["pageInfo"]["hasNextPage"]:
+                    cursors[metadata_id] = data["pageInfo"]["endCursor"]
 
         return res
 
@@ -151,27 +221,68 @@ class PlexCommunityClient:
         Returns:
             str: The review message, or None if no review is found
         """
-        query = """
-        query GetReview($metadataID: ID!) {
-            metadataReviewV2(metadata: {id: $metadataID}) {
-                ... on ActivityReview {
-                    message
-                }
-                ... on ActivityWatchReview {
-                    message
-                }
-            }
-        }
+        return (await self.batch_get_reviews([metadata_id]))[metadata_id]
+
+    async def batch_get_reviews(self, metadata_ids: list[str]) -> dict[str, str | None]:
+        """Fetches reviews for multiple metadata IDs.
+
+        Up to REVIEW_BATCH_SIZE review lookups are aliased into a single GraphQL
+        document, and separate batches are fetched concurrently.
+
+        Args:
+            metadata_ids (list[str]): The metadata IDs to fetch reviews for
+
+        Returns:
+            dict[str, str | None]: Review messages keyed by metadata ID, None if no
+                review is found
+        """
+        unique_ids = list(dict.fromkeys(metadata_ids))
+        batches = await asyncio.gather(
+            *(
+                self._get_reviews_batch(unique_ids[i : i + self.REVIEW_BATCH_SIZE])
+                for i in range(0, len(unique_ids), self.REVIEW_BATCH_SIZE)
+            )
+        )
+        return {k: v for batch in batches for k, v in batch.items()}
+
+    async def _get_reviews_batch(
+        self, metadata_ids: list[str]
+    ) -> dict[str, str | None]:
+        """Fetches reviews for a batch of metadata IDs in a single request.
+
+        Args:
+            metadata_ids (list[str]): The metadata IDs in the batch
+
+        Returns:
+            dict[str, str | None]: Review messages keyed by metadata ID
+        """
+        variable_defs = ", ".join(f"$m{i}: ID!" for i in range(len(metadata_ids)))
+        reviews = "\n".join(
+            f"""
+            r{i}: metadataReviewV2(metadata: {{id: $m{i}}}) {{
+                {_REVIEW_FIELDS}
+            }}
+            """
+            for i in range(len(metadata_ids))
+        )
+        query = f"""
+        query BatchGetReviews({variable_defs}) {{
+            {reviews}
+        }}
         """
 
         response = await self._make_request(
-            query, {"metadataID": metadata_id}, "GetReview"
+            query,
+            {f"m{i}": metadata_id for i, metadata_id in enumerate(metadata_ids)},
+            "BatchGetReviews",
         )
-        data = response["data"]["metadataReviewV2"]
+        response_data = response.get("data") or {}
 
-        if not data or "message" not in data:
-            return None
-        return data["message"]
+        res: dict[str, str | None] = {}
+        for i, metadata_id in enumerate(metadata_ids):
+            data = response_data.get(f"r{i}")
+            res[metadata_id] = data["message"] if data and "message" in data else None
+        return res
 
     @plex_community_limiter()
     async def _make_request(
@@ -0,0 +1,98 @@
+"""Plex Executor Module."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from src import log
+
+__all__ = ["PlexExecutor"]
+
+_thread_pool: ThreadPoolExecutor | None = None
+_server_semaphores: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+class PlexExecutor:
+    """Runs blocking plexapi calls off the event loop.
+
+    plexapi performs synchronous HTTP requests through `requests`. Calling it
+    directly from a coroutine blocks the event loop, freezing the web UI, webhooks
+    and websockets for the duration of the request. This executor hands such calls
+    to a process-wide thread pool while capping how many requests may be in flight
+    against a single Plex server at once. Clients pointing at the same server share
+    the same limit.
+    """
+
+    MAX_WORKERS = 16
+    MAX_CONCURRENCY_PER_SERVER = 8
+
+    def __init__(self, server_url: str, max_concurrency: int | None = None) -> None:
+        """Initialize the executor for a Plex server.
+
+        Args:
+            server_url (str): Base URL of the Plex server the calls are made against
+            max_concurrency (int | None): Maximum number of in-flight calls against
+                the server; defaults to MAX_CONCURRENCY_PER_SERVER when None.
+        """
+        parsed_url = urlparse(server_url)
+        self.server_key = parsed_url.netloc or server_url
+        self.max_concurrency = max(
+            1,
+            self.MAX_CONCURRENCY_PER_SERVER
+            if max_concurrency is None
+            else max_concurrency,
+        )
+
+    @classmethod
+    def _get_thread_pool(cls) -> ThreadPoolExecutor:
+        """Get or create the process-wide thread pool used for Plex calls.
+
+        Returns:
+            ThreadPoolExecutor: The shared thread pool.
+        """
+        global _thread_pool
+        if _thread_pool is None:
+            log.debug(f"Creating Plex thread pool with {cls.MAX_WORKERS} workers")
+            _thread_pool = ThreadPoolExecutor(
+                max_workers=cls.MAX_WORKERS, thread_name_prefix="plex"
+            )
+        return _thread_pool
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limiter for this executor's server.
+
+        Semaphores are bound to the event loop they are first used in, so a new one
+        is created whenever the running loop changes.
+
+        Returns:
+            asyncio.Semaphore: The semaphore guarding requests to the server.
+        """
+        loop = asyncio.get_running_loop()
+        cached = _server_semaphores.get(self.server_key)
+        if cached is None or cached[0] is not loop:
+            cached = (loop, asyncio.Semaphore(self.max_concurrency))
+            _server_semaphores[self.server_key] = cached
+        return cached[1]
+
+    async def run[**P, R](
+        self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        """Run a blocking callable on the Plex thread pool.
+
+        Args:
+            func (Callable[P, R]): Blocking callable to execute
+            *args (P.args): Positional arguments passed to the callable
+            **kwargs (P.kwargs): Keyword arguments passed to the callable
+
+        Returns:
+            R: The value returned by the callable.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            return await loop.run_in_executor(
+                self._get_thread_pool(), functools.partial(func, *args, **kwargs)
+            )
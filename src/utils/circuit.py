@@ -0,0 +1,155 @@
+"""Circuit breaker utilities."""
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import Any
+
+from src import log
+
+__all__ = ["CircuitBreaker", "CircuitState"]
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Requests are rejected until the cool-down elapses
+    HALF_OPEN = "half_open"  # A single probe request decides whether to close again
+
+
+class CircuitBreaker:
+    """Circuit breaker that stops calling a service after consecutive failures.
+
+    The breaker opens once `failure_threshold` consecutive failures are recorded and
+    rejects every request until `reset_timeout` elapses. The next request is then let
+    through as a probe: a success closes the breaker, a failure opens it again with
+    the cool-down doubled, up to `max_reset_timeout`.
+
+    The state is guarded by a thread lock so a single breaker can be shared by clients
+    running in different event loops.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        max_reset_timeout: float = 600,
+        name: str = "API",
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker
+            reset_timeout (float): Seconds to wait before probing an open breaker
+            max_reset_timeout (float): Upper bound of the cool-down in seconds after
+                repeatedly failed probes
+            name (str): Name of the protected service used in log messages
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.name = name
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._cooldown = reset_timeout
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+        self._opened_at_wall: datetime | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the breaker."""
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a request made now would be rejected."""
+        with self._lock:
+            return not self._can_pass(time.monotonic())
+
+    def _can_pass(self, now: float) -> bool:
+        """Check whether a request may pass, without claiming the probe."""
+        if self._state == CircuitState.CLOSED:
+            return True
+        if self._state == CircuitState.OPEN:
+            return now >= self._opened_at + self._cooldown
+        # A probe that never reported back must not keep the breaker stuck
+        return now >= self._probe_started_at + self._cooldown
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be made, claiming the probe if one is due.
+
+        Returns:
+            bool: True if the request may be made, False if it must be rejected.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not self._can_pass(now):
+                return False
+            if self._state != CircuitState.CLOSED:
+                self._state = CircuitState.HALF_OPEN
+                self._probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the breaker."""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                log.info(f"{self.name} is reachable again, resuming requests")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._cooldown = self.reset_timeout
+            self._opened_at_wall = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker if the threshold is hit."""
+        with self._lock:
+            now = time.monotonic()
+            self._failures += 1
+
+            if self._state == CircuitState.HALF_OPEN:
+                self._cooldown = min(self._cooldown * 2, self.max_reset_timeout)
+            elif (
+                self._state == CircuitState.OPEN
+                or self._failures < self.failure_threshold
+            ):
+                return
+
+            self._state = CircuitState.OPEN
+            self._opened_at = now
+            self._opened_at_wall = self._opened_at_wall or datetime.now(UTC)
+            log.warning(
+                f"{self.name} is unavailable after {self._failures} consecutive "
+                f"failures, pausing requests for {self._cooldown:g} seconds"
+            )
+
+    def status(self) -> dict[str, Any]:
+        """Get a serializable snapshot of the breaker.
+
+        Returns:
+            dict[str, Any]: The state, consecutive failures, when the breaker opened
+                and when the next probe is allowed.
+        """
+        with self._lock:
+            retry_at = None
+            if self._state != CircuitState.CLOSED:
+                started = (
+                    self._opened_at
+                    if self._state == CircuitState.OPEN
+                    else self._probe_started_at
+                )
+                remaining = max(started + self._cooldown - time.monotonic(), 0)
+                retry_at = datetime.now(UTC) + timedelta(seconds=remaining)
+
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._failures,
+                "opened_at": self._opened_at_wall.isoformat()
+                if self._opened_at_wall
+                else None,
+                "retry_at": retry_at.isoformat() if retry_at else None,
+            }
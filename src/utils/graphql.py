@@ -0,0 +1,112 @@
+"""GraphQL query utilities."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+__all__ = ["GraphQLDocument", "estimate_complexity", "pack_by_complexity"]
+
+_ARGUMENTS_RE = re.compile(r"\([^()]*\)")
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_WHITESPACE_RE = re.compile(r'("(?:[^"\\]|\\.)*")|\s+')
+_TOKEN_RE = re.compile(r"\.\.\.\s*[_A-Za-z]\w*|[_A-Za-z]\w*\s*:|[_A-Za-z]\w*")
+
+
+@dataclass(frozen=True)
+class GraphQLDocument:
+    """A GraphQL document built once and reused across requests.
+
+    Documents are compacted when built, so requests carry no insignificant
+    whitespace. The SHA-256 hash identifies the document for persisted queries.
+    """
+
+    query: str
+    sha256: str
+
+    @classmethod
+    def build(cls, query: str) -> GraphQLDocument:
+        """Build a document from a query string.
+
+        Args:
+            query (str): GraphQL query string
+
+        Returns:
+            GraphQLDocument: The compacted document.
+        """
+        compact = _WHITESPACE_RE.sub(lambda m: m.group(1) or " ", query).strip()
+        return cls(compact, hashlib.sha256(compact.encode()).hexdigest())
+
+
+def estimate_complexity(selection: str) -> int:
+    """Estimate the complexity of a GraphQL selection set.
+
+    Mirrors the default complexity rule of GraphQL servers such as AniList, where
+    every selected field costs one point plus the cost of its own selection. That
+    makes the complexity of a selection equal to the number of fields it selects.
+    Arguments, aliases and fragment spreads are not counted.
+
+    Args:
+        selection (str): GraphQL selection set, with or without enclosing braces
+
+    Returns:
+        int: Estimated complexity of the selection.
+    """
+    selection = _STRING_RE.sub("", selection)
+    while True:  # Strip (possibly nested) argument lists
+        stripped = _ARGUMENTS_RE.sub("", selection)
+        if stripped == selection:
+            break
+        selection = stripped
+
+    return sum(
+        1
+        for token in _TOKEN_RE.findall(selection)
+        if not token.startswith("...") and not token.endswith(":")
+    )
+
+
+def pack_by_complexity[T](
+    items: Sequence[T],
+    cost: Callable[[T], int],
+    max_complexity: int,
+    max_items: int | None = None,
+    base_complexity: int = 0,
+) -> list[list[T]]:
+    """Greedily pack items into batches that stay within a complexity budget.
+
+    Items keep their order. An item that exceeds the budget on its own is placed in a
+    batch by itself so it can still be attempted.
+
+    Args:
+        items (Sequence[T]): Items to pack
+        cost (Callable[[T], int]): Function returning the complexity of an item
+        max_complexity (int): Maximum complexity of a single batch
+        max_items (int | None): Maximum number of items per batch, unlimited if None
+        base_complexity (int): Fixed complexity of each request regardless of its
+            items
+
+    Returns:
+        list[list[T]]: The packed batches.
+    """
+    batches: list[list[T]] = []
+    batch: list[T] = []
+    batch_complexity = base_complexity
+
+    for item in items:
+        item_complexity = cost(item)
+        if batch and (
+            batch_complexity + item_complexity > max_complexity
+            or (max_items is not None and len(batch) >= max_items)
+        ):
+            batches.append(batch)
+            batch = []
+            batch_complexity = base_complexity
+        batch.append(item)
+        batch_complexity += item_complexity
+
+    if batch:
+        batches.append(batch)
+    return batches
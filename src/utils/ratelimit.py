@@ -0,0 +1,144 @@
+"""Adaptive rate limiting utilities."""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Mapping
+from enum import IntEnum
+
+from src import log
+
+__all__ = ["AdaptiveRateLimiter", "RequestPriority"]
+
+
+class RequestPriority(IntEnum):
+    """Priority classes for rate-limited requests, lower values go first."""
+
+    INTERACTIVE = 0  # Lookups made on behalf of a user waiting in the web UI
+    SYNC_WRITE = 1  # Mutations that persist sync results
+    SYNC_READ = 2  # Reads made while preparing a sync
+
+
+class AdaptiveRateLimiter:
+    """Token bucket rate limiter that adapts to rate limit response headers.
+
+    The limiter starts at a conservative rate and adjusts it to the limit advertised
+    by the server through `X-RateLimit-Limit`. The bucket never holds more tokens than
+    `X-RateLimit-Remaining` reports, and `Retry-After` pauses every caller until the
+    server is ready again.
+
+    Waiting callers are served by priority first and arrival order second. The state
+    is guarded by a thread lock so a single limiter can be shared by clients running
+    in different event loops.
+    """
+
+    MIN_POLL_INTERVAL = 0.01
+
+    def __init__(
+        self, rate: float, capacity: int, window: float = 60, name: str = "API"
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate (float): Initial number of requests allowed per second
+            capacity (int): Maximum number of requests that may burst at once
+            window (float): Length in seconds of the window `X-RateLimit-Limit`
+                refers to
+            name (str): Name of the limited API used in log messages
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.window = window
+        self.name = name
+
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(
+        self, priority: RequestPriority = RequestPriority.SYNC_READ
+    ) -> None:
+        """Wait until a request of the given priority may be made.
+
+        Args:
+            priority (RequestPriority): Priority class of the request
+        """
+        entry = (int(priority), next(self._counter))
+        with self._lock:
+            heapq.heappush(self._waiters, entry)
+
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._refill(now)
+
+                    if (
+                        self._waiters[0] == entry
+                        and now >= self._blocked_until
+                        and self._tokens >= 1
+                    ):
+                        heapq.heappop(self._waiters)
+                        self._tokens -= 1
+                        return
+
+                    delay = max(
+                        self._blocked_until - now,
+                        (1 - self._tokens) / self.rate,
+                        self.MIN_POLL_INTERVAL,
+                    )
+                await asyncio.sleep(delay)
+        except BaseException:
+            with self._lock:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+            raise
+
+    def block(self, seconds: float) -> None:
+        """Pause all requests for the given number of seconds.
+
+        Args:
+            seconds (float): How long to pause requests for
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Adapt the limiter to the rate limit headers of a response.
+
+        Args:
+            headers (Mapping[str, str]): Headers of the response
+        """
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        retry_after = headers.get("Retry-After")
+
+        with self._lock:
+            if limit is not None and limit.isdigit() and int(limit) > 0:
+                rate = int(limit) / self.window
+                if rate != self.rate:
+                    log.debug(
+                        f"{self.name} rate limit changed to {limit} requests per "
+                        f"{self.window:g} seconds"
+                    )
+                    self.rate = rate
+
+            if remaining is not None and remaining.isdigit():
+                self._refill(time.monotonic())
+                self._tokens = min(self._tokens, int(remaining))
+
+        if retry_after is not None and retry_after.isdigit():
+            self.block(int(retry_after))
@@ -1,22 +1,121 @@
-"""Selective SSL Verification for Requests Module."""
+"""Shared HTTP Transport Module."""
 
+import asyncio
 import warnings
 from urllib.parse import urlparse
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
 
-from src import log
+from src import __version__, log
 
-__all__ = ["SelectiveVerifySession"]
+__all__ = [
+    "HTTP_POOL_SIZE",
+    "HTTP_POOL_SIZE_PER_HOST",
+    "SelectiveVerifySession",
+    "close_http_transport",
+    "create_client_session",
+]
+
+# Total number of pooled connections shared by all async clients
+HTTP_POOL_SIZE = 64
+# Concurrent connections allowed to a single host, matching the Plex thread pool
+HTTP_POOL_SIZE_PER_HOST = 16
+# Seconds resolved host addresses are cached for
+DNS_CACHE_TTL = 300
+# Seconds idle connections are kept alive for reuse
+KEEPALIVE_TIMEOUT = 60
+
+# Stalled connections and reads time out, but there is no limit on the total time
+# of a request so large downloads such as the mappings are not cut off
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(
+    total=None, connect=15, sock_connect=15, sock_read=60
+)
+
+_connector: tuple[asyncio.AbstractEventLoop, aiohttp.TCPConnector] | None = None
+
+
+def _get_connector() -> aiohttp.TCPConnector:
+    """Get or create the connection pool shared by all async HTTP clients.
+
+    Connectors are bound to the event loop they are created in, so a new one is
+    created whenever the running loop changes or the previous one was closed.
+
+    Returns:
+        aiohttp.TCPConnector: The shared connector.
+    """
+    global _connector
+    loop = asyncio.get_running_loop()
+    if _connector is None or _connector[0] is not loop or _connector[1].closed:
+        log.debug(
+            f"Creating HTTP connection pool with {HTTP_POOL_SIZE} connections "
+            f"({HTTP_POOL_SIZE_PER_HOST} per host)"
+        )
+        _connector = (
+            loop,
+            aiohttp.TCPConnector(
+                limit=HTTP_POOL_SIZE,
+                limit_per_host=HTTP_POOL_SIZE_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ),
+        )
+    return _connector[1]
+
+
+def create_client_session(
+    headers: dict[str, str] | None = None,
+    timeout: aiohttp.ClientTimeout | None = None,
+) -> aiohttp.ClientSession:
+    """Create an aiohttp session on top of the shared connection pool.
+
+    Sessions only hold per-client settings such as headers, so they are cheap to
+    create. Closing a session leaves the pooled connections open for other clients.
+    Compressed responses (gzip, deflate and, when the optional codecs are installed,
+    brotli and zstd) are negotiated and decoded transparently by aiohttp.
+
+    Args:
+        headers (dict[str, str] | None): Default headers sent with every request
+        timeout (aiohttp.ClientTimeout | None): Request timeouts; defaults to
+            DEFAULT_TIMEOUT when None.
+
+    Returns:
+        aiohttp.ClientSession: A session using the shared connector.
+    """
+    return aiohttp.ClientSession(
+        connector=_get_connector(),
+        connector_owner=False,
+        headers={"User-Agent": f"PlexAniBridge/{__version__}", **(headers or {})},
+        timeout=timeout or DEFAULT_TIMEOUT,
+    )
+
+
+async def close_http_transport() -> None:
+    """Close the shared connection pool and all of its connections."""
+    global _connector
+    if _connector is not None:
+        connector = _connector[1]
+        _connector = None
+        if not connector.closed:
+            await connector.close()
 
 
 class SelectiveVerifySession(requests.Session):
-    """Session that selectively disables SSL verification for whitelisted domains."""
+    """Session that selectively disables SSL verification for whitelisted domains.
 
-    def __init__(self, whitelist=None) -> None:
+    The session's connection pools are sized so every Plex worker thread can hold a
+    connection to the same server.
+    """
+
+    def __init__(self, whitelist=None, pool_maxsize: int = HTTP_POOL_SIZE_PER_HOST):
         """Initialize the session with a whitelist of domains."""
         super().__init__()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
         self.whitelist = set(whitelist or [])
         if self.whitelist:
             log.debug(
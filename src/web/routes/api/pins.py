@@ -7,6 +7,7 @@ from fastapi.routing import APIRouter
 from pydantic import BaseModel, Field
 
 from src.config.settings import SyncField
+from src.exceptions import AniListMediaNotFoundError
 from src.models.schemas.anilist import MediaWithoutList as AniListMetadata
 from src.web.services.pin_service import (
     PinEntry,
@@ -212,7 +213,7 @@ async def get_pin(
                 media.model_dump(exclude_none=True)
             )
             return entry.model_copy(update={"anilist": metadata})
-        except ClientError:
+        except (ClientError, AniListMediaNotFoundError):
             pass
 
     return entry
@@ -250,7 +251,7 @@ async def upsert_pin(
                 media.model_dump(exclude_none=True)
             )
             return entry.model_copy(update={"anilist": metadata})
-        except ClientError:
+        except (ClientError, AniListMediaNotFoundError):
             # Don't fail the save if AniList lookup fails; return bare entry
             pass
 
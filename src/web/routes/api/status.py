@@ -30,6 +30,7 @@ class ProfileRuntimeStatusModel(BaseModel):
     running: bool
     last_synced: str | None = None
     current_sync: dict | None = None
+    anilist_circuit: dict | None = None
 
 
 class ProfileStatusModel(BaseModel):
@@ -18,11 +18,12 @@ router = APIRouter()
 
 
 @router.post("", response_model=OkResponse)
-async def sync_all(poll: bool = Query(False)) -> OkResponse:
+async def sync_all(poll: bool = Query(False), force: bool = Query(False)) -> OkResponse:
     """Trigger a sync for all profiles.
 
     Args:
         poll (bool): Whether to poll for updates.
+        force (bool): Whether to sync items unchanged since their last sync.
 
     Returns:
         OkResponse: The response containing the sync status.
@@ -33,7 +34,7 @@ async def sync_all(poll: bool = Query(False)) -> OkResponse:
     scheduler = get_app_state().scheduler
     if not scheduler:
         raise SchedulerNotInitializedError("Scheduler not available")
-    await scheduler.trigger_sync(poll=poll)
+    await scheduler.trigger_sync(poll=poll, force=force)
     return OkResponse(ok=True)
 
 
@@ -58,6 +59,7 @@ async def sync_database() -> OkResponse:
 async def sync_profile(
     profile: str = Path(...),
     poll: bool = Query(False),
+    force: bool = Query(False),
     rating_keys: list[str] | None = Body(default=None, embed=True),
 ) -> OkResponse:
     """Trigger a sync for a specific profile.
@@ -65,6 +67,7 @@ async def sync_profile(
     Args:
         profile (str): The profile to sync.
         poll (bool): Whether to poll for updates.
+        force (bool): Whether to sync items unchanged since their last sync.
         rating_keys (list[str] | None): Specific rating keys to sync (if any).
 
     Returns:
@@ -77,5 +80,7 @@ async def sync_profile(
     scheduler = get_app_state().scheduler
     if not scheduler:
         raise SchedulerNotInitializedError("Scheduler not available")
-    await scheduler.trigger_sync(profile, poll=poll, rating_keys=rating_keys)
+    await scheduler.trigger_sync(
+        profile, poll=poll, force=force, rating_keys=rating_keys
+    )
     return OkResponse(ok=True)
@@ -1,10 +1,11 @@
 """Backup listing and restore service."""
 
 import contextlib
-import json
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from functools import lru_cache
+from itertools import batched
 from pathlib import Path
 from time import perf_counter
 from typing import Any
@@ -12,6 +13,7 @@ from typing import Any
 from pydantic import BaseModel
 
 from src import log
+from src.core.anilist_backup import AniListBackupStore
 from src.exceptions import (
     BackupFileNotFoundError,
     InvalidBackupFilenameError,
@@ -50,7 +52,7 @@ class RestoreSummary(BaseModel):
 
 @dataclass
 class _ParsedBackup:
-    entries: list[MediaList]
+    entries: Iterator[MediaList]
     user: str | None
 
 
@@ -72,6 +74,24 @@ class BackupService:
         bridge = self._get_profile_bridge(profile)
         return bridge.profile_config.data_path / "backups"
 
+    def _backup_path(self, profile: str, filename: str) -> tuple[Path, Path]:
+        """Resolve and validate the path of a backup file.
+
+        Returns:
+            tuple[Path, Path]: The backup directory and the backup file path.
+
+        Raises:
+            InvalidBackupFilenameError: If the filename is invalid.
+            BackupFileNotFoundError: If the file does not exist.
+        """
+        bdir = self._backup_dir(profile)
+        path = (bdir / filename).resolve()
+        if path.parent != bdir.resolve():  # Path traversal protection
+            raise InvalidBackupFilenameError("Invalid backup filename")
+        if not path.exists():
+            raise BackupFileNotFoundError("Backup file not found")
+        return bdir, path
+
     def list_backups(self, profile: str) -> list[BackupMeta]:
         """Enumerate available backups for a profile.
 
@@ -96,10 +116,9 @@ class BackupService:
         anilist_client = self._get_profile_bridge(profile).anilist_client
 
         count = 0
-        for f in sorted(bdir.glob(f"plexanibridge-{profile}.*.json")):
+        for f in AniListBackupStore(bdir, profile).list_backups():
             try:
-                parts = f.name.split(".")
-                ts_raw = parts[-2] if len(parts) >= 2 else None
+                ts_raw = AniListBackupStore.get_timestamp(f.name)
                 dt: datetime | None = None
                 if ts_raw and ts_raw.isdigit():
                     try:
@@ -127,7 +146,10 @@ class BackupService:
         return list(reversed(metas))  # Newest first
 
     def read_backup_raw(self, profile: str, filename: str) -> dict[str, Any]:
-        """Return the raw JSON content of a backup file.
+        """Return the JSON content of a backup file.
+
+        Deduplicated backups are reassembled into the same layout as legacy JSON
+        backups.
 
         Args:
             profile: Profile name
@@ -143,46 +165,30 @@ class BackupService:
             BackupFileNotFoundError: If the file does not exist.
         """
         log.debug(f"Reading raw backup $$'{filename}'$$ for profile $$'{profile}'$$")
-        bdir = self._backup_dir(profile)
-        path = (bdir / filename).resolve()
-        if path.parent != bdir.resolve():  # Path traversal protection
-            raise InvalidBackupFilenameError("Invalid backup filename")
-        if not path.exists():
-            raise BackupFileNotFoundError("Backup file not found")
-
-        with path.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        bdir, path = self._backup_path(profile, filename)
+        return AniListBackupStore(bdir, profile).read(path.name)
 
     def _parse_backup(self, profile: str, filename: str) -> _ParsedBackup:
-        """Parse a backup file and return its entries."""
+        """Parse a backup file and lazily iterate its entries."""
         log.debug(f"Parsing backup $$'{filename}'$$ for profile $$'{profile}'$$")
-        bdir = self._backup_dir(profile)
-        path = (bdir / filename).resolve()
-
-        if path.parent != bdir.resolve():
-            raise InvalidBackupFilenameError("Invalid backup filename")
-        if not path.exists():
-            raise BackupFileNotFoundError("Backup file not found")
+        bdir, path = self._backup_path(profile, filename)
+        store = AniListBackupStore(bdir, profile)
 
-        raw = json.loads(path.read_text())
         user = None
-
         with contextlib.suppress(Exception):
-            user = raw.get("user", {}).get("name")
-        entries: list[MediaList] = []
+            user = (store.read_user(path.name) or {}).get("name")
 
-        for lst in raw.get("lists", []) or []:
-            if lst.get("isCustomList"):
-                continue
-            for entry in lst.get("entries", []) or []:
-                try:
-                    entries.append(MediaList(**entry))
-                except Exception:
+        def iter_entries() -> Iterator[MediaList]:
+            for lst in store.iter_lists(path.name):
+                if lst.get("isCustomList"):
                     continue
-        log.debug(
-            f"Parsed backup entries: {len(entries)} for user $$'{user or 'unknown'}'$$"
-        )
-        return _ParsedBackup(entries=entries, user=user)
+                for entry in lst.get("entries", []) or []:
+                    try:
+                        yield MediaList(**entry)
+                    except Exception:
+                        continue
+
+        return _ParsedBackup(entries=iter_entries(), user=user)
 
     async def restore_backup(self, profile: str, filename: str) -> RestoreSummary:
         """Restore a backup file for a profile.
@@ -200,14 +206,18 @@ class BackupService:
         log.info(f"Restoring backup $$'{filename}'$$ for profile $$'{profile}'$$")
         bridge = self._get_profile_bridge(profile)
         parsed = self._parse_backup(profile, filename)
-        total = len(parsed.entries)
+        total = 0
         start = perf_counter()
         errors: list[dict[str, Any]] = []
 
         BATCH = 50
         restored = 0
-        for i in range(0, total, BATCH):
-            batch = parsed.entries[i : i + BATCH]
+        for batch_number, batch_entries in enumerate(
+            batched(parsed.entries, BATCH, strict=False)
+        ):
+            batch = list(batch_entries)
+            i = batch_number * BATCH
+            total += len(batch)
             try:
                 await bridge.anilist_client.batch_update_anime_entries(batch)
                 restored += len(batch)
@@ -21,6 +21,7 @@ from src.exceptions import (
 from src.models.db.pin import Pin
 from src.models.db.sync_history import SyncHistory, SyncOutcome
 from src.models.schemas.anilist import MediaList as AniMediaList
+from src.utils.requests import create_client_session
 from src.web.state import get_app_state
 
 __all__ = ["HistoryService", "get_history_service"]
@@ -144,7 +145,7 @@ class HistoryService:
             )
 
             async with (
-                aiohttp.ClientSession(headers=headers) as session,
+                create_client_session(headers) as session,
                 session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response,
             ):
                 # Handle token refresh on auth errors
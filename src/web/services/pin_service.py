@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 
 from src.config.database import db
 from src.config.settings import SyncField
+from src.core.pins import pin_index
 from src.models.db.pin import Pin
 from src.models.schemas.anilist import MediaWithoutList as AniListMetadata
 
@@ -147,6 +148,7 @@ class PinService:
             ctx.session.commit()
             ctx.session.refresh(pin)
 
+        pin_index.notify(profile, anilist_id, sanitized)
         return self._serialize(pin)
 
     def delete_pin(self, profile: str, anilist_id: int) -> None:
@@ -162,6 +164,8 @@ class PinService:
             ctx.session.delete(pin)
             ctx.session.commit()
 
+        pin_index.notify(profile, anilist_id, None)
+
     def _sanitize_fields(self, fields: Iterable[str]) -> list[str]:
         allowed = set(self.allowed_fields)
         sanitized: list[str] = []
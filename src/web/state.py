@@ -13,6 +13,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from src.core.anilist import AniListClient
+from src.utils.ratelimit import RequestPriority
 
 __all__ = ["AppState", "get_app_state"]
 
@@ -61,6 +62,7 @@ class AppState:
                 backup_dir=None,
                 dry_run=False,
                 profile_name="public",
+                request_priority=RequestPriority.INTERACTIVE,
             )
             await self.public_anilist.initialize()
         return self.public_anilist
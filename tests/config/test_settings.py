@@ -109,6 +109,7 @@ def test_config_profile_inherits_global_values(
     """Test that a profile inherits global settings from PlexAnibridgeConfig."""
     monkeypatch.setenv("PAB_DATA_PATH", str(tmp_path))
     monkeypatch.setenv("PAB_PLEX_URL", "http://global")
+    monkeypatch.setenv("PAB_ANILIST_PERSISTED_QUERIES", "true")
     monkeypatch.setenv("PAB_PROFILES__primary__ANILIST_TOKEN", "anilist-token")
     monkeypatch.setenv("PAB_PROFILES__primary__PLEX_TOKEN", "plex-token")
     monkeypatch.setenv("PAB_PROFILES__primary__PLEX_USER", "eliasbenb")
@@ -118,6 +119,7 @@ def test_config_profile_inherits_global_values(
     profile = config.get_profile("primary")
 
     assert profile.plex_url == "http://global"
+    assert profile.anilist_persisted_queries is True
 
 
 def test_config_translates_deprecated_polling_scan(
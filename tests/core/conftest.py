@@ -0,0 +1,86 @@
+"""Shared fixtures for core tests."""
+
+import importlib
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.db import Base
+
+
+@pytest.fixture(autouse=True)
+def shared_media_store():
+    """Start every test with an empty process-wide AniList media store."""
+    store = importlib.import_module("src.core.anilist_cache").shared_media_store
+    store.clear()
+    yield store
+    store.clear()
+
+
+@pytest.fixture(autouse=True)
+def pin_index():
+    """Start every test with an empty process-wide pin index."""
+    index = importlib.import_module("src.core.pins").pin_index
+    index.clear()
+    yield index
+    index.clear()
+
+
+@pytest.fixture
+def in_memory_db(monkeypatch: pytest.MonkeyPatch):
+    """Provide an in-memory database patched into the application."""
+    engine = create_engine("sqlite:///:memory:", future=True)
+
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(
+        bind=engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        future=True,
+    )
+
+    class _DB:
+        def __init__(self) -> None:
+            self._session = None
+
+        def __enter__(self):
+            self._session = session_factory()
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+        @property
+        def session(self):
+            if self._session is None:
+                self._session = session_factory()
+            return self._session
+
+    db_instance = _DB()
+
+    database_module = importlib.import_module("src.config.database")
+    monkeypatch.setattr(database_module, "db", lambda: db_instance)
+    for module_name in (
+        "src.core.animap",
+        "src.core.anilist",
+        "src.core.anilist_cache",
+        "src.core.anilist_outbox",
+        "src.core.pins",
+        "src.core.plex_snapshot",
+        "src.core.sync.fingerprint",
+        "src.core.sync.history",
+    ):
+        module = importlib.import_module(module_name)
+        monkeypatch.setattr(module, "db", lambda: db_instance)
+
+    try:
+        yield db_instance
+    finally:
+        session = getattr(db_instance, "_session", None)
+        if session is not None:
+            session.close()
+        engine.dispose()
@@ -0,0 +1,233 @@
+"""Tests for skipping items unchanged since their last sync."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+from xml.etree import ElementTree
+
+import pytest
+from plexapi.video import Movie, Season, Show
+
+from src.core.sync.movie import MovieSyncClient
+from src.core.sync.show import ShowSyncClient
+from src.core.sync.stats import SyncOutcome, SyncStats
+from src.models.db.animap import AniMap
+from src.models.db.plex_snapshot import PlexSnapshotItem
+from src.models.schemas.anilist import Media, MediaList
+
+pytestmark = pytest.mark.usefixtures("in_memory_db")
+
+
+def _movie(view_count: int) -> Movie:
+    return Movie(
+        server=None,
+        data=ElementTree.fromstring(
+            f'<Video ratingKey="1" type="movie" title="Movie" guid="plex://movie/1" '
+            f'viewCount="{view_count}"><Guid id="tmdb://5" /></Video>'
+        ),
+    )
+
+
+class FakeMovieSyncClient(MovieSyncClient):
+    """Movie sync client that maps every item to the same AniList media."""
+
+    synced = 0
+
+    async def map_media(
+        self, item: Movie
+    ) -> AsyncIterator[tuple[Movie, list[Movie], AniMap, Media]]:
+        """Yield a single match without calling AniList."""
+        yield item, [item], AniMap(anilist_id=1, tmdb_movie_id=[5]), Media(id=1)
+
+    async def sync_media(self, *_: Any, **__: Any) -> SyncOutcome:
+        """Count the items that were synced."""
+        self.synced += 1
+        return SyncOutcome.SYNCED
+
+
+def _make_client(
+    anilist: SimpleNamespace,
+    force: bool = False,
+    client_cls: type[MovieSyncClient | ShowSyncClient] = FakeMovieSyncClient,
+    **plex: Any,
+):
+    async def is_on_watchlist(_: Any) -> bool:
+        return False
+
+    return client_cls(
+        anilist_client=cast(Any, anilist),
+        animap_client=cast(
+            Any,
+            SimpleNamespace(
+                get_mappings=lambda **_: iter([AniMap(anilist_id=1, tmdb_movie_id=[5])])
+            ),
+        ),
+        plex_client=cast(
+            Any,
+            SimpleNamespace(
+                on_deck_window=timedelta(days=7),
+                is_on_watchlist=is_on_watchlist,
+                is_guid_on_watchlist=lambda _: False,
+                **{"is_admin_user": False, **plex},
+            ),
+        ),
+        outbox=cast(Any, set()),
+        excluded_sync_fields=[],
+        full_scan=True,
+        destructive_sync=False,
+        search_fallback_threshold=90,
+        batch_requests=False,
+        profile_name="test",
+        force=force,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unchanged_items_are_skipped() -> None:
+    """Items are only synced again once their Plex or AniList state changes."""
+    entry = MediaList(
+        id=1, user_id=1, media_id=1, updated_at=datetime(2024, 1, 1, tzinfo=UTC)
+    )
+    anilist = SimpleNamespace(list_entries={1: entry}, list_loaded=True)
+
+    client = _make_client(anilist)
+    await client.process_media(_movie(1))
+    await client.process_media(_movie(1))
+    assert client.synced == 1
+    assert client.sync_stats.skipped == 1
+
+    client = _make_client(anilist)
+    await client.process_media(_movie(2))
+    anilist.list_entries[1] = entry.model_copy(
+        update={"updated_at": datetime(2024, 2, 1, tzinfo=UTC)}
+    )
+    await client.process_media(_movie(2))
+    assert client.synced == 2
+
+    client = _make_client(anilist, force=True)
+    await client.process_media(_movie(2))
+    assert client.synced == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_snapshot_items_are_recognized() -> None:
+    """Snapshot items unchanged since their last sync can be left out."""
+    entry = MediaList(
+        id=1, user_id=1, media_id=1, updated_at=datetime(2024, 1, 1, tzinfo=UTC)
+    )
+    anilist = SimpleNamespace(list_entries={1: entry}, list_loaded=True)
+    client = _make_client(anilist)
+    await client.process_media(_movie(1))
+
+    row = PlexSnapshotItem(
+        rating_key="1",
+        type="movie",
+        title="Movie",
+        guid="plex://movie/1",
+        guids=["tmdb://5"],
+        changed_at=datetime.now(UTC) - timedelta(minutes=1),
+    )
+    client.sync_stats = SyncStats()
+    assert client.is_unchanged(row)
+    assert client.sync_stats.skipped == 1
+
+    assert not _make_client(anilist, force=True).is_unchanged(row)
+
+    row.changed_at = datetime.now(UTC)
+    assert not client.is_unchanged(row)
+
+    row.changed_at = datetime.now(UTC) - timedelta(minutes=1)
+    anilist.list_entries[1] = entry.model_copy(
+        update={"updated_at": datetime(2024, 2, 1, tzinfo=UTC)}
+    )
+    assert not client.is_unchanged(row)
+
+
+@pytest.mark.asyncio
+async def test_season_ratings_invalidate_show_fingerprints() -> None:
+    """Rating a season of a show changes the show's fingerprint."""
+    show = Show(
+        server=None,
+        data=ElementTree.fromstring(
+            '<Directory ratingKey="1" type="show" title="Show" guid="plex://show/1" '
+            'leafCount="12" viewedLeafCount="12" childCount="1">'
+            '<Guid id="tvdb://5" /></Directory>'
+        ),
+    )
+    season = Season(
+        server=None,
+        data=ElementTree.fromstring(
+            '<Directory ratingKey="2" type="season" index="1" parentRatingKey="1" '
+            'leafCount="12" viewedLeafCount="12" />'
+        ),
+    )
+
+    requests: list[Show] = []
+
+    async def get_seasons(show: Show) -> list[Season]:
+        requests.append(show)
+        return [season]
+
+    async def get_episodes(_: Show) -> list[Any]:
+        return []
+
+    entry = MediaList(
+        id=1, user_id=1, media_id=1, updated_at=datetime(2024, 1, 1, tzinfo=UTC)
+    )
+    client = _make_client(
+        SimpleNamespace(list_entries={1: entry}, list_loaded=True),
+        client_cls=ShowSyncClient,
+        get_seasons=get_seasons,
+        get_episodes=get_episodes,
+    )
+
+    state = await client._get_fingerprint(show, [1])
+    assert state is not None
+    assert await client._get_fingerprint(show, [1]) == state
+
+    season.userRating = 8.0
+    season.lastRatedAt = datetime(2024, 3, 1)
+    changed = await client._get_fingerprint(show, [1])
+    assert changed is not None
+    assert changed[0] != state[0]
+    assert changed[1] == state[1]
+    # The children are shared with the sync instead of being read every time
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_reviews_invalidate_fingerprints_when_notes_are_synced() -> None:
+    """Changing the review of an item changes its fingerprint."""
+    reviews = {"1": "Great"}
+
+    async def get_user_review(item: Movie) -> str | None:
+        return reviews.get(str(item.ratingKey))
+
+    entry = MediaList(
+        id=1, user_id=1, media_id=1, updated_at=datetime(2024, 1, 1, tzinfo=UTC)
+    )
+    client = _make_client(
+        SimpleNamespace(list_entries={1: entry}, list_loaded=True),
+        is_admin_user=True,
+        get_user_review=get_user_review,
+    )
+
+    state = await client._get_fingerprint(_movie(1), [1])
+    assert state is not None
+    reviews["1"] = "Even better"
+    changed = await client._get_fingerprint(_movie(1), [1])
+    assert changed is not None
+    assert changed[0] != state[0]
+
+    # Reviews are not part of the snapshot, so its items are never skipped
+    await client.process_media(_movie(1))
+    row = PlexSnapshotItem(
+        rating_key="1",
+        type="movie",
+        title="Movie",
+        guid="plex://movie/1",
+        guids=["tmdb://5"],
+        changed_at=datetime.now(UTC) - timedelta(minutes=1),
+    )
+    assert not client.is_unchanged(row)
@@ -0,0 +1,70 @@
+"""Tests for the buffered sync history writer."""
+
+import pytest
+from sqlalchemy import select
+
+from src.core.sync.history import SyncHistoryWriter
+from src.models.db.sync_history import MediaType, SyncHistory, SyncOutcome
+
+
+def _record(outcome: SyncOutcome, error: str | None = None) -> SyncHistory:
+    return SyncHistory(
+        profile_name="test",
+        plex_rating_key="1",
+        plex_child_rating_key="2",
+        plex_type=MediaType.SHOW,
+        outcome=outcome,
+        error_message=error,
+    )
+
+
+def _outcomes(in_memory_db) -> list[tuple[SyncOutcome, str | None]]:
+    with in_memory_db as ctx:
+        return [
+            (row.outcome, row.error_message)
+            for row in ctx.session.scalars(select(SyncHistory).order_by(SyncHistory.id))
+        ]
+
+
+def test_writer_keeps_upsert_semantics(in_memory_db) -> None:
+    """Buffered records are written in bulk with the per record semantics."""
+    writer = SyncHistoryWriter("test")
+
+    writer.add(_record(SyncOutcome.FAILED, "boom"))
+    writer.add(_record(SyncOutcome.FAILED, "boom"))
+    writer.add(_record(SyncOutcome.NOT_FOUND))
+    assert len(writer) == 3
+    assert _outcomes(in_memory_db) == []
+
+    writer.flush()
+    assert len(writer) == 0
+    assert _outcomes(in_memory_db) == [
+        (SyncOutcome.FAILED, "boom"),
+        (SyncOutcome.NOT_FOUND, None),
+    ]
+
+    writer.add(_record(SyncOutcome.FAILED, "bang"))
+    writer.add(_record(SyncOutcome.SKIPPED))
+    writer.flush()
+    assert _outcomes(in_memory_db) == [
+        (SyncOutcome.FAILED, "bang"),
+        (SyncOutcome.NOT_FOUND, None),
+    ]
+
+    writer.add(_record(SyncOutcome.SYNCED))
+    writer.flush()
+    assert _outcomes(in_memory_db) == [(SyncOutcome.SYNCED, None)]
+
+
+def test_writer_flushes_when_full(
+    in_memory_db, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The buffer is written once it holds FLUSH_SIZE records."""
+    monkeypatch.setattr(SyncHistoryWriter, "FLUSH_SIZE", 2)
+    writer = SyncHistoryWriter("test")
+
+    writer.add(_record(SyncOutcome.DELETED))
+    assert _outcomes(in_memory_db) == []
+    writer.add(_record(SyncOutcome.DELETED))
+    assert len(writer) == 0
+    assert len(_outcomes(in_memory_db)) == 2
@@ -0,0 +1,100 @@
+"""Tests for the movie sync client."""
+
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+from xml.etree import ElementTree
+
+import pytest
+from plexapi.video import Movie
+from sqlalchemy import select
+
+from src.config.database import db
+from src.core.sync.movie import MovieSyncClient
+from src.exceptions import AniListUnavailableError
+from src.models.db.animap import AniMap
+from src.models.db.sync_history import SyncHistory
+from src.models.schemas.anilist import Media
+
+pytestmark = pytest.mark.usefixtures("in_memory_db")
+
+
+class FakeAniListClient:
+    """AniList client whose circuit breaker is open."""
+
+    async def get_anime(self, *_: Any) -> None:
+        """Fail like a request rejected by the open breaker."""
+        raise AniListUnavailableError("AniList is unavailable")
+
+
+class UnavailableMovieSyncClient(MovieSyncClient):
+    """Movie sync client whose AniList updates fail while the breaker is open."""
+
+    async def map_media(
+        self, item: Movie
+    ) -> AsyncIterator[tuple[Movie, list[Movie], AniMap, Media]]:
+        """Yield a single match without calling AniList."""
+        yield item, [item], AniMap(anilist_id=1, tmdb_movie_id=[5]), Media(id=1)
+
+    async def sync_media(self, *_: Any, **__: Any) -> None:
+        """Fail like a deletion rejected by the open breaker."""
+        raise AniListUnavailableError("AniList is unavailable")
+
+
+def _make_client(
+    client_cls: type[MovieSyncClient] = MovieSyncClient,
+) -> MovieSyncClient:
+    return client_cls(
+        anilist_client=cast(Any, FakeAniListClient()),
+        animap_client=cast(
+            Any,
+            SimpleNamespace(
+                get_mappings=lambda **_: iter([AniMap(anilist_id=1, tmdb_movie_id=[5])])
+            ),
+        ),
+        plex_client=cast(
+            Any, SimpleNamespace(on_deck_window=timedelta(days=7), is_admin_user=False)
+        ),
+        outbox=cast(Any, set()),
+        excluded_sync_fields=[],
+        full_scan=True,
+        destructive_sync=False,
+        search_fallback_threshold=90,
+        batch_requests=False,
+        profile_name="test",
+    )
+
+
+def _movie() -> Movie:
+    return Movie(
+        server=None,
+        data=ElementTree.fromstring(
+            '<Video ratingKey="1" type="movie" title="Movie" guid="plex://movie/1">'
+            '<Guid id="tmdb://5" /></Video>'
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_map_media_raises_while_anilist_is_unavailable() -> None:
+    """Items are deferred instead of skipped while the breaker is open."""
+    client = _make_client()
+
+    with pytest.raises(AniListUnavailableError):
+        async for _ in client.map_media(_movie()):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_process_media_defers_items_while_anilist_is_unavailable() -> None:
+    """Items whose AniList update is rejected by the breaker are left pending."""
+    client = _make_client(UnavailableMovieSyncClient)
+
+    await client.process_media(_movie())
+    client.history.flush()
+
+    assert client.sync_stats.pending == 1
+    assert client.sync_stats.failed == 0
+    with db() as ctx:
+        assert ctx.session.scalars(select(SyncHistory)).first() is None
@@ -1,19 +1,52 @@
 """Tests for the AniList client."""
 
-from datetime import UTC, timedelta, timezone
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
+from typing import ClassVar
 
+import aiohttp
 import pytest
 
+from src.core import anilist as anilist_module
 from src.core.anilist import AniListClient
-from src.exceptions import AniListFilterError
+from src.exceptions import (
+    AniListFilterError,
+    AniListMediaNotFoundError,
+    AniListQueryComplexityError,
+    AniListUnavailableError,
+)
 from src.models.schemas.anilist import (
     Media,
     MediaFormat,
+    MediaList,
+    MediaListGroup,
+    MediaListSaveResult,
+    MediaListStatus,
+    MediaListWithMedia,
+    MediaProjection,
     MediaStatus,
+    MediaTitle,
     User,
     UserOptions,
 )
+from src.utils.circuit import CircuitBreaker
+from src.utils.graphql import GraphQLDocument, estimate_complexity
+
+pytestmark = pytest.mark.usefixtures("in_memory_db")
+
+
+def _raw(fake_request):
+    """Serve a fake request returning decoded JSON as a raw AniList request."""
+
+    async def fake_raw_request(
+        self: AniListClient, query: str, variables=None, **kwargs
+    ) -> bytes:
+        text = query.query if isinstance(query, GraphQLDocument) else query
+        return json.dumps(await fake_request(self, text, variables)).encode()
+
+    return fake_raw_request
 
 
 @pytest.mark.asyncio
@@ -152,12 +185,14 @@ async def test_get_anime_returns_cached_entry(
         episodes=12,
         format=MediaFormat.TV,
     )
-    client.offline_anilist_entries[42] = cached_media
+    client.media_store.put_many([cached_media])
 
     async def fail_request(self: AniListClient, query: str, variables=None):
         raise AssertionError("Network should not be called when cache is populated")
 
-    monkeypatch.setattr(AniListClient, "_make_request", fail_request, raising=False)
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fail_request), raising=False
+    )
 
     media = await client.get_anime(42)
 
@@ -192,13 +227,15 @@ async def test_get_anime_fetches_and_caches_when_missing(
             }
         }
 
-    monkeypatch.setattr(AniListClient, "_make_request", fake_request, raising=False)
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
 
     media = await client.get_anime(128)
 
     assert call_args["variables"] == {"id": 128}
     assert media.id == 128
-    assert client.offline_anilist_entries[128].id == 128
+    assert client.media_store.get_many([128])[128].id == 128
 
 
 @pytest.mark.asyncio
@@ -214,7 +251,7 @@ async def test_batch_get_anime_combines_cached_and_remote(
     )
 
     cached_media = Media(id=1, status=MediaStatus.FINISHED, format=MediaFormat.TV)
-    client.offline_anilist_entries[1] = cached_media
+    client.media_store.put_many([cached_media])
 
     request_ids: list[list[int]] = []
 
@@ -241,13 +278,62 @@ async def test_batch_get_anime_combines_cached_and_remote(
             }
         }
 
-    monkeypatch.setattr(AniListClient, "_make_request", fake_request, raising=False)
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
 
     media = await client.batch_get_anime([1, 2, 3])
 
     assert request_ids == [[2, 3]]
     assert [m.id for m in media] == [1, 2, 3]
-    assert set(client.offline_anilist_entries) == {1, 2, 3}
+    assert set(client.media_store.get_many([1, 2, 3])) == {1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_clients_share_media_metadata(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Only fetch list entries for media another client already fetched."""
+    public = AniListClient(None, tmp_path, False, "public")
+    profile = AniListClient("token", tmp_path, False, "test")
+    profile.user = User(id=1, name="tester")
+    queries: list[tuple[str, dict]] = []
+
+    async def fake_request(
+        self: AniListClient, query: str, variables: dict | None = None
+    ) -> dict:
+        queries.append((query, variables or {}))
+        if "mediaList(" in query:
+            entry = {"id": 20, "userId": 1, "mediaId": 2, "progress": 4}
+            return {"data": {"Page": {"mediaList": [entry]}}}
+        return {
+            "data": {
+                "Page": {
+                    "media": [
+                        {"id": 2, "format": MediaFormat.TV},
+                        {"id": 3, "format": MediaFormat.MOVIE},
+                    ]
+                }
+            }
+        }
+
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
+
+    await public.batch_get_anime([2, 3])
+    media = await profile.batch_get_anime([2, 3])
+
+    assert len(queries) == 2
+    assert "format" not in queries[1][0]
+    assert queries[1][1] == {"userId": 1, "ids": [2, 3]}
+    assert [m.format for m in media] == [MediaFormat.TV, MediaFormat.MOVIE]
+    assert media[0].media_list_entry and media[0].media_list_entry.progress == 4
+    assert media[1].media_list_entry is None
+    assert (await public.get_anime(2)).media_list_entry is None
+
+    await profile.batch_get_anime([2, 3])
+    assert len(queries) == 2
 
 
 def test_get_user_tz_parses_timezone_offset(tmp_path: Path) -> None:
@@ -289,3 +375,464 @@ def test_get_user_tz_defaults_to_utc(tmp_path: Path) -> None:
     tz = client.get_user_tz()
 
     assert tz == UTC
+
+
+@pytest.mark.asyncio
+async def test_get_anime_reads_through_persistent_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A second client is served from the persistent cache without the API."""
+    calls = 0
+
+    async def fake_request(
+        self: AniListClient, query: str, variables: dict | None = None
+    ) -> dict:
+        nonlocal calls
+        calls += 1
+        return {
+            "data": {
+                "Media": {
+                    "id": 7,
+                    "status": MediaStatus.FINISHED,
+                    "format": MediaFormat.TV,
+                    "mediaListEntry": {
+                        "id": 70,
+                        "mediaId": 7,
+                        "userId": 1,
+                        "progress": 3,
+                    },
+                }
+            }
+        }
+
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
+
+    first = AniListClient(None, tmp_path, False, "first")
+    second = AniListClient(None, tmp_path, False, "second")
+
+    await first.get_anime(7)
+    media = await second.get_anime(7)
+
+    assert calls == 1
+    assert media.id == 7
+    assert media.status == MediaStatus.FINISHED
+    assert media.media_list_entry is None
+
+
+@pytest.mark.asyncio
+async def test_get_anime_coalesces_concurrent_calls(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Concurrent lookups share one batched request and dedupe repeated IDs."""
+    client = AniListClient(None, tmp_path, False, "test")
+    request_ids: list[list[int]] = []
+
+    async def fake_request(
+        self: AniListClient, query: str, variables: dict | None = None
+    ) -> dict:
+        ids = list((variables or {}).get("ids", []))
+        request_ids.append(ids)
+        return {
+            "data": {
+                "Page": {
+                    "media": [
+                        {"id": i, "status": MediaStatus.FINISHED}
+                        for i in ids
+                        if i != 12
+                    ]
+                }
+            }
+        }
+
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
+
+    results = await asyncio.gather(
+        client.get_anime(10),
+        client.get_anime(11),
+        client.get_anime(10),
+        client.batch_get_anime([11, 12]),
+        return_exceptions=True,
+    )
+
+    assert request_ids == [[10, 11, 12]]
+    assert [m.id for m in results[:3]] == [10, 11, 10]
+    assert [m.id for m in results[3]] == [11]
+
+    with pytest.raises(AniListMediaNotFoundError):
+        await asyncio.gather(client.get_anime(12), client.get_anime(13))
+
+
+@pytest.mark.asyncio
+async def test_batch_update_packs_entries_and_splits_complex_batches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Pack mutations by complexity and halve batches that AniList rejects."""
+    client = AniListClient("token", tmp_path, False, "test")
+    client.max_query_complexity = 20
+    attempts: list[int] = []
+    saved: list[int] = []
+
+    async def fake_request(
+        self: AniListClient, query: str, variables: dict | None = None
+    ) -> dict:
+        media_ids = [v for k, v in (variables or {}).items() if "mediaId" in k]
+        attempts.append(len(media_ids))
+        if len(media_ids) > 2:
+            raise AniListQueryComplexityError("Max query complexity exceeded")
+        saved.extend(media_ids)
+        return {"data": {}}
+
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
+
+    entries = [MediaList(id=i, user_id=1, media_id=i) for i in range(1, 10)]
+    await client.batch_update_anime_entries(entries)
+
+    assert 2 < attempts[0] < len(entries)
+    assert saved == list(range(1, 10))
+
+
+def test_save_entry_complexity_follows_the_requested_selection() -> None:
+    """Estimate saved entries from the fields the batch mutation actually selects."""
+    selection = (
+        f"m: SaveMediaListEntry {{ {MediaListSaveResult.model_dump_graphql()} }}"
+    )
+    assert AniListClient._save_entry_complexity() == estimate_complexity(selection)
+    assert AniListClient._save_entry_complexity() < estimate_complexity(
+        MediaListWithMedia.model_dump_graphql()
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_update_patches_cached_entries(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Merge saved entries into the cached list entries instead of refetching them."""
+    client = AniListClient("token", tmp_path, False, "test")
+    client.media_store.put_many([Media(id=1, title=MediaTitle(romaji="Cached"))])
+    client.list_entries[1] = MediaList(id=10, user_id=1, media_id=1, notes="kept")
+    queries: list[str] = []
+
+    async def fake_request(
+        self: AniListClient, query: str, variables: dict | None = None
+    ) -> dict:
+        queries.append(query)
+        return {
+            "data": {
+                "m0": {"id": 10, "mediaId": 1, "updatedAt": 5000},
+                "m1": {"id": 20, "mediaId": 2, "updatedAt": 6000},
+            }
+        }
+
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
+
+    await client.batch_update_anime_entries(
+        [
+            MediaList(id=10, user_id=1, media_id=1, progress=5),
+            MediaList(id=0, user_id=1, media_id=2, progress=1),
+        ]
+    )
+
+    assert "coverImage" not in queries[0]
+    patched = await client.get_anime(1)
+    assert len(queries) == 1
+    assert patched.title == MediaTitle(romaji="Cached")
+    assert patched.media_list_entry is not None
+    assert patched.media_list_entry.progress == 5
+    assert patched.media_list_entry.notes == "kept"
+    assert patched.media_list_entry.updated_at == datetime.fromtimestamp(5000, UTC)
+
+    assert not client.media_store.get_many([2], MediaProjection.SYNC_MINIMAL)
+    saved = client.list_entries[2]
+    assert saved is not None
+    assert saved.id == 20
+
+
+def test_raise_for_complexity_lowers_budget(tmp_path: Path) -> None:
+    """Complexity errors raise and lower the budget to the advertised maximum."""
+    client = AniListClient(None, tmp_path, False, "test")
+
+    client._raise_for_complexity('{"errors": [{"message": "Invalid token"}]}')
+    client._raise_for_complexity("not json")
+
+    with pytest.raises(AniListQueryComplexityError):
+        client._raise_for_complexity(
+            '{"errors": [{"message": '
+            '"Max query complexity should be 300 but got 512."}]}'
+        )
+    assert client.max_query_complexity == 300
+
+
+@pytest.mark.asyncio
+async def test_refresh_anilist_patches_last_backup(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Patch the last backup with entries changed since its high-water mark."""
+    client = AniListClient("token", tmp_path, False, "test")
+    client.user = User(id=1, name="tester")
+
+    def entry(media_id: int, progress: int, updated_at: int) -> dict:
+        return {
+            "id": media_id * 10,
+            "userId": 1,
+            "mediaId": media_id,
+            "status": "CURRENT",
+            "progress": progress,
+            "updatedAt": updated_at,
+            "media": {"id": media_id, "status": "FINISHED"},
+        }
+
+    pages: list[int] = []
+
+    async def fake_request(
+        self: AniListClient, query: str, variables: dict | None = None
+    ) -> dict:
+        if "MediaListCollection(" in query:
+            return {
+                "data": {
+                    "MediaListCollection": {
+                        "lists": [
+                            {
+                                "name": "Watching",
+                                "isCustomList": False,
+                                "status": "CURRENT",
+                                "entries": [entry(1, 1, 1000), entry(2, 1, 2000)],
+                            }
+                        ],
+                        "hasNextChunk": False,
+                    }
+                }
+            }
+        pages.append((variables or {})["page"])
+        return {
+            "data": {
+                "Page": {
+                    "pageInfo": {"hasNextPage": True},
+                    "mediaList": [entry(2, 5, 3000), entry(1, 1, 1000)],
+                }
+            }
+        }
+
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
+
+    assert not await client.refresh_anilist()
+    await client.backup_anilist()
+    client.list_entries.clear()
+
+    assert await client.refresh_anilist()
+
+    assert pages == [1]
+    entries = client.list_entries
+    assert entries[1] and entries[1].progress == 1
+    assert entries[2] and entries[2].progress == 5
+    assert client._get_list_state() is not None
+    assert client._get_list_state()["updated_at"] == 3000
+
+
+@pytest.mark.asyncio
+async def test_refresh_anilist_keeps_custom_lists(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Keep custom list members and move changed entries to their status list."""
+    client = AniListClient("token", tmp_path, False, "test")
+    client.user = User(id=1, name="tester")
+    client.media_store.put_many([Media(id=i) for i in range(1, 4)])
+
+    def entry(media_id: int, status: str, updated_at: int) -> MediaList:
+        return MediaList(
+            id=media_id * 10,
+            user_id=1,
+            media_id=media_id,
+            status=MediaListStatus(status),
+            updated_at=datetime.fromtimestamp(updated_at, UTC),
+        )
+
+    client._write_backup(
+        [
+            MediaListGroup(
+                name="Watching",
+                is_custom_list=False,
+                status=MediaListStatus.CURRENT,
+                entries=[entry(1, "CURRENT", 1000), entry(2, "CURRENT", 1000)],
+            ),
+            MediaListGroup(
+                name="Favourites",
+                is_custom_list=True,
+                entries=[entry(1, "CURRENT", 1000), entry(3, "PLANNING", 1000)],
+            ),
+        ],
+        refreshed_at=datetime.now(UTC),
+    )
+
+    async def fake_request(
+        self: AniListClient, query: str, variables: dict | None = None
+    ) -> dict:
+        changed = {
+            "id": 10,
+            "userId": 1,
+            "mediaId": 1,
+            "status": "COMPLETED",
+            "updatedAt": 2000,
+            "media": {"id": 1},
+        }
+        return {"data": {"Page": {"pageInfo": {}, "mediaList": [changed]}}}
+
+    monkeypatch.setattr(
+        AniListClient, "_make_raw_request", _raw(fake_request), raising=False
+    )
+
+    assert await client.refresh_anilist()
+
+    state = client._get_list_state()
+    assert state is not None and client.backup_store is not None
+    lists = {
+        li.name: li for li in client.backup_store.read_collection(state["backup"]).lists
+    }
+    assert [e.media_id for e in lists["Watching"].entries] == [2]
+    assert lists["Favourites"].is_custom_list
+    assert [e.media_id for e in lists["Favourites"].entries] == [1, 3]
+    assert lists["Favourites"].entries[0].status == MediaListStatus.COMPLETED
+    assert [e.media_id for e in lists[None].entries] == [1]
+    assert lists[None].status == MediaListStatus.COMPLETED
+
+
+@pytest.fixture
+def no_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let requests through the shared AniList rate limiter without waiting."""
+
+    async def acquire(*_args) -> None:
+        return None
+
+    monkeypatch.setattr(anilist_module.anilist_limiter, "acquire", acquire)
+
+
+class _FakeResponse:
+    status = 200
+    headers: ClassVar[dict[str, str]] = {}
+
+    def __init__(self, body: bytes) -> None:
+        """Store the raw response body."""
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        """Accept the response."""
+
+    async def read(self) -> bytes:
+        """Return the raw response body."""
+        return self.body
+
+
+class _FakeSession:
+    def __init__(self, *bodies: bytes) -> None:
+        """Queue the raw bodies of the responses to return."""
+        self.bodies = list(bodies)
+        self.requests: list[dict] = []
+
+    def post(self, url: str, data: bytes) -> _FakeResponse:
+        """Record the request body and return the next response."""
+        self.requests.append(json.loads(data))
+        return _FakeResponse(self.bodies.pop(0))
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_rate_limit")
+async def test_typed_request_encodes_variables_and_validates_raw_body(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Splice serialized variables into the body and validate the raw response."""
+    client = AniListClient(None, tmp_path, False, "test")
+    session = _FakeSession(b'{"data": {"Viewer": {"id": 1, "name": "tester"}}}')
+
+    async def fake_get_session(self: AniListClient) -> _FakeSession:
+        return session
+
+    monkeypatch.setattr(AniListClient, "_get_session", fake_get_session)
+
+    data = await client._make_typed_request(
+        "query { Viewer { id name } }",
+        dict[str, User],
+        MediaList(id=1, user_id=1, media_id=2).model_dump_json(exclude_none=True),
+    )
+
+    assert data["Viewer"] == User(id=1, name="tester")
+    assert session.requests[0]["variables"] == {"id": 1, "userId": 1, "mediaId": 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_rate_limit")
+async def test_persisted_queries_send_registered_documents_by_hash(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Send documents by hash once registered and resend them when evicted."""
+    client = AniListClient(None, tmp_path, False, "test", persisted_queries=True)
+    document = GraphQLDocument.build("query   Test { Viewer { id } }")
+    ok = b'{"data": {}}'
+    evicted = b'{"errors": [{"message": "PersistedQueryNotFound"}]}'
+    session = _FakeSession(ok, ok, evicted, ok)
+
+    async def fake_get_session(self: AniListClient) -> _FakeSession:
+        return session
+
+    monkeypatch.setattr(AniListClient, "_get_session", fake_get_session)
+
+    for _ in range(3):
+        await client._make_raw_request(document)
+
+    assert AniListClient._get_anime_document(5) is AniListClient._get_anime_document(5)
+    assert [r.get("query") for r in session.requests] == [
+        "query Test { Viewer { id } }",
+        None,
+        None,
+        "query Test { Viewer { id } }",
+    ]
+    assert all(
+        r["extensions"]["persistedQuery"]["sha256Hash"] == document.sha256
+        for r in session.requests
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_rate_limit")
+async def test_open_circuit_fails_requests_fast(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Stop retrying once AniList is down and reject requests until it recovers."""
+    client = AniListClient(None, tmp_path, False, "test")
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    monkeypatch.setattr(anilist_module, "anilist_breaker", breaker)
+    attempts = 0
+
+    class _DownSession:
+        def post(self, url: str, data: bytes) -> _FakeResponse:
+            """Fail to connect."""
+            nonlocal attempts
+            attempts += 1
+            raise aiohttp.ClientConnectionError("connection refused")
+
+    async def fake_get_session(self: AniListClient) -> _DownSession:
+        return _DownSession()
+
+    monkeypatch.setattr(AniListClient, "_get_session", fake_get_session)
+
+    with pytest.raises(AniListUnavailableError):
+        await client._make_raw_request("query { Viewer { id } }")
+    with pytest.raises(AniListUnavailableError):
+        await client._make_raw_request("query { Viewer { id } }")
+
+    assert attempts == 1
+    assert breaker.status()["state"] == "open"
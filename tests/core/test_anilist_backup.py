@@ -0,0 +1,106 @@
+"""Tests for the AniList backup store."""
+
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+
+from src.core.anilist_backup import AniListBackupStore
+from src.models.schemas.anilist import (
+    MediaList,
+    MediaListGroup,
+    MediaListStatus,
+    User,
+)
+
+
+def _lists(*progress: int) -> list[MediaListGroup]:
+    return [
+        MediaListGroup(
+            name="Watching",
+            is_custom_list=False,
+            status=MediaListStatus.CURRENT,
+            entries=[
+                MediaList(id=i, user_id=1, media_id=i, progress=p)
+                for i, p in enumerate(progress, start=1)
+            ],
+        )
+    ]
+
+
+def _age(path: Path, days: float) -> None:
+    mtime = time.time() - days * 86400
+    os.utime(path, (mtime, mtime))
+
+
+def test_write_stores_unchanged_entries_once(tmp_path: Path) -> None:
+    """Only entries that changed since the previous backup are written again."""
+    store = AniListBackupStore(tmp_path, "test")
+    user = User(id=1, name="tester")
+
+    first = store.write(user, _lists(1, 2, 3)).rename(
+        tmp_path / "plexanibridge-test.20200101000000.jsonl.gz"
+    )
+    second = store.write(user, _lists(1, 2, 4))
+
+    stored = 0
+    for pack in store.objects_dir.iterdir():
+        with gzip.open(pack, "rt") as fh:
+            stored += sum(1 for _ in fh)
+    assert stored == 4
+
+    data = store.read(second.name)
+    assert data["user"]["name"] == "tester"
+    assert [e["progress"] for e in data["lists"][0]["entries"]] == [1, 2, 4]
+    first_entries = store.read(first.name)["lists"][0]["entries"]
+    assert [e["progress"] for e in first_entries] == [1, 2, 3]
+
+
+def test_prune_keeps_packs_referenced_by_live_backups(tmp_path: Path) -> None:
+    """Pruning deletes expired backups but only unreferenced packs."""
+    store = AniListBackupStore(tmp_path, "test")
+    old_pack = store._pack_path("20200101000000")
+    old_pack.parent.mkdir(parents=True)
+    old_pack.touch()
+
+    first = store.write(None, _lists(1, 2))
+    _age(first, 10)
+
+    store.prune(5)
+    assert not first.exists()
+    assert not old_pack.exists()
+    assert not any(store.objects_dir.iterdir())
+
+    expired = store.write(None, _lists(1, 2)).rename(
+        tmp_path / "plexanibridge-test.20200101000000.jsonl.gz"
+    )
+    live = store.write(None, _lists(1, 2))
+    _age(expired, 10)
+
+    store.prune(5)
+
+    assert not expired.exists()
+    assert any(store.objects_dir.iterdir())
+    entries = store.read(live.name)["lists"][0]["entries"]
+    assert [e["progress"] for e in entries] == [1, 2]
+
+
+def test_reads_legacy_json_backups(tmp_path: Path) -> None:
+    """Legacy JSON backups are listed and read alongside new backups."""
+    legacy = tmp_path / "plexanibridge-test.20240101000000.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "user": {"id": 1, "name": "tester"},
+                "lists": [{"name": "Watching", "entries": [{"id": 1}]}],
+            }
+        )
+    )
+    store = AniListBackupStore(tmp_path, "test")
+    latest = store.write(None, _lists(1))
+
+    assert store.list_backups() == [legacy, latest]
+    assert AniListBackupStore.get_timestamp(legacy.name) == "20240101000000"
+    assert store.read_user(legacy.name) == {"id": 1, "name": "tester"}
+    assert next(store.iter_lists(legacy.name))["entries"] == [{"id": 1}]
@@ -0,0 +1,97 @@
+"""Tests for the persistent AniList media cache."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from src.config.database import PlexAniBridgeDB
+from src.core.anilist_cache import AniListMediaCache, AniListMediaStore
+from src.models.db.anilist_media import AniListMedia
+from src.models.schemas.anilist import (
+    Media,
+    MediaFormat,
+    MediaList,
+    MediaProjection,
+    MediaStatus,
+)
+
+pytestmark = pytest.mark.usefixtures("in_memory_db")
+
+
+def _age_entry(db: PlexAniBridgeDB, anilist_id: int, age: timedelta) -> None:
+    with db as ctx:
+        ctx.session.execute(
+            update(AniListMedia)
+            .where(AniListMedia.anilist_id == anilist_id)
+            .values(fetched_at=datetime.now(UTC) - age)
+        )
+        ctx.session.commit()
+
+
+def test_entries_expire_by_media_status(in_memory_db: PlexAniBridgeDB) -> None:
+    """Airing media expires sooner than finished media."""
+    cache = AniListMediaCache()
+    cache.put_many(
+        [
+            Media(id=1, status=MediaStatus.FINISHED, format=MediaFormat.TV),
+            Media(id=2, status=MediaStatus.RELEASING, format=MediaFormat.TV),
+        ]
+    )
+
+    _age_entry(in_memory_db, 1, timedelta(days=1))
+    _age_entry(in_memory_db, 2, timedelta(days=1))
+
+    assert set(cache.get_many([1, 2, 3])) == {1}
+
+
+def test_put_many_evicts_least_recently_fetched(
+    in_memory_db: PlexAniBridgeDB,
+) -> None:
+    """The table is trimmed to the configured size, oldest entries first."""
+    cache = AniListMediaCache(max_entries=2)
+    cache.put_many([Media(id=1), Media(id=2)])
+    _age_entry(in_memory_db, 1, timedelta(hours=1))
+
+    cache.put_many([Media(id=3)])
+
+    with in_memory_db as ctx:
+        ids = ctx.session.execute(select(AniListMedia.anilist_id)).scalars().all()
+    assert sorted(ids) == [2, 3]
+
+
+def test_store_shares_metadata_without_list_entries() -> None:
+    """The store strips list entries and keeps minimal media apart."""
+    store = AniListMediaStore(AniListMediaCache())
+    store.put_many(
+        [
+            Media(
+                id=1,
+                format=MediaFormat.TV,
+                media_list_entry=MediaList(id=10, user_id=1, media_id=1),
+            )
+        ]
+    )
+    store.put_many([Media(id=2, episodes=12)], MediaProjection.SYNC_MINIMAL)
+
+    assert set(store.get_many([1, 2])) == {1}
+    assert store.get_many([1])[1].media_list_entry is None
+    assert set(store.get_many([1, 2], MediaProjection.SYNC_MINIMAL)) == {1, 2}
+
+    store.clear()
+    assert set(store.get_many([1, 2], MediaProjection.SYNC_MINIMAL)) == {1}
+    assert len(store) == 1
+
+
+def test_store_keeps_the_fetch_time_of_persisted_media(
+    in_memory_db: PlexAniBridgeDB,
+) -> None:
+    """Media read from the persistent cache do not restart their TTL."""
+    cache = AniListMediaCache()
+    cache.put_many([Media(id=1, status=MediaStatus.RELEASING, format=MediaFormat.TV)])
+    _age_entry(in_memory_db, 1, timedelta(hours=5))
+
+    store = AniListMediaStore(cache)
+    assert set(store.get_many([1])) == {1}
+    _, fetched_at = store._media[1]
+    assert datetime.now(UTC) - fetched_at > timedelta(hours=4)
@@ -0,0 +1,121 @@
+"""Tests for the AniList outbox."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.core.anilist_outbox import AniListOutbox
+from src.models.db.anilist_outbox import AniListOutboxEntry
+from src.models.schemas.anilist import MediaList
+
+pytestmark = pytest.mark.usefixtures("in_memory_db")
+
+
+class FakeAniListClient:
+    """AniList client recording batch updates."""
+
+    def __init__(self) -> None:
+        """Initialize the fake client."""
+        self.batches: list[list[MediaList]] = []
+        self.current: dict[int, MediaList] = {}
+        self.error: Exception | None = None
+        self.on_update = None
+
+    async def get_list_entries(self, ids: list[int]) -> dict[int, MediaList | None]:
+        """Return the current AniList entries of the given media."""
+        return {media_id: self.current.get(media_id) for media_id in ids}
+
+    async def batch_update_anime_entries(self, entries: list[MediaList]) -> None:
+        """Record the batch and fail if an error is set."""
+        self.batches.append(entries)
+        if self.on_update is not None:
+            self.on_update()
+        if self.error is not None:
+            raise self.error
+
+
+def _entry(
+    media_id: int, progress: int, updated_at: datetime | None = None
+) -> MediaList:
+    return MediaList(
+        id=media_id,
+        user_id=1,
+        media_id=media_id,
+        progress=progress,
+        updated_at=updated_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_flush_coalesces_updates_per_media() -> None:
+    """Only the newest pending update of each media is written."""
+    client = FakeAniListClient()
+    outbox = AniListOutbox(client, "test")  # type: ignore[arg-type]
+
+    outbox.enqueue([_entry(1, 1), _entry(2, 1)])
+    outbox.enqueue([_entry(1, 3)])
+
+    assert await outbox.flush() == [1, 2]
+    assert [(e.media_id, e.progress) for e in client.batches[0]] == [(1, 3), (2, 1)]
+    assert len(outbox) == 0
+    assert await outbox.flush() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried_with_backoff(in_memory_db) -> None:
+    """Failed updates survive in the database and are rescheduled."""
+    client = FakeAniListClient()
+    client.error = RuntimeError("AniList is down")
+    outbox = AniListOutbox(client, "test")  # type: ignore[arg-type]
+    outbox.enqueue([_entry(1, 1)])
+
+    with pytest.raises(RuntimeError):
+        await outbox.flush()
+
+    row = in_memory_db.session.query(AniListOutboxEntry).one()
+    next_attempt_at = row.next_attempt_at.replace(tzinfo=UTC)
+    assert row.attempts == 1
+    assert row.last_error == "AniList is down"
+    assert next_attempt_at > datetime.now(UTC)
+
+    # Not due yet, and a new outbox (as after a restart) still knows the update
+    restarted = AniListOutbox(client, "test")  # type: ignore[arg-type]
+    assert 1 in restarted
+    assert await restarted.flush() == []
+    assert len(client.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_keeps_updates_replaced_while_writing() -> None:
+    """An update enqueued during a flush is kept for the next flush."""
+    client = FakeAniListClient()
+    outbox = AniListOutbox(client, "test")  # type: ignore[arg-type]
+    outbox.enqueue([_entry(1, 1)])
+    client.on_update = lambda: outbox.enqueue([_entry(1, 2)])
+
+    await outbox.flush()
+    assert 1 in outbox
+
+    client.on_update = None
+    await outbox.flush()
+    assert client.batches[-1][0].progress == 2
+    assert len(outbox) == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_drops_updates_of_entries_changed_on_anilist() -> None:
+    """Updates computed from an outdated AniList entry are not written."""
+    client = FakeAniListClient()
+    outbox = AniListOutbox(client, "test")  # type: ignore[arg-type]
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+
+    outbox.enqueue([_entry(1, 2, base), _entry(2, 2, base), _entry(3, 1)])
+    client.current = {
+        1: _entry(1, 1, base),
+        2: _entry(2, 5, base + timedelta(hours=1)),
+        3: _entry(3, 4, base),
+    }
+
+    assert await outbox.flush() == [1]
+    assert [e.media_id for e in client.batches[0]] == [1]
+    assert len(outbox) == 0
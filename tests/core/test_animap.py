@@ -1,21 +1,18 @@
 """Tests for the AniMap client."""
 
 import asyncio
-import importlib
 import json
 from hashlib import md5
 from pathlib import Path
 from typing import Any, cast
 
 import pytest
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select
 
 from src.config.database import PlexAniBridgeDB
-from src.core.animap import AniMapClient
+from src.core.animap import AniMapClient, AniMapIndex
 from src.core.mappings import MappingsClient
 from src.models.db.animap import AniMap
-from src.models.db.base import Base
 from src.models.db.housekeeping import Housekeeping
 from src.models.db.provenance import AniMapProvenance
 
@@ -47,56 +44,6 @@ class FakeMappingsClient:
         return None
 
 
-@pytest.fixture
-def in_memory_db(monkeypatch: pytest.MonkeyPatch):
-    """Provide an in-memory database patched into the application."""
-    engine = create_engine("sqlite:///:memory:", future=True)
-
-    Base.metadata.create_all(engine)
-    session_factory = sessionmaker(
-        bind=engine,
-        autoflush=False,
-        autocommit=False,
-        expire_on_commit=False,
-        future=True,
-    )
-
-    class _DB:
-        def __init__(self) -> None:
-            self._session = None
-
-        def __enter__(self):
-            self._session = session_factory()
-            return self
-
-        def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-            if self._session is not None:
-                self._session.close()
-                self._session = None
-
-        @property
-        def session(self):
-            if self._session is None:
-                self._session = session_factory()
-            return self._session
-
-    db_instance = _DB()
-
-    database_module = importlib.import_module("src.config.database")
-    animap_module = importlib.import_module("src.core.animap")
-
-    monkeypatch.setattr(database_module, "db", lambda: db_instance)
-    monkeypatch.setattr(animap_module, "db", lambda: db_instance)
-
-    try:
-        yield db_instance
-    finally:
-        session = getattr(db_instance, "_session", None)
-        if session is not None:
-            session.close()
-        engine.dispose()
-
-
 @pytest.fixture
 def animap_client(
     tmp_path: Path, in_memory_db: PlexAniBridgeDB, request: pytest.FixtureRequest
@@ -207,6 +154,49 @@ def test_get_mappings_filters_by_identifiers(
     assert empty_matches == []
 
 
+def test_index_answers_lookups_for_prefetched_ids(
+    animap_client: AniMapClient, tmp_path: Path
+):
+    """The index returns the same mappings as the database for prefetched IDs."""
+    mapping_data = {
+        "10": {"imdb_id": ["tt10"], "tmdb_show_id": 100, "tvdb_id": 1000},
+        "20": {"tmdb_show_id": 200, "tvdb_id": 1000},
+        "30": {"tmdb_show_id": 300, "tvdb_id": 3000},
+    }
+    (tmp_path / "mappings.custom.json").write_text(
+        json.dumps(mapping_data),
+        encoding="utf-8",
+    )
+    asyncio.run(animap_client.sync_db())
+
+    imdb_ids, tmdb_ids, tvdb_ids = ["tt10"], [100, 200], [1000]
+    index = AniMapIndex(
+        animap_client.get_mappings(imdb_ids, tmdb_ids, tvdb_ids, is_movie=False),
+        imdb_ids,
+        tmdb_ids,
+        tvdb_ids,
+        is_movie=False,
+    )
+
+    for lookup in (
+        {"tvdb": 1000},
+        {"tmdb": 200},
+        {"imdb": "tt10", "tmdb": 100},
+    ):
+        expected = {
+            m.anilist_id for m in animap_client.get_mappings(**lookup, is_movie=False)
+        }
+        indexed = index.get_mappings(**lookup, is_movie=False)
+        assert indexed is not None
+        assert {m.anilist_id for m in indexed} == expected
+
+    # IDs that were not prefetched are left to the database
+    assert index.get_mappings(tvdb=3000, is_movie=False) is None
+    assert index.get_mappings(tmdb=999, tvdb=1000, is_movie=False) is None
+    assert index.get_mappings(tvdb=1000, is_movie=True) is None
+    assert index.get_mappings(is_movie=False) == []
+
+
 def test_get_mappings_returns_empty_when_no_identifiers(
     animap_client: AniMapClient,
 ):
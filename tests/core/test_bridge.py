@@ -0,0 +1,138 @@
+"""Tests for the bridge client."""
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from src.core.bridge import BridgeClient
+from src.core.sync.stats import SyncProgress, SyncStats
+
+
+class FakeSyncClient:
+    """Sync client stub that records how many items run at the same time."""
+
+    def __init__(self, fail_titles: set[str] | None = None) -> None:
+        """Initialize counters used by the assertions."""
+        self.sync_stats = SyncStats()
+        self.history = SimpleNamespace(flush=lambda: None)
+        self.fail_titles = fail_titles or set()
+        self.processed: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def process_media(self, item: Any) -> None:
+        """Pretend to process an item while yielding to the event loop."""
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if item.title in self.fail_titles:
+                raise RuntimeError("boom")
+            self.processed.append(item.title)
+        finally:
+            self.active -= 1
+
+    def is_unchanged(self, _: Any) -> bool:
+        """Never leave items out of the sync."""
+        return False
+
+    async def batch_sync(self) -> None:
+        """Batch sync is a no-op for the stub."""
+        return None
+
+
+def _make_bridge(items: list[Any], sync_concurrency: int) -> BridgeClient:
+    bridge = cast(BridgeClient, object.__new__(BridgeClient))
+    bridge.profile_name = "test"
+    bridge.profile_config = cast(
+        Any,
+        SimpleNamespace(
+            full_scan=False,
+            batch_requests=False,
+            sync_concurrency=sync_concurrency,
+            excluded_sync_fields=[],
+        ),
+    )
+
+    async def get_section_items(*_: Any, **__: Any) -> list[Any]:
+        return items
+
+    async def prefetch(*_: Any, **__: Any) -> None:
+        return None
+
+    bridge.plex_client = cast(
+        Any,
+        SimpleNamespace(
+            get_section_items=get_section_items,
+            prefetch_show_children=prefetch,
+            prefetch_history=prefetch,
+            prefetch_watchlist=prefetch,
+            prefetch_reviews=prefetch,
+            clear_show_children=lambda: None,
+            clear_history=lambda: None,
+            clear_reviews=lambda: None,
+        ),
+    )
+    bridge.plex_snapshot = cast(Any, SimpleNamespace(get_items=get_section_items))
+    bridge.last_synced = None
+    bridge.current_sync = SyncProgress(
+        state="running",
+        started_at=datetime.now(UTC),
+        section_index=1,
+        section_count=1,
+        section_title=None,
+        stage="enumerating",
+        section_items_total=0,
+        section_items_processed=0,
+    )
+    return bridge
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sync_concurrency", [1, 4])
+async def test_sync_section_respects_concurrency_limit(sync_concurrency: int) -> None:
+    """Process every item using no more workers than configured."""
+    items = [SimpleNamespace(title=f"item-{i}") for i in range(10)]
+    bridge = _make_bridge(items, sync_concurrency)
+    sync_client = FakeSyncClient()
+    section = SimpleNamespace(title="Anime", type="show")
+
+    await bridge._sync_section(
+        cast(Any, section),
+        False,
+        cast(Any, sync_client),
+        cast(Any, sync_client),
+        section_index=1,
+        section_count=1,
+    )
+
+    assert sorted(sync_client.processed) == sorted(i.title for i in items)
+    assert sync_client.max_active == sync_concurrency
+    assert bridge.current_sync is not None
+    assert bridge.current_sync.section_items_processed == len(items)
+
+
+@pytest.mark.asyncio
+async def test_sync_section_continues_after_item_failure() -> None:
+    """A failing item must not stop the remaining workers."""
+    items = [SimpleNamespace(title=f"item-{i}") for i in range(6)]
+    bridge = _make_bridge(items, 3)
+    sync_client = FakeSyncClient(fail_titles={"item-2"})
+    section = SimpleNamespace(title="Anime", type="movie")
+
+    await bridge._sync_section(
+        cast(Any, section),
+        False,
+        cast(Any, sync_client),
+        cast(Any, sync_client),
+        section_index=1,
+        section_count=1,
+    )
+
+    assert "item-2" not in sync_client.processed
+    assert len(sync_client.processed) == 5
+    assert bridge.current_sync is not None
+    assert bridge.current_sync.section_items_processed == 5
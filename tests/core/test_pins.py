@@ -0,0 +1,29 @@
+"""Tests for the pin index."""
+
+from src.core.pins import PinIndex
+from src.models.db.pin import Pin
+
+
+def test_pins_are_loaded_once_and_updated_by_notifications(in_memory_db) -> None:
+    """Pins are read from the database once, then kept current by notifications."""
+    with in_memory_db as ctx:
+        ctx.session.add(Pin(profile_name="test", anilist_id=1, fields=["score"]))
+        ctx.session.commit()
+
+    index = PinIndex()
+    assert index.get("test", 1) == ["score"]
+
+    with in_memory_db as ctx:
+        ctx.session.add(Pin(profile_name="test", anilist_id=2, fields=["notes"]))
+        ctx.session.commit()
+    assert index.get("test", 2) == []
+
+    index.notify("test", 2, ["notes"])
+    index.notify("test", 1, None)
+    index.notify("other", 3, ["status"])
+    assert index.get("test", 1) == []
+    assert index.get("test", 2) == ["notes"]
+    assert index.get("other", 3) == []
+
+    index.load("test")
+    assert index.get("test", 2) == ["notes"]
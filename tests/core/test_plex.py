@@ -0,0 +1,309 @@
+"""Tests for the Plex client."""
+
+from types import SimpleNamespace
+from typing import Any, cast
+from xml.etree import ElementTree
+
+import pytest
+
+from src.core.plex import PlexClient
+from src.plex.executor import PlexExecutor
+
+
+class FakeShowSection:
+    """Show section stub serving seasons and episodes from memory."""
+
+    TYPE = "show"
+    title = "Anime"
+
+    def __init__(self, seasons: list[Any], episodes: list[Any]) -> None:
+        """Store the children returned by the section listing."""
+        self.seasons = seasons
+        self.episodes = episodes
+        self.search_calls: list[str] = []
+
+    def totalViewSize(self, libtype: str, includeCollections: bool = True) -> int:
+        """Return the number of children of the requested type."""
+        return len(self.seasons if libtype == "season" else self.episodes)
+
+    def search(self, libtype: str, **_: Any) -> list[Any]:
+        """Return every child of the requested type."""
+        self.search_calls.append(libtype)
+        return self.seasons if libtype == "season" else self.episodes
+
+
+class FakeShow:
+    """Show stub that counts per-show children requests."""
+
+    def __init__(self, rating_key: int) -> None:
+        """Initialize the show with a rating key."""
+        self.ratingKey = rating_key
+        self.calls = 0
+
+    def seasons(self) -> list[Any]:
+        """Record a per-show seasons request."""
+        self.calls += 1
+        return []
+
+    def episodes(self) -> list[Any]:
+        """Record a per-show episodes request."""
+        self.calls += 1
+        return []
+
+
+def _make_client() -> PlexClient:
+    client = cast(PlexClient, object.__new__(PlexClient))
+    client.executor = PlexExecutor("http://plex-test:32400")
+    client.is_online_user = False
+    client.user_account_id = 1
+    client.clear_show_children()
+    client.clear_history()
+    return client
+
+
+def _season(show: int, index: int) -> Any:
+    return SimpleNamespace(parentRatingKey=show, index=index)
+
+
+def _episode(show: int, season: int, index: int) -> Any:
+    return SimpleNamespace(grandparentRatingKey=show, parentIndex=season, index=index)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_show_children_groups_by_show() -> None:
+    """Children are indexed per show and served without per-show requests."""
+    shows = [FakeShow(1), FakeShow(2)]
+    section = FakeShowSection(
+        seasons=[_season(1, 2), _season(1, 1), _season(3, 1)],
+        episodes=[_episode(1, 2, 1), _episode(1, 1, 2), _episode(1, 1, 1)],
+    )
+    client = _make_client()
+
+    await client.prefetch_show_children(cast(Any, section), cast(Any, shows))
+
+    assert sorted(section.search_calls) == ["episode", "season"]
+    seasons = await client.get_seasons(cast(Any, shows[0]))
+    assert [s.index for s in seasons] == [1, 2]
+    episodes = await client.get_episodes(cast(Any, shows[0]))
+    assert [(e.parentIndex, e.index) for e in episodes] == [(1, 1), (1, 2), (2, 1)]
+    assert await client.get_seasons(cast(Any, shows[1])) == []
+    assert await client.get_episodes(cast(Any, shows[1])) == []
+    assert all(show.calls == 0 for show in shows)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_show_children_skips_when_more_expensive() -> None:
+    """Small polls fall back to fetching the children show by show."""
+    show = FakeShow(1)
+    section = FakeShowSection(
+        seasons=[_season(i, 1) for i in range(3000)],
+        episodes=[_episode(1, 1, 1)],
+    )
+    client = _make_client()
+
+    await client.prefetch_show_children(cast(Any, section), cast(Any, [show]))
+
+    assert section.search_calls == []
+    await client.get_seasons(cast(Any, show))
+    assert show.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_clear_show_children_discards_index() -> None:
+    """Clearing the index makes lookups hit the server again."""
+    show = FakeShow(1)
+    section = FakeShowSection(seasons=[_season(1, 1)], episodes=[])
+    client = _make_client()
+
+    await client.prefetch_show_children(cast(Any, section), cast(Any, [show]))
+    client.clear_show_children()
+    await client.get_episodes(cast(Any, show))
+
+    assert show.calls == 1
+
+
+class FakeAdminClient:
+    """Admin server stub serving a fixed account history."""
+
+    def __init__(self, entries: list[Any]) -> None:
+        """Store the history entries returned by the server."""
+        self.entries = entries
+        self.fetch_calls = 0
+
+    def query(self, key: str, params: dict[str, Any] | None = None) -> Any:
+        """Return an empty container reporting the history size."""
+        return ElementTree.Element(
+            "MediaContainer", attrib={"totalSize": str(len(self.entries))}
+        )
+
+    def fetchItems(self, key: str, **_: Any) -> list[Any]:
+        """Return every history entry."""
+        self.fetch_calls += 1
+        return self.entries
+
+
+@pytest.mark.asyncio
+async def test_prefetch_history_indexes_by_item_and_show() -> None:
+    """History is looked up by movie rating key and by grandparent show."""
+    entries = [
+        SimpleNamespace(ratingKey=11, grandparentRatingKey=1),
+        SimpleNamespace(ratingKey=12, grandparentRatingKey=1),
+        SimpleNamespace(ratingKey=2),
+        SimpleNamespace(ratingKey=99),
+    ]
+    client = _make_client()
+    admin = FakeAdminClient(entries)
+    client.admin_client = cast(Any, admin)
+    section = SimpleNamespace(key=5, title="Anime")
+    items = [SimpleNamespace(ratingKey=1), SimpleNamespace(ratingKey=2)]
+
+    await client.prefetch_history(cast(Any, section), cast(Any, items))
+
+    assert admin.fetch_calls == 1
+    assert client._history_index["1"] == entries[:2]
+    assert client._history_index["2"] == [entries[2]]
+    assert "99" not in client._history_index
+
+
+@pytest.mark.asyncio
+async def test_prefetch_history_skips_when_more_expensive() -> None:
+    """A single item is cheaper to look up than a long section history."""
+    client = _make_client()
+    admin = FakeAdminClient([SimpleNamespace(ratingKey=i) for i in range(1500)])
+    client.admin_client = cast(Any, admin)
+    section = SimpleNamespace(key=5, title="Anime")
+
+    await client.prefetch_history(
+        cast(Any, section), cast(Any, [SimpleNamespace(ratingKey=1)])
+    )
+
+    assert admin.fetch_calls == 0
+    assert client._history_index == {}
+
+
+@pytest.mark.asyncio
+async def test_get_continue_watching_uses_cached_section_index() -> None:
+    """Continue Watching entries are resolved through the cached section."""
+    episode = SimpleNamespace(type="episode", ratingKey=11, grandparentRatingKey=1)
+    other = SimpleNamespace(type="episode", ratingKey=12, grandparentRatingKey=1)
+    hub_calls = 0
+
+    def continue_watching() -> list[Any]:
+        nonlocal hub_calls
+        hub_calls += 1
+        return [episode, other]
+
+    class FakeSection:
+        key = 7
+
+        def continueWatching(self) -> list[Any]:
+            return continue_watching()
+
+    section = FakeSection()
+    client = _make_client()
+    client._sections = {7: cast(Any, section)}
+
+    def section_lookup() -> Any:
+        raise AssertionError("section should be served from the cache")
+
+    show = SimpleNamespace(
+        ratingKey=1, librarySectionID=7, type="show", section=section_lookup
+    )
+    unrelated = SimpleNamespace(
+        ratingKey=2, librarySectionID=7, type="show", section=section_lookup
+    )
+
+    assert await client.get_continue_watching(cast(Any, show)) is episode
+    assert await client.get_continue_watching(cast(Any, unrelated)) is None
+    assert hub_calls == 1
+
+
+class FakeAccount:
+    """Plex account stub with a fixed watchlist."""
+
+    def __init__(self, guids: list[str]) -> None:
+        """Store the GUIDs on the watchlist."""
+        self.guids = guids
+        self.calls = 0
+
+    def watchlist(self) -> list[Any]:
+        """Return the watchlist items."""
+        self.calls += 1
+        return [SimpleNamespace(guid=guid) for guid in self.guids]
+
+
+@pytest.mark.asyncio
+async def test_watchlist_snapshot_is_reused_within_ttl() -> None:
+    """Watchlist lookups are served from a snapshot refreshed after the TTL."""
+    account = FakeAccount(["plex://movie/a"])
+    client = _make_client()
+    client.is_admin_user = True
+    client.plex_watchlist_ttl = 300
+    client._watchlist_guids = None
+    client._watchlist_fetched_at = 0.0
+    client.admin_client = cast(Any, SimpleNamespace(myPlexAccount=lambda: account))
+
+    await client.prefetch_watchlist()
+    await client.prefetch_watchlist()
+
+    def on_watchlist() -> bool:
+        raise AssertionError("watchlist should be served from the snapshot")
+
+    watched = SimpleNamespace(guid="plex://movie/a", onWatchlist=on_watchlist)
+    other = SimpleNamespace(guid="plex://movie/b", onWatchlist=on_watchlist)
+    assert await client.is_on_watchlist(cast(Any, watched)) is True
+    assert await client.is_on_watchlist(cast(Any, other)) is False
+    assert account.calls == 1
+
+    client.plex_watchlist_ttl = 0
+    await client.prefetch_watchlist()
+    assert account.calls == 2
+
+
+class FakeCommunityClient:
+    """Community client stub serving reviews keyed by GUID rating key."""
+
+    def __init__(self, reviews: dict[str, str]) -> None:
+        """Store the reviews and record the requested keys."""
+        self.reviews = reviews
+        self.requested: list[list[str]] = []
+
+    async def batch_get_reviews(self, keys: list[str]) -> dict[str, str]:
+        """Return the reviews of the requested keys."""
+        self.requested.append(keys)
+        return {k: self.reviews[k] for k in keys if k in self.reviews}
+
+    async def get_reviews(self, key: str) -> str | None:
+        """Single review lookups must be served from the prefetched index."""
+        raise AssertionError("review should be served from the prefetched index")
+
+
+class FakeReviewable:
+    """Hashable item stub, as review lookups are cached by item."""
+
+    def __init__(self, rating_key: int, guid: str) -> None:
+        """Store the identifiers of the item."""
+        self.ratingKey = rating_key
+        self.guid = guid
+        self.type = "show"
+        self.title = guid
+
+
+@pytest.mark.asyncio
+async def test_prefetch_reviews_indexes_reviews_of_items_and_seasons() -> None:
+    """Reviews of a list of items and their seasons are fetched in one batch."""
+    community = FakeCommunityClient({"a": "great", "s1": "good season"})
+    client = _make_client()
+    client.is_admin_user = True
+    client.community_client = cast(Any, community)
+    client.clear_reviews()
+
+    show = FakeReviewable(1, "plex://show/a")
+    season = FakeReviewable(2, "plex://season/s1")
+    client._season_index = {"1": [cast(Any, season)]}
+
+    await client.prefetch_reviews([cast(Any, show)])
+
+    assert community.requested == [["a", "s1"]]
+    assert await client.get_user_review(cast(Any, show)) == "great"
+    assert await client.get_user_review(cast(Any, season)) == "good season"
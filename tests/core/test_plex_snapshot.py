@@ -0,0 +1,169 @@
+"""Tests for the Plex snapshot store."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, ClassVar, cast
+
+import pytest
+
+from src.core.plex_snapshot import PlexSnapshotStore
+
+pytestmark = pytest.mark.usefixtures("in_memory_db")
+
+
+def _movie(rating_key: int, view_count: int = 0) -> SimpleNamespace:
+    added_at = datetime(2024, 1, 1)
+    return SimpleNamespace(
+        ratingKey=rating_key,
+        type="movie",
+        title=f"Movie {rating_key}",
+        guid=f"plex://movie/{rating_key}",
+        guids=[SimpleNamespace(id=f"tmdb://{rating_key}")],
+        viewCount=view_count,
+        userRating=None,
+        addedAt=added_at,
+        updatedAt=added_at,
+        lastViewedAt=added_at if view_count else None,
+        lastRatedAt=None,
+    )
+
+
+class FakePlexClient:
+    """Plex client stub serving a section from a dictionary of items."""
+
+    plex_genres: ClassVar[list[str]] = []
+    is_online_user = False
+
+    def __init__(self, items: list[SimpleNamespace]) -> None:
+        """Store the items of the section and record the calls made."""
+        self.items = {str(item.ratingKey): item for item in items}
+        self.changed: list[str] = []
+        self.watched: set[str] = set()
+        self.searches: list[datetime | None] = []
+        self.fetched: list[str] = []
+
+    async def get_section_items(
+        self,
+        section: Any,
+        min_last_modified: datetime | None = None,
+        require_watched: bool = False,
+        rating_keys: list[str] | None = None,
+    ) -> list[SimpleNamespace]:
+        """Return every item, or only the changed or watched ones when filtering."""
+        items = list(self.items.values())
+        if rating_keys:
+            items = [item for item in items if str(item.ratingKey) in rating_keys]
+        if require_watched:
+            items = [item for item in items if str(item.ratingKey) in self.watched]
+        else:
+            self.searches.append(min_last_modified)
+        if min_last_modified is None:
+            return items
+        return [item for item in items if str(item.ratingKey) in self.changed]
+
+    async def fetch_items(self, rating_keys: list[str]) -> list[SimpleNamespace]:
+        """Return the requested items that still exist."""
+        self.fetched.extend(rating_keys)
+        return [self.items[rk] for rk in rating_keys if rk in self.items]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_refreshes_incrementally() -> None:
+    """Only changed items are read from the section after the first refresh."""
+    plex = FakePlexClient([_movie(1, view_count=1), _movie(2), _movie(3, 2)])
+    store = PlexSnapshotStore(cast(Any, plex), "test")
+    section = SimpleNamespace(key=1, title="Movies", type="movie")
+
+    first = await store.get_items(cast(Any, section), require_watched=True)
+    assert [item.ratingKey for item in first] == [1, 3]
+    assert plex.fetched == []
+
+    started = datetime.now(UTC)
+    plex.changed = ["2"]
+    plex.items["2"].viewCount = 1
+    del plex.items["3"]
+
+    second = await store.get_items(cast(Any, section), require_watched=True)
+
+    assert plex.searches[0] is None
+    assert plex.searches[1] is not None
+    assert plex.searches[1] > started - timedelta(minutes=1)
+    assert [item.ratingKey for item in second] == [1, 2]
+    assert plex.fetched == ["1", "3"]
+    assert [row.rating_key for row in store.select(cast(Any, section))] == ["1", "2"]
+
+    polled = await store.get_items(cast(Any, section), min_last_modified=started)
+    assert [item.ratingKey for item in polled] == [2]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reads_watched_shows_from_the_server() -> None:
+    """Shows with only watched or rated episodes are selected as watched."""
+    show = _movie(1)
+    show.type = "show"
+    show.viewedLeafCount = 0
+    plex = FakePlexClient([show, _movie(2)])
+    plex.items["2"].type = "show"
+    plex.items["2"].viewedLeafCount = 0
+    plex.watched = {"1"}
+    store = PlexSnapshotStore(cast(Any, plex), "test")
+    section = SimpleNamespace(key=1, title="Shows", type="show")
+
+    items = await store.get_items(cast(Any, section), require_watched=True)
+    assert [item.ratingKey for item in items] == [1]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_leaves_out_unchanged_items() -> None:
+    """Items reported as unchanged are not fetched from the server."""
+    plex = FakePlexClient([_movie(1, view_count=1), _movie(2, view_count=1)])
+    store = PlexSnapshotStore(cast(Any, plex), "test")
+    section = SimpleNamespace(key=1, title="Movies", type="movie")
+    await store.refresh(cast(Any, section))
+
+    items = await store.get_items(
+        cast(Any, section), unchanged=lambda row: row.rating_key == "1"
+    )
+    assert [item.ratingKey for item in items] == [2]
+    assert plex.fetched == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_rebuilt_with_a_single_search() -> None:
+    """Rebuilds read the section once and keep the cursor of the last refresh."""
+    show = _movie(1)
+    show.type = "show"
+    show.viewedLeafCount = 0
+    plex = FakePlexClient([show])
+    plex.watched = {"1"}
+    store = PlexSnapshotStore(cast(Any, plex), "test")
+    section = SimpleNamespace(key=1, title="Shows", type="show")
+    await store.refresh(cast(Any, section))
+    cursor = store._get_state(cast(Any, section))["cursor"]
+
+    store.FULL_REFRESH_INTERVAL = timedelta(0)
+    plex.searches.clear()
+    plex.watched.clear()
+    await store.refresh(cast(Any, section))
+
+    assert plex.searches == [None]
+    assert store._get_state(cast(Any, section))["cursor"] == cursor
+    assert store.select(cast(Any, section), require_watched=True)
+
+
+@pytest.mark.asyncio
+async def test_online_sections_are_searched_directly() -> None:
+    """Items of online users are not fetched from the snapshot by rating key."""
+    item = _movie(1, view_count=1)
+    item.ratingKey = "5d776b59ad5437001f79c6f8"
+    plex = FakePlexClient([item, _movie(2)])
+    plex.is_online_user = True
+    store = PlexSnapshotStore(cast(Any, plex), "test")
+    section = SimpleNamespace(key=1, title="Movies", type="movie")
+
+    items = await store.get_items(
+        cast(Any, section), rating_keys=["5d776b59ad5437001f79c6f8"]
+    )
+    assert items == [item]
+    assert plex.fetched == []
+    assert store.select(cast(Any, section)) == []
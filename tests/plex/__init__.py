@@ -0,0 +1 @@
+"""Plex test utilities for PlexAniBridge."""
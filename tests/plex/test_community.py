@@ -0,0 +1,62 @@
+"""Tests for the Plex Community client."""
+
+from typing import Any
+
+import pytest
+
+from src.plex.community import PlexCommunityClient
+
+
+@pytest.mark.asyncio
+async def test_batch_get_reviews_aliases_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reviews for several metadata IDs are fetched in one aliased request."""
+    client = PlexCommunityClient("token")
+    calls: list[dict[str, Any]] = []
+
+    async def fake_request(
+        query: str, variables: dict[str, Any], operation_name: str
+    ) -> dict:
+        calls.append(variables)
+        assert operation_name == "BatchGetReviews"
+        return {"data": {"r0": {"message": "great"}, "r1": None}}
+
+    monkeypatch.setattr(client, "_make_request", fake_request)
+
+    reviews = await client.batch_get_reviews(["a", "b", "a"])
+
+    assert reviews == {"a": "great", "b": None}
+    assert calls == [{"m0": "a", "m1": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_watch_activity_follows_cursors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only feeds with more pages are requested again, using their own cursor."""
+    client = PlexCommunityClient("token")
+    calls: list[dict[str, Any]] = []
+
+    def page(nodes: list[str], cursor: str | None) -> dict:
+        return {
+            "nodes": [{"id": n} for n in nodes],
+            "pageInfo": {"endCursor": cursor, "hasNextPage": cursor is not None},
+        }
+
+    async def fake_request(
+        query: str, variables: dict[str, Any], operation_name: str
+    ) -> dict:
+        calls.append(variables)
+        if len(calls) == 1:
+            return {"data": {"f0": page(["a1"], "next"), "f1": page(["b1"], None)}}
+        return {"data": {"f0": page(["a2"], None)}}
+
+    monkeypatch.setattr(client, "_make_request", fake_request)
+
+    activity = await client.batch_get_watch_activity(["a", "b"])
+
+    assert activity == {"a": [{"id": "a1"}, {"id": "a2"}], "b": [{"id": "b1"}]}
+    assert calls[1] == {
+        "first": PlexCommunityClient.WATCH_ACTIVITY_PAGE_SIZE,
+        "m0": "a",
+        "a0": "next",
+    }
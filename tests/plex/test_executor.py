@@ -0,0 +1,60 @@
+"""Tests for the Plex executor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.plex.executor import PlexExecutor
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_from_worker_thread() -> None:
+    """Blocking calls run off the event loop thread and return their result."""
+    executor = PlexExecutor("http://plex-result:32400")
+    loop_thread = threading.get_ident()
+
+    def work(a: int, b: int = 0) -> tuple[int, int]:
+        return a + b, threading.get_ident()
+
+    result, thread_id = await executor.run(work, 1, b=2)
+
+    assert result == 3
+    assert thread_id != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_run_caps_concurrency_per_server() -> None:
+    """Executors for the same server share a single concurrency limit."""
+    executors = [
+        PlexExecutor("http://plex-cap:32400", max_concurrency=2) for _ in range(2)
+    ]
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def work() -> None:
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    await asyncio.gather(*(executors[i % 2].run(work) for i in range(8)))
+
+    assert max_active == 2
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_exceptions() -> None:
+    """Exceptions raised by the callable surface to the awaiting coroutine."""
+    executor = PlexExecutor("http://plex-error:32400")
+
+    def work() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await executor.run(work)
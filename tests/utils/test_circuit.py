@@ -0,0 +1,56 @@
+"""Tests for the circuit breaker."""
+
+import time
+
+from src.utils.circuit import CircuitBreaker, CircuitState
+
+
+def test_opens_after_consecutive_failures() -> None:
+    """Only consecutive failures count towards opening the breaker."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.is_open
+    assert not breaker.allow_request()
+    status = breaker.status()
+    assert status["state"] == "open"
+    assert status["consecutive_failures"] == 3
+    assert status["retry_at"] is not None
+
+
+def test_probe_closes_or_reopens_breaker() -> None:
+    """A single probe is let through once the cool-down elapses."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert not breaker.is_open
+    assert breaker.allow_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow_request()  # The probe is still in flight
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker._cooldown == 0.1  # Backs off after a failed probe
+
+    time.sleep(0.11)
+    assert breaker.allow_request()
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.status() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "opened_at": None,
+        "retry_at": None,
+    }
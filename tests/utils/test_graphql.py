@@ -0,0 +1,62 @@
+"""Tests for GraphQL query utilities."""
+
+from src.utils.graphql import (
+    GraphQLDocument,
+    estimate_complexity,
+    pack_by_complexity,
+)
+
+
+def test_estimate_complexity_counts_selected_fields() -> None:
+    """Count every selected field, ignoring aliases, arguments and spreads."""
+    selection = """
+        m0: SaveMediaListEntry(mediaId: $id, notes: "a (b) c") {
+            id
+            startedAt { year month day }
+            ...extraFields
+        }
+    """
+
+    assert estimate_complexity(selection) == 6
+
+
+def test_pack_by_complexity_respects_budget_and_item_limit() -> None:
+    """Fill batches up to the budget without exceeding the item limit."""
+    costs = {"a": 3, "b": 3, "c": 5, "d": 1, "e": 1, "f": 1}
+
+    assert pack_by_complexity(list(costs), costs.__getitem__, 7) == [
+        ["a", "b"],
+        ["c", "d", "e"],
+        ["f"],
+    ]
+    assert pack_by_complexity(list(costs), costs.__getitem__, 7, max_items=2) == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e", "f"],
+    ]
+
+
+def test_pack_by_complexity_isolates_oversized_items() -> None:
+    """Place items over the budget in their own batch."""
+    assert pack_by_complexity([1, 10, 1], lambda x: x, 5, base_complexity=1) == [
+        [1],
+        [10],
+        [1],
+    ]
+
+
+def test_graphql_document_compacts_whitespace_outside_strings() -> None:
+    """Collapse whitespace between tokens but keep string literals intact."""
+    document = GraphQLDocument.build(
+        """
+        query {
+            Page(search: "two  spaces") {
+                id
+            }
+        }
+        """
+    )
+
+    assert document.query == 'query { Page(search: "two  spaces") { id } }'
+    assert document == GraphQLDocument.build(document.query)
+    assert len(document.sha256) == 64
@@ -0,0 +1,69 @@
+"""Tests for the adaptive rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.ratelimit import AdaptiveRateLimiter, RequestPriority
+
+
+def test_update_adopts_advertised_limit() -> None:
+    """The rate follows X-RateLimit-Limit and tokens never exceed the remainder."""
+    limiter = AdaptiveRateLimiter(rate=30 / 60, capacity=3)
+
+    limiter.update({"X-RateLimit-Limit": "90", "X-RateLimit-Remaining": "1"})
+
+    assert limiter.rate == 90 / 60
+    assert limiter._tokens <= 1
+
+
+@pytest.mark.asyncio
+async def test_block_pauses_requests() -> None:
+    """Retry-After pauses every caller until the server is ready."""
+    limiter = AdaptiveRateLimiter(rate=100, capacity=3)
+    limiter.block(0.1)
+
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_acquire_serves_higher_priority_first() -> None:
+    """Waiting interactive requests go before queued sync reads."""
+    limiter = AdaptiveRateLimiter(rate=50, capacity=1)
+    await limiter.acquire()  # Drain the bucket
+    order: list[str] = []
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+
+    reads = [
+        asyncio.create_task(request(f"read-{i}", RequestPriority.SYNC_READ))
+        for i in range(2)
+    ]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(
+        request("interactive", RequestPriority.INTERACTIVE)
+    )
+    await asyncio.gather(*reads, interactive)
+
+    assert order == ["interactive", "read-0", "read-1"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed() -> None:
+    """Cancelling a waiting request does not block the ones behind it."""
+    limiter = AdaptiveRateLimiter(rate=20, capacity=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire(RequestPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
@@ -83,3 +83,45 @@ def test_selective_verify_session_logs_error_on_failure(monkeypatch):
         session.request("GET", "https://fail.com/endpoint")
 
     assert errors and "fail.com" in errors[0]
+
+
+def test_selective_verify_session_sizes_connection_pools():
+    """Test that SelectiveVerifySession sizes its pools to the requested size."""
+    session = SelectiveVerifySession(pool_maxsize=4)
+
+    adapter = session.get_adapter("https://example.com")
+
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_connections == 4
+
+
+@pytest.mark.asyncio
+async def test_client_sessions_share_connection_pool():
+    """Test that client sessions share one pool that outlives them."""
+    first = requests_module.create_client_session({"X-Test": "1"})
+    second = requests_module.create_client_session()
+    connector = second.connector
+    try:
+        assert first.connector is connector
+        assert first.headers["X-Test"] == "1"
+        assert "PlexAniBridge/" in second.headers["User-Agent"]
+
+        await first.close()
+        assert connector is not None and not connector.closed
+    finally:
+        await second.close()
+        await requests_module.close_http_transport()
+
+    assert connector.closed
+
+
+@pytest.mark.asyncio
+async def test_client_sessions_do_not_limit_total_request_time():
+    """Test that sessions only time out stalled connections and reads."""
+    session = requests_module.create_client_session()
+    try:
+        assert session.timeout.total is None
+        assert session.timeout.sock_connect and session.timeout.sock_read
+    finally:
+        await session.close()
+        await requests_module.close_http_transport()